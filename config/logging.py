@@ -1,6 +1,7 @@
 """Structured logging configuration for PULSAR SENTINEL."""
 
 import sys
+import time
 import logging
 from pathlib import Path
 from typing import Any
@@ -72,6 +73,45 @@ class SecurityEventLogger:
         """
         self._logger = get_logger(f"security.{component}")
         self._component = component
+        # Standard logger of the same name; its effective level is read per
+        # call, so setup_logging() and later level changes are honoured
+        self._stdlib_logger = logging.getLogger(f"security.{component}")
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether records at a logging level would be emitted.
+
+        Lets callers skip building event strings and metadata that the
+        current logging level would filter out.
+
+        Args:
+            level: Standard logging level (e.g. logging.INFO)
+
+        Returns:
+            True if records at this level are emitted
+        """
+        return self._stdlib_logger.isEnabledFor(level)
+
+    def start_timer(self) -> float | None:
+        """Start timing a crypto operation.
+
+        Returns:
+            A perf_counter start mark, or None if timings are not logged
+        """
+        return time.perf_counter() if self.is_enabled_for(logging.INFO) else None
+
+    @staticmethod
+    def elapsed_ms(start: float | None) -> float | None:
+        """Get milliseconds elapsed since a start_timer() mark.
+
+        Args:
+            start: Value returned by start_timer()
+
+        Returns:
+            Elapsed milliseconds, or None if timing was skipped
+        """
+        if start is None:
+            return None
+        return (time.perf_counter() - start) * 1000
 
     def log_event(
         self,
@@ -88,6 +128,9 @@ class SecurityEventLogger:
             agent_id: Optional agent/user identifier
             metadata: Additional event metadata
         """
+        if not self.is_enabled_for(logging.INFO):
+            return  # Security events are emitted at INFO
+
         self._logger.info(
             event,
             component=self._component,
@@ -111,6 +154,9 @@ class SecurityEventLogger:
             success: Whether operation succeeded
             duration_ms: Operation duration in milliseconds
         """
+        if not self.is_enabled_for(logging.INFO):
+            return  # Skip building the record; it would be filtered anyway
+
         self._logger.info(
             f"crypto_{operation}",
             operation=operation,
@@ -21,8 +21,9 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/thebardchat/pulsar_sentinel",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    # config/ lives at the project root, alongside the src/ packages
+    packages=find_packages(where="src") + ["config"],
+    package_dir={"": "src", "config": "config"},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -43,6 +44,7 @@ setup(
             "pytest>=7.4.0",
             "pytest-asyncio>=0.23.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
         ],
     },
     entry_points={
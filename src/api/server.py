@@ -109,6 +109,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down PULSAR SENTINEL server")
+    asr_engine.close()
 
 
 def create_app() -> FastAPI:
@@ -16,7 +16,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Final
+from typing import Final, Self
 
 from core.asr_engine import AgentStateRecord, ASRBatch, ASREngine
 from blockchain.polygon_client import PolygonClient, TransactionResult
@@ -118,6 +118,7 @@ class BlockchainEventLogger:
         >>> event_logger = BlockchainEventLogger(contract)
         >>> event_logger.log_asr(asr_record)
         >>> event_logger.flush()  # Force submit pending batch
+        >>> event_logger.close()  # Release the ASR database on shutdown
     """
 
     def __init__(
@@ -126,6 +127,7 @@ class BlockchainEventLogger:
         client: PolygonClient | None = None,
         max_batch_size: int = MAX_BATCH_SIZE,
         batch_timeout: int = BATCH_TIMEOUT_SECONDS,
+        asr_engine: ASREngine | None = None,
     ) -> None:
         """Initialize blockchain event logger.
 
@@ -134,6 +136,7 @@ class BlockchainEventLogger:
             client: PolygonClient instance (creates contract if not provided)
             max_batch_size: Maximum ASRs per batch
             batch_timeout: Seconds before auto-flush
+            asr_engine: Shared ASREngine (creates and owns one if not provided)
         """
         settings = get_settings()
 
@@ -150,12 +153,24 @@ class BlockchainEventLogger:
         self._cache_dir = Path(settings.asr_storage_path) / "blockchain_cache"
         self._cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # ASR engine for Merkle operations
-        self._asr_engine = ASREngine()
+        # ASR engine for Merkle operations; only one created here is closed here
+        self._owns_asr_engine = asr_engine is None
+        self._asr_engine = asr_engine if asr_engine is not None else ASREngine()
 
         # Blockchain logging enabled?
         self._enabled = settings.asr_blockchain_enabled
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the ASR engine if this logger created it."""
+        if self._owns_asr_engine:
+            self._asr_engine.close()
+
     @property
     def is_enabled(self) -> bool:
         """Check if blockchain logging is enabled."""
@@ -493,12 +508,15 @@ class EventLoggerFactory:
     def create(
         client: PolygonClient | None = None,
         contract_address: str | None = None,
+        asr_engine: ASREngine | None = None,
     ) -> BlockchainEventLogger:
         """Create a configured event logger.
 
         Args:
             client: Optional PolygonClient (creates new if not provided)
             contract_address: Optional contract address
+            asr_engine: Optional shared ASREngine (the logger owns a new
+                one if not provided; release it with close())
 
         Returns:
             Configured BlockchainEventLogger
@@ -511,12 +529,14 @@ class EventLoggerFactory:
                 client.connect()
             except ConnectionError:
                 # Return logger with blockchain disabled
-                return BlockchainEventLogger()
+                return BlockchainEventLogger(asr_engine=asr_engine)
 
         address = contract_address or settings.governance_contract_address
         if not address:
             # Return logger with blockchain disabled
-            return BlockchainEventLogger()
+            return BlockchainEventLogger(asr_engine=asr_engine)
 
         contract = GovernanceContract(client, address)
-        return BlockchainEventLogger(contract=contract, client=client)
+        return BlockchainEventLogger(
+            contract=contract, client=client, asr_engine=asr_engine
+        )
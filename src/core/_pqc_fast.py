@@ -0,0 +1,112 @@
+"""Direct liboqs binding for the ML-KEM decapsulation hot path.
+
+liboqs-python calls liboqs through ctypes and builds argument buffers on
+every call. When cffi is installed this module opens the same shared
+library that ``oqs`` already loaded and calls ``OQS_KEM_decaps`` through
+cffi in ABI mode, with one KEM handle shared by every secret key.
+
+``FAST_DECAPS_AVAILABLE`` is False when cffi, liboqs-python or the shared
+library is missing; callers then fall back to ``oqs.KeyEncapsulation``.
+"""
+
+from typing import Final
+
+# Only the leading, version-stable fields of OQS_KEM are declared; the
+# struct is never allocated or sized from Python, only read through the
+# pointer OQS_KEM_new returns.
+_CDEF: Final[str] = """
+    typedef struct {
+        const char *method_name;
+        const char *alg_version;
+        uint8_t claimed_nist_level;
+        bool ind_cca;
+        size_t length_public_key;
+        size_t length_secret_key;
+        size_t length_ciphertext;
+        size_t length_shared_secret;
+    } OQS_KEM;
+
+    OQS_KEM *OQS_KEM_new(const char *method_name);
+    void OQS_KEM_free(OQS_KEM *kem);
+    int OQS_KEM_decaps(const OQS_KEM *kem, uint8_t *shared_secret,
+                       const uint8_t *ciphertext, const uint8_t *secret_key);
+"""
+
+OQS_SUCCESS: Final[int] = 0
+
+try:
+    import cffi
+    import oqs
+
+    _ffi = cffi.FFI()
+    _ffi.cdef(_CDEF)
+    _lib = _ffi.dlopen(oqs.native()._name)
+    FAST_DECAPS_AVAILABLE = True
+except (ImportError, OSError, AttributeError):  # cffi/oqs missing, or liboqs failed to load
+    _ffi = None
+    _lib = None
+    FAST_DECAPS_AVAILABLE = False
+
+
+class FastDecapsulator:
+    """ML-KEM decapsulation through a single cffi-held liboqs KEM handle.
+
+    Unlike ``oqs.KeyEncapsulation`` the secret key is passed per call, so
+    one instance serves every key of the same algorithm.
+    """
+
+    __slots__ = ("_ciphertext_len", "_kem", "_secret_key_len", "_shared_secret_len")
+
+    def __init__(self, liboqs_name: str) -> None:
+        """Create a KEM handle.
+
+        Args:
+            liboqs_name: liboqs algorithm name (e.g. "Kyber768")
+
+        Raises:
+            RuntimeError: If the fast path is unavailable
+            ValueError: If liboqs does not enable the algorithm
+        """
+        if not FAST_DECAPS_AVAILABLE:
+            raise RuntimeError("cffi liboqs binding is not available")
+
+        kem = _lib.OQS_KEM_new(liboqs_name.encode())
+        if kem == _ffi.NULL:
+            raise ValueError(f"KEM algorithm not enabled in liboqs: {liboqs_name}")
+
+        self._kem = _ffi.gc(kem, _lib.OQS_KEM_free)
+        self._ciphertext_len = kem.length_ciphertext
+        self._secret_key_len = kem.length_secret_key
+        self._shared_secret_len = kem.length_shared_secret
+
+    def decapsulate(self, ciphertext: bytes, secret_key: bytes) -> bytes:
+        """Decapsulate a shared secret.
+
+        Args:
+            ciphertext: The encapsulated ciphertext
+            secret_key: The recipient's secret decapsulation key
+
+        Returns:
+            The decapsulated shared secret
+
+        Raises:
+            ValueError: If an input has the wrong length
+            RuntimeError: If liboqs reports a failure
+        """
+        # liboqs reads fixed-size buffers; never hand it a short one
+        if len(ciphertext) != self._ciphertext_len:
+            raise ValueError("Invalid ciphertext length")
+        if len(secret_key) != self._secret_key_len:
+            raise ValueError("Invalid secret key length")
+
+        shared_secret = _ffi.new("uint8_t[]", self._shared_secret_len)
+        status = _lib.OQS_KEM_decaps(
+            self._kem,
+            shared_secret,
+            _ffi.from_buffer("uint8_t[]", ciphertext),
+            _ffi.from_buffer("uint8_t[]", secret_key),
+        )
+        if status != OQS_SUCCESS:
+            raise RuntimeError("liboqs decapsulation failed")
+
+        return _ffi.buffer(shared_secret)[:]
@@ -19,11 +19,15 @@ ASR Structure:
 import json
 import hashlib
 import os
+import sqlite3
+import threading
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Final, Self
 import secrets
 
 from config.constants import (
@@ -37,11 +41,77 @@ from config.logging import SecurityEventLogger
 # Constants
 ASR_VERSION: Final[str] = "1.0"
 HASH_ALGORITHM: Final[str] = "sha256"
+ASR_DB_NAME: Final[str] = "asr.db"
+
+# One row per record; the full record is kept as its JSON serialization and
+# the filter columns are indexed so per-agent listings need no full scan
+_ASR_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS asr (
+    asr_id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    threat_level INTEGER NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS asr_agent_date ON asr (agent_id, date, threat_level);
+"""
 
 logger = SecurityEventLogger("asr")
 
+# Canonical JSON (sorted keys) for signing and storage. Reusing one encoder
+# avoids json.dumps building a new one per call; output is identical.
+_CANONICAL_JSON: Final = json.JSONEncoder(sort_keys=True, default=str)
 
-@dataclass
+_VALID_PQC_STATUS: Final[frozenset[str]] = frozenset(s.value for s in PQCStatus)
+
+# Size in bytes of a Merkle tree node (a SHA-256 digest)
+_NODE_SIZE: Final[int] = 32
+
+
+def _leaf_level(records: list["AgentStateRecord"]) -> bytes:
+    """Pack the records' signature hashes into one contiguous buffer.
+
+    Raises:
+        ValueError: If a signature is not a SHA-256 hex digest; one of the
+            wrong length would shift every later leaf in the buffer
+    """
+    for record in records:
+        if len(record.signature) != 2 * _NODE_SIZE:
+            raise ValueError(f"Invalid ASR signature length: {record.asr_id}")
+    return bytes.fromhex("".join(r.signature for r in records))
+
+
+def _decode_node(hex_digest: str) -> bytes:
+    """Decode one hex-encoded Merkle node.
+
+    Raises:
+        ValueError: If the value is not hex or not a SHA-256 digest
+    """
+    node = bytes.fromhex(hex_digest)
+    if len(node) != _NODE_SIZE:
+        raise ValueError("Invalid Merkle node length")
+    return node
+
+
+def _parent_level(level: bytes) -> bytes:
+    """Hash each adjacent pair of nodes in a packed tree level.
+
+    The last node is paired with itself when the level has an odd count.
+    Pairs are hashed straight from a memoryview, so no per-pair byte
+    strings are built.
+    """
+    if len(level) // _NODE_SIZE % 2 == 1:
+        level += level[-_NODE_SIZE:]  # Duplicate last if odd
+
+    view = memoryview(level)
+    sha256 = hashlib.sha256
+    return b"".join(
+        sha256(view[i:i + 2 * _NODE_SIZE]).digest()
+        for i in range(0, len(level), 2 * _NODE_SIZE)
+    )
+
+
+@dataclass(slots=True)
 class AgentStateRecord:
     """Immutable Agent State Record for security event logging.
 
@@ -71,8 +141,7 @@ class AgentStateRecord:
         if not 1 <= self.threat_level <= 5:
             raise ValueError(f"Threat level must be 1-5, got {self.threat_level}")
 
-        valid_status = {s.value for s in PQCStatus}
-        if self.pqc_status not in valid_status:
+        if self.pqc_status not in _VALID_PQC_STATUS:
             raise ValueError(f"Invalid PQC status: {self.pqc_status}")
 
     def to_dict(self) -> dict[str, Any]:
@@ -81,7 +150,18 @@ class AgentStateRecord:
 
     def to_json(self) -> str:
         """Serialize ASR to JSON string."""
-        return json.dumps(self.to_dict(), sort_keys=True, default=str)
+        # Shallow field dict; asdict()'s deep copy is not needed to encode
+        return _CANONICAL_JSON.encode({
+            "asr_id": self.asr_id,
+            "timestamp": self.timestamp,
+            "agent_id": self.agent_id,
+            "action": self.action,
+            "threat_level": self.threat_level,
+            "pqc_status": self.pqc_status,
+            "signature": self.signature,
+            "metadata": self.metadata,
+            "version": self.version,
+        })
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AgentStateRecord":
@@ -114,7 +194,7 @@ class AgentStateRecord:
             "metadata": self.metadata,
             "version": self.version,
         }
-        canonical = json.dumps(data, sort_keys=True, default=str)
+        canonical = _CANONICAL_JSON.encode(data)
         return hashlib.sha256(canonical.encode()).hexdigest()
 
 
@@ -141,6 +221,22 @@ class ASRBatch:
         return len(self.records)
 
 
+@dataclass
+class MerkleMultiProof:
+    """Merkle proof covering several records of one batch at once.
+
+    Attributes:
+        leaf_count: Number of records in the batch
+        leaf_indices: Batch positions of the proven records, in the order
+            they were requested
+        hashes: Sibling hashes (hex) the proven leaves cannot rebuild
+            themselves, bottom level first and left to right within a level
+    """
+    leaf_count: int
+    leaf_indices: list[int]
+    hashes: list[str]
+
+
 class ASREngine:
     """Engine for generating and managing Agent State Records.
 
@@ -178,11 +274,36 @@ class ASREngine:
         # Ensure storage directory exists
         self._storage_path.mkdir(parents=True, exist_ok=True)
 
+        # Records live in a SQLite database in the storage directory. WAL
+        # with synchronous=NORMAL syncs at checkpoints rather than on every
+        # commit; the connection is shared across threads under a lock.
+        self._db_path = self._storage_path / ASR_DB_NAME
+        new_db = not self._db_path.exists()
+        self._db = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_ASR_SCHEMA)
+        self._db_lock = threading.Lock()
+
+        if new_db:
+            self._import_json_records()
+
     @property
     def storage_path(self) -> Path:
         """Get the ASR storage path."""
         return self._storage_path
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the ASR database connection."""
+        with self._db_lock:
+            self._db.close()
+
     def create_asr(
         self,
         agent_id: str,
@@ -241,29 +362,72 @@ class ASREngine:
 
         return asr
 
-    def store_asr(self, asr: AgentStateRecord) -> Path:
+    def store_asr(self, asr: AgentStateRecord) -> str:
         """Store ASR record to local storage.
 
+        Records are rows in the engine's SQLite database rather than one
+        JSON file each, so there is no per-record path to return.
+
         Args:
             asr: The ASR record to store
 
         Returns:
-            Path to the stored file
+            ID of the stored record, for load_asr()
         """
-        # Verify signature before storing
-        if not asr.verify_signature():
-            raise ValueError("ASR signature verification failed")
+        self.store_asrs([asr])
+        return asr.asr_id
 
-        # Create date-based subdirectory
-        date_str = asr.timestamp[:10]  # YYYY-MM-DD
-        date_dir = self._storage_path / date_str
-        date_dir.mkdir(parents=True, exist_ok=True)
+    def store_asrs(self, records: list[AgentStateRecord]) -> int:
+        """Store several ASR records in a single transaction.
 
-        # Write to file
-        file_path = date_dir / f"{asr.asr_id}.json"
-        file_path.write_text(asr.to_json())
+        Every signature is verified before anything is written, so a bad
+        record leaves the whole batch unstored.
 
-        return file_path
+        Args:
+            records: The ASR records to store
+
+        Returns:
+            Number of records stored
+        """
+        # Verify signatures before storing
+        for asr in records:
+            if not asr.verify_signature():
+                raise ValueError("ASR signature verification failed")
+
+        self._insert_rows(
+            (asr.asr_id, asr.timestamp[:10], asr.agent_id, asr.threat_level, asr.to_json())
+            for asr in records
+        )
+        return len(records)
+
+    def _insert_rows(self, rows: Iterable[tuple[str, str, str, int, str]]) -> None:
+        """Insert or replace (asr_id, date, agent_id, threat_level, record) rows."""
+        with self._db_lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO asr"
+                " (asr_id, date, agent_id, threat_level, record)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _import_json_records(self) -> None:
+        """Import records written as per-date JSON files by older versions.
+
+        Runs once, when the database is first created. Files that do not
+        parse as ASRs are skipped and all files are left in place.
+        """
+        rows = []
+        for file_path in self._storage_path.glob("*/*.json"):
+            try:
+                asr = AgentStateRecord.from_json(file_path.read_text())
+            except (TypeError, ValueError):
+                continue
+            rows.append(
+                (asr.asr_id, asr.timestamp[:10], asr.agent_id, asr.threat_level, asr.to_json())
+            )
+
+        if rows:
+            self._insert_rows(rows)
 
     def load_asr(self, asr_id: str, date: str | None = None) -> AgentStateRecord | None:
         """Load ASR record from storage.
@@ -275,21 +439,18 @@ class ASREngine:
         Returns:
             AgentStateRecord if found, None otherwise
         """
+        query = "SELECT record FROM asr WHERE asr_id = ?"
+        params: list[Any] = [asr_id]
         if date:
-            # Search specific date directory
-            file_path = self._storage_path / date / f"{asr_id}.json"
-            if file_path.exists():
-                return AgentStateRecord.from_json(file_path.read_text())
-            return None
+            query += " AND date = ?"
+            params.append(date)
 
-        # Search all date directories
-        for date_dir in self._storage_path.iterdir():
-            if date_dir.is_dir():
-                file_path = date_dir / f"{asr_id}.json"
-                if file_path.exists():
-                    return AgentStateRecord.from_json(file_path.read_text())
+        with self._db_lock:
+            row = self._db.execute(query, params).fetchone()
 
-        return None
+        if row is None:
+            return None
+        return AgentStateRecord.from_json(row[0])
 
     def list_asr_by_agent(
         self,
@@ -307,34 +468,30 @@ class ASREngine:
             threat_level_min: Minimum threat level to include
 
         Returns:
-            List of matching ASR records
+            List of matching ASR records, oldest date first
         """
-        results: list[AgentStateRecord] = []
+        query = "SELECT record FROM asr WHERE agent_id = ? AND threat_level >= ?"
+        params: list[Any] = [agent_id, threat_level_min]
 
-        for date_dir in sorted(self._storage_path.iterdir()):
-            if not date_dir.is_dir():
-                continue
+        # Apply date filters
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND date <= ?"
+            params.append(end_date)
+        query += " ORDER BY date, rowid"
 
-            date_str = date_dir.name
+        with self._db_lock:
+            rows = self._db.execute(query, params).fetchall()
 
-            # Apply date filters
-            if start_date and date_str < start_date:
-                continue
-            if end_date and date_str > end_date:
+        results: list[AgentStateRecord] = []
+        for (record,) in rows:
+            try:
+                results.append(AgentStateRecord.from_json(record))
+            except ValueError:
                 continue
 
-            # Load matching records
-            for file_path in date_dir.glob("*.json"):
-                try:
-                    asr = AgentStateRecord.from_json(file_path.read_text())
-                    if (
-                        asr.agent_id == agent_id
-                        and asr.threat_level >= threat_level_min
-                    ):
-                        results.append(asr)
-                except (json.JSONDecodeError, ValueError):
-                    continue
-
         return results
 
     def add_to_batch(self, asr: AgentStateRecord) -> ASRBatch | None:
@@ -389,21 +546,14 @@ class ASREngine:
         if not records:
             return hashlib.sha256(b"").hexdigest()
 
-        # Get leaf hashes
-        hashes = [bytes.fromhex(r.signature) for r in records]
+        # Leaf hashes packed back to back, converted from hex in one call
+        level = _leaf_level(records)
 
         # Build tree
-        while len(hashes) > 1:
-            if len(hashes) % 2 == 1:
-                hashes.append(hashes[-1])  # Duplicate last if odd
-
-            next_level = []
-            for i in range(0, len(hashes), 2):
-                combined = hashes[i] + hashes[i + 1]
-                next_level.append(hashlib.sha256(combined).digest())
-            hashes = next_level
+        while len(level) > _NODE_SIZE:
+            level = _parent_level(level)
 
-        return hashes[0].hex()
+        return level.hex()
 
     def get_merkle_proof(
         self,
@@ -429,28 +579,133 @@ class ASREngine:
             raise ValueError("ASR not found in batch")
 
         # Build proof
-        hashes = [bytes.fromhex(r.signature) for r in batch.records]
+        level = _leaf_level(batch.records)
         proof: list[tuple[str, str]] = []
 
-        while len(hashes) > 1:
-            if len(hashes) % 2 == 1:
-                hashes.append(hashes[-1])
-
+        while len(level) > _NODE_SIZE:
             sibling_index = index ^ 1  # XOR with 1 to get sibling
+            if sibling_index * _NODE_SIZE == len(level):
+                sibling_index = index  # Last node of an odd level pairs with itself
             position = "right" if index % 2 == 0 else "left"
-            proof.append((hashes[sibling_index].hex(), position))
+            start = sibling_index * _NODE_SIZE
+            proof.append((level[start:start + _NODE_SIZE].hex(), position))
 
             # Move to parent level
-            next_level = []
-            for i in range(0, len(hashes), 2):
-                combined = hashes[i] + hashes[i + 1]
-                next_level.append(hashlib.sha256(combined).digest())
-
-            hashes = next_level
+            level = _parent_level(level)
             index = index // 2
 
         return proof
 
+    def get_merkle_multi_proof(
+        self,
+        asrs: list[AgentStateRecord],
+        batch: ASRBatch,
+    ) -> MerkleMultiProof:
+        """Get one Merkle proof for several ASRs in a batch.
+
+        Siblings shared between the records' paths, or computable from
+        other proven records, are included only once or not at all, so
+        proving many records costs one pass over the tree.
+
+        Args:
+            asrs: The ASR records to prove
+            batch: The batch containing them
+
+        Returns:
+            MerkleMultiProof for the records
+        """
+        # First occurrence wins for a repeated asr_id, as in get_merkle_proof
+        positions: dict[str, int] = {}
+        for i, r in enumerate(batch.records):
+            positions.setdefault(r.asr_id, i)
+        try:
+            leaf_indices = [positions[asr.asr_id] for asr in asrs]
+        except KeyError:
+            raise ValueError("ASR not found in batch")
+
+        level = _leaf_level(batch.records)
+        count = len(batch.records)
+        known = sorted(set(leaf_indices))
+        hashes: list[str] = []
+
+        while count > 1:
+            known_set = set(known)
+            for index in known:
+                sibling_index = index ^ 1
+                if sibling_index >= count:
+                    continue  # Last node of an odd level pairs with itself
+                if sibling_index not in known_set:
+                    start = sibling_index * _NODE_SIZE
+                    hashes.append(level[start:start + _NODE_SIZE].hex())
+
+            level = _parent_level(level)
+            count = (count + 1) // 2
+            known = sorted({index // 2 for index in known})
+
+        return MerkleMultiProof(
+            leaf_count=len(batch.records),
+            leaf_indices=leaf_indices,
+            hashes=hashes,
+        )
+
+    @staticmethod
+    def verify_merkle_multi_proof(
+        asr_signatures: list[str],
+        proof: MerkleMultiProof,
+        merkle_root: str,
+    ) -> bool:
+        """Verify a Merkle multi-proof.
+
+        Args:
+            asr_signatures: Signature hashes of the proven ASRs, in the
+                order of proof.leaf_indices
+            proof: Proof from get_merkle_multi_proof
+            merkle_root: Expected Merkle root
+
+        Returns:
+            True if proof is valid
+        """
+        if len(asr_signatures) != len(proof.leaf_indices) or not asr_signatures:
+            return False
+
+        count = proof.leaf_count
+        nodes: dict[int, bytes] = {}
+        supplied = iter(proof.hashes)
+        try:
+            for index, signature in zip(proof.leaf_indices, asr_signatures):
+                leaf = _decode_node(signature)
+                if not 0 <= index < count or nodes.setdefault(index, leaf) != leaf:
+                    return False
+
+            while count > 1:
+                parents: dict[int, bytes] = {}
+                for index in sorted(nodes):
+                    parent = index // 2
+                    if parent in parents:
+                        continue
+
+                    left = nodes.get(index & ~1)
+                    if index | 1 < count:
+                        right = nodes.get(index | 1)
+                    else:
+                        right = left  # Last node of an odd level pairs with itself
+
+                    # Take missing siblings from the proof in the prover's order
+                    if left is None:
+                        left = _decode_node(next(supplied))
+                    if right is None:
+                        right = _decode_node(next(supplied))
+                    parents[parent] = hashlib.sha256(left + right).digest()
+
+                nodes = parents
+                count = (count + 1) // 2
+        except (StopIteration, ValueError):
+            return False
+
+        if next(supplied, None) is not None:
+            return False
+        return nodes[0].hex() == merkle_root
+
     @staticmethod
     def verify_merkle_proof(
         asr_signature: str,
@@ -517,6 +772,31 @@ class ASREventTypes:
     TX_FAILED = "tx_failed"
 
 
+# Substrings marking an algorithm name as quantum-safe or classical
+_QUANTUM_SAFE_MARKERS: Final[tuple[str, ...]] = ("ML-KEM-768", "ML-KEM-1024", "HYBRID")
+_CLASSICAL_MARKERS: Final[tuple[str, ...]] = ("AES", "ECDSA", "RSA")
+
+# Quantum-safe keys older than this many days are downgraded to WARNING
+_MAX_SAFE_KEY_AGE_DAYS: Final[int] = 365
+
+
+@lru_cache(maxsize=256)
+def _algorithm_status(algorithm: str) -> PQCStatus:
+    """Classify an algorithm name, ignoring key age (cached per name)."""
+    upper = algorithm.upper()
+
+    # ML-KEM algorithms are quantum-safe
+    if any(marker in upper for marker in _QUANTUM_SAFE_MARKERS):
+        return PQCStatus.SAFE
+
+    # Classical algorithms
+    if any(marker in upper for marker in _CLASSICAL_MARKERS):
+        return PQCStatus.WARNING
+
+    # Unknown algorithm
+    return PQCStatus.CRITICAL
+
+
 def determine_pqc_status(
     algorithm: str,
     key_age_days: int = 0,
@@ -530,24 +810,9 @@ def determine_pqc_status(
     Returns:
         PQCStatus indicating quantum safety
     """
-    # ML-KEM algorithms are quantum-safe
-    quantum_safe = {"ML-KEM-768", "ML-KEM-1024", "HYBRID"}
-
-    # Check if algorithm is quantum-safe
-    is_safe = any(safe in algorithm.upper() for safe in quantum_safe)
+    status = _algorithm_status(algorithm)
 
-    if is_safe:
-        # Check key age
-        if key_age_days > 365:
-            return PQCStatus.WARNING
-        return PQCStatus.SAFE
-
-    # Classical algorithms
-    classical = {"AES", "ECDSA", "RSA"}
-    is_classical = any(c in algorithm.upper() for c in classical)
-
-    if is_classical:
+    # Check key age
+    if status is PQCStatus.SAFE and key_age_days > _MAX_SAFE_KEY_AGE_DAYS:
         return PQCStatus.WARNING
-
-    # Unknown algorithm
-    return PQCStatus.CRITICAL
+    return status
@@ -13,10 +13,13 @@ Security Note:
 """
 
 import os
-import time
 import hashlib
 import hmac
 import secrets
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Final
@@ -26,6 +29,10 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.padding import PKCS7
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+    encode_dss_signature,
+)
 from cryptography.hazmat.backends import default_backend
 from cryptography.exceptions import InvalidSignature
 
@@ -38,8 +45,24 @@ SALT_SIZE: Final[int] = 32
 PBKDF2_ITERATIONS: Final[int] = 600_000  # OWASP recommendation 2024
 ECDSA_CURVE: Final[str] = "secp256k1"
 
+# secp256k1 group order and its half, for low-S normalization (BIP-62)
+SECP256K1_ORDER: Final[int] = (
+    0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+)
+SECP256K1_HALF_ORDER: Final[int] = SECP256K1_ORDER >> 1
+
+# Stateless curve and signature algorithm objects shared by all signers
+_CURVE = ec.SECP256K1()
+_ECDSA_SHA256 = ec.ECDSA(hashes.SHA256())
+
 logger = SecurityEventLogger("legacy")
 
+# PKCS#7 padding for each possible pad length, built once
+_AES_BLOCK_BYTES: Final[int] = AES_BLOCK_SIZE // 8
+_PKCS7_PADDING: Final[tuple[bytes, ...]] = tuple(
+    bytes((n,)) * n for n in range(_AES_BLOCK_BYTES + 1)
+)
+
 
 @dataclass
 class AESCiphertext:
@@ -55,7 +78,7 @@ class AESCiphertext:
     """
     salt: bytes
     iv: bytes
-    ciphertext: bytes
+    ciphertext: bytes | memoryview
     hmac_tag: bytes
 
     def to_bytes(self) -> bytes:
@@ -64,11 +87,16 @@ class AESCiphertext:
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "AESCiphertext":
-        """Deserialize from bytes format."""
-        salt = data[:SALT_SIZE]
-        iv = data[SALT_SIZE:SALT_SIZE + AES_IV_SIZE]
-        hmac_tag = data[-HMAC_DIGEST_SIZE:]
-        ciphertext = data[SALT_SIZE + AES_IV_SIZE:-HMAC_DIGEST_SIZE]
+        """Deserialize from bytes format.
+
+        The ciphertext body is a zero-copy memoryview over ``data``; the
+        HMAC and cipher both read it through the buffer protocol.
+        """
+        view = memoryview(data)
+        salt = bytes(view[:SALT_SIZE])
+        iv = bytes(view[SALT_SIZE:SALT_SIZE + AES_IV_SIZE])
+        hmac_tag = bytes(view[-HMAC_DIGEST_SIZE:])
+        ciphertext = view[SALT_SIZE + AES_IV_SIZE:-HMAC_DIGEST_SIZE]
         return cls(salt=salt, iv=iv, ciphertext=ciphertext, hmac_tag=hmac_tag)
 
 
@@ -93,7 +121,7 @@ class ECDSAKeyPair:
         # Load private key
         private_key_obj = ec.derive_private_key(
             int.from_bytes(private_key, "big"),
-            ec.SECP256K1(),
+            _CURVE,
             default_backend(),
         )
 
@@ -157,6 +185,12 @@ class LegacyCrypto:
         - PBKDF2: Key derivation with 600,000 iterations
         - Random salt and IV per encryption
 
+    Thread safety:
+        encrypt() and decrypt() keep no per-call state on the instance and
+        OpenSSL/hashlib release the GIL on large buffers, so one instance
+        can be shared across threads (see encrypt_many()). The optional
+        key derivation cache is guarded by a lock.
+
     Example:
         >>> crypto = LegacyCrypto()
         >>> key = crypto.derive_key(b"password", salt=os.urandom(32))
@@ -164,10 +198,22 @@ class LegacyCrypto:
         >>> plaintext = crypto.decrypt(ciphertext, key)
     """
 
-    def __init__(self) -> None:
-        """Initialize legacy crypto engine."""
+    def __init__(self, kdf_cache_size: int = 0) -> None:
+        """Initialize legacy crypto engine.
+
+        Args:
+            kdf_cache_size: Number of derived keys to keep per instance,
+                keyed by (password, salt, iterations), so re-deriving the
+                key for a known salt skips PBKDF2. Off by default because
+                cached entries keep passwords and keys in memory.
+        """
         self._algorithm = "AES-256-CBC-HMAC-SHA256"
 
+        # (password, salt, iterations) -> derived key, least recently used first
+        self._kdf_cache_size = kdf_cache_size
+        self._kdf_cache: OrderedDict[tuple[bytes, bytes, int], bytes] = OrderedDict()
+        self._kdf_lock = threading.Lock()
+
     @property
     def algorithm(self) -> str:
         """Get the algorithm identifier."""
@@ -192,6 +238,15 @@ class LegacyCrypto:
         if salt is None:
             salt = os.urandom(SALT_SIZE)
 
+        cache_key = (password, salt, iterations)
+        if self._kdf_cache_size > 0:
+            with self._kdf_lock:
+                derived = self._kdf_cache.get(cache_key)
+                if derived is not None:
+                    self._kdf_cache.move_to_end(cache_key)
+            if derived is not None:
+                return derived, salt
+
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=AES_KEY_SIZE // 8 + HMAC_DIGEST_SIZE,  # AES key + HMAC key
@@ -201,6 +256,14 @@ class LegacyCrypto:
         )
         derived = kdf.derive(password)
 
+        if self._kdf_cache_size > 0:
+            with self._kdf_lock:
+                self._kdf_cache[cache_key] = derived
+                self._kdf_cache.move_to_end(cache_key)
+                while len(self._kdf_cache) > self._kdf_cache_size:
+                    # Evict the least recently used entry
+                    self._kdf_cache.popitem(last=False)
+
         return derived, salt
 
     def _split_keys(self, derived: bytes) -> tuple[bytes, bytes]:
@@ -209,6 +272,20 @@ class LegacyCrypto:
         mac_key = derived[AES_KEY_SIZE // 8:]
         return enc_key, mac_key
 
+    @staticmethod
+    def _compute_tag(
+        mac_key: bytes,
+        salt: bytes,
+        iv: bytes,
+        ciphertext: bytes | memoryview,
+    ) -> bytes:
+        """Compute HMAC-SHA256 over salt + iv + ciphertext without concatenating."""
+        mac = hmac.new(mac_key, digestmod=hashlib.sha256)
+        mac.update(salt)
+        mac.update(iv)
+        mac.update(ciphertext)
+        return mac.digest()
+
     def encrypt(
         self,
         plaintext: bytes,
@@ -225,34 +302,29 @@ class LegacyCrypto:
         Returns:
             AESCiphertext with encrypted data and authentication tag
         """
-        start_time = time.perf_counter()
+        start_time = logger.start_timer()
 
+        # Draw salt and IV from a single getrandom() call when both are needed
         if salt is None:
-            salt = os.urandom(SALT_SIZE)
+            rnd = os.urandom(SALT_SIZE + AES_IV_SIZE)
+            salt, iv = rnd[:SALT_SIZE], rnd[SALT_SIZE:]
+        else:
+            iv = os.urandom(AES_IV_SIZE)
 
         enc_key, mac_key = self._split_keys(key)
 
-        # Generate random IV
-        iv = os.urandom(AES_IV_SIZE)
-
-        # Pad plaintext to block size
-        padder = PKCS7(AES_BLOCK_SIZE).padder()
-        padded = padder.update(plaintext) + padder.finalize()
+        # Pad plaintext to block size (PKCS#7: n bytes of value n)
+        pad_len = _AES_BLOCK_BYTES - len(plaintext) % _AES_BLOCK_BYTES
+        padded = plaintext + _PKCS7_PADDING[pad_len]
 
         # Encrypt with AES-CBC
-        cipher = Cipher(
-            algorithms.AES(enc_key),
-            modes.CBC(iv),
-            backend=default_backend(),
-        )
-        encryptor = cipher.encryptor()
+        encryptor = Cipher(algorithms.AES(enc_key), modes.CBC(iv)).encryptor()
         ciphertext = encryptor.update(padded) + encryptor.finalize()
 
         # Compute HMAC over salt + iv + ciphertext
-        mac_data = salt + iv + ciphertext
-        hmac_tag = hmac.new(mac_key, mac_data, hashlib.sha256).digest()
+        hmac_tag = self._compute_tag(mac_key, salt, iv, ciphertext)
 
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = logger.elapsed_ms(start_time)
 
         logger.log_crypto_operation(
             operation="aes_encrypt",
@@ -281,13 +353,14 @@ class LegacyCrypto:
         Raises:
             ValueError: If HMAC verification fails
         """
-        start_time = time.perf_counter()
+        start_time = logger.start_timer()
 
         enc_key, mac_key = self._split_keys(key)
 
         # Verify HMAC first (constant-time comparison)
-        mac_data = ciphertext.salt + ciphertext.iv + ciphertext.ciphertext
-        expected_tag = hmac.new(mac_key, mac_data, hashlib.sha256).digest()
+        expected_tag = self._compute_tag(
+            mac_key, ciphertext.salt, ciphertext.iv, ciphertext.ciphertext
+        )
 
         if not hmac.compare_digest(ciphertext.hmac_tag, expected_tag):
             logger.log_crypto_operation(
@@ -298,19 +371,14 @@ class LegacyCrypto:
             raise ValueError("HMAC verification failed - data may be tampered")
 
         # Decrypt with AES-CBC
-        cipher = Cipher(
-            algorithms.AES(enc_key),
-            modes.CBC(ciphertext.iv),
-            backend=default_backend(),
-        )
-        decryptor = cipher.decryptor()
+        decryptor = Cipher(algorithms.AES(enc_key), modes.CBC(ciphertext.iv)).decryptor()
         padded = decryptor.update(ciphertext.ciphertext) + decryptor.finalize()
 
         # Remove padding
         unpadder = PKCS7(AES_BLOCK_SIZE).unpadder()
         plaintext = unpadder.update(padded) + unpadder.finalize()
 
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = logger.elapsed_ms(start_time)
 
         logger.log_crypto_operation(
             operation="aes_decrypt",
@@ -321,6 +389,30 @@ class LegacyCrypto:
 
         return plaintext
 
+    def encrypt_many(
+        self,
+        plaintexts: list[bytes],
+        key: bytes,
+        salt: bytes | None = None,
+        max_workers: int | None = None,
+    ) -> list[AESCiphertext]:
+        """Encrypt several plaintexts under one key in parallel.
+
+        Args:
+            plaintexts: Data items to encrypt
+            key: Derived key (64 bytes: 32 AES + 32 HMAC)
+            salt: Salt used for key derivation
+            max_workers: Thread pool size (default: executor default)
+
+        Returns:
+            List of AESCiphertext in the same order as plaintexts
+        """
+        if len(plaintexts) < 2:
+            return [self.encrypt(p, key, salt) for p in plaintexts]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda p: self.encrypt(p, key, salt), plaintexts))
+
 
 class ECDSASigner:
     """ECDSA secp256k1 signer for Polygon-compatible signatures.
@@ -355,7 +447,7 @@ class ECDSASigner:
         """
         private_key = ec.derive_private_key(
             int.from_bytes(private_key_bytes, "big"),
-            ec.SECP256K1(),
+            _CURVE,
             default_backend(),
         )
         return cls(private_key)
@@ -367,7 +459,7 @@ class ECDSASigner:
         Returns:
             ECDSASigner instance with new key pair
         """
-        private_key = ec.generate_private_key(ec.SECP256K1(), default_backend())
+        private_key = ec.generate_private_key(_CURVE, default_backend())
         return cls(private_key)
 
     def get_keypair(self) -> ECDSAKeyPair:
@@ -398,26 +490,23 @@ class ECDSASigner:
         Returns:
             ECDSASignature with r, s, v components
         """
-        start_time = time.perf_counter()
+        start_time = logger.start_timer()
 
         if len(message_hash) != 32:
             raise ValueError("Message hash must be 32 bytes")
 
         # Sign using ECDSA
-        from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
-
         signature_der = self._private_key.sign(
             message_hash,
-            ec.ECDSA(hashes.SHA256()),
+            _ECDSA_SHA256,
         )
 
         # Decode DER signature to r, s
         r, s = decode_dss_signature(signature_der)
 
         # Normalize s to low-S form (BIP-62)
-        order = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
-        if s > order // 2:
-            s = order - s
+        if s > SECP256K1_HALF_ORDER:
+            s = SECP256K1_ORDER - s
 
         r_bytes = r.to_bytes(32, "big")
         s_bytes = s.to_bytes(32, "big")
@@ -425,7 +514,7 @@ class ECDSASigner:
         # Calculate recovery parameter (simplified - may need refinement)
         v = 27  # Default, would need proper recovery calculation for production
 
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = logger.elapsed_ms(start_time)
 
         logger.log_crypto_operation(
             operation="ecdsa_sign",
@@ -452,18 +541,16 @@ class ECDSASigner:
         Returns:
             True if signature is valid, False otherwise
         """
-        start_time = time.perf_counter()
+        start_time = logger.start_timer()
 
         try:
             # Load public key
             public_key_obj = ec.EllipticCurvePublicKey.from_encoded_point(
-                ec.SECP256K1(),
+                _CURVE,
                 public_key,
             )
 
             # Encode signature to DER format
-            from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
-
             r = int.from_bytes(signature.r, "big")
             s = int.from_bytes(signature.s, "big")
             signature_der = encode_dss_signature(r, s)
@@ -472,10 +559,10 @@ class ECDSASigner:
             public_key_obj.verify(
                 signature_der,
                 message_hash,
-                ec.ECDSA(hashes.SHA256()),
+                _ECDSA_SHA256,
             )
 
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            duration_ms = logger.elapsed_ms(start_time)
 
             logger.log_crypto_operation(
                 operation="ecdsa_verify",
@@ -494,6 +581,21 @@ class ECDSASigner:
             )
             return False
 
+    @staticmethod
+    def verify_batch(
+        items: list[tuple[bytes, ECDSASignature, bytes]],
+    ) -> list[bool]:
+        """Verify many ECDSA signatures.
+
+        Args:
+            items: List of (message_hash, signature, public_key) tuples
+
+        Returns:
+            List of verification results in the same order as items
+        """
+        verify = ECDSASigner.verify
+        return [verify(*item) for item in items]
+
 
 class TLSManager:
     """TLS 1.3 configuration manager.
@@ -508,6 +610,7 @@ class TLSManager:
         "TLS_CHACHA20_POLY1305_SHA256",
         "TLS_AES_128_GCM_SHA256",
     ]
+    TLS13_CIPHER_STRING: Final[str] = ":".join(TLS13_CIPHERS)
 
     def __init__(self) -> None:
         """Initialize TLS manager."""
@@ -520,7 +623,7 @@ class TLSManager:
             hostname: The hostname to pin
             cert_hash: SHA-256 hash of the certificate
         """
-        self._pinned_certs[hostname] = cert_hash
+        self._pinned_certs[sys.intern(hostname)] = cert_hash
 
     def verify_pin(self, hostname: str, cert_hash: bytes) -> bool:
         """Verify a certificate against pinned hash.
@@ -532,15 +635,19 @@ class TLSManager:
         Returns:
             True if certificate matches pin or no pin exists
         """
-        if hostname not in self._pinned_certs:
+        pinned = self._pinned_certs.get(hostname)
+        if pinned is None:
             return True  # No pin set, allow
 
-        return hmac.compare_digest(self._pinned_certs[hostname], cert_hash)
+        return hmac.compare_digest(pinned, cert_hash)
 
-    @staticmethod
-    def get_ssl_context():
+    @classmethod
+    def get_ssl_context(cls):
         """Get an SSL context configured for TLS 1.3.
 
+        A new context is returned on every call so callers can load
+        certificates or adjust options without affecting each other.
+
         Returns:
             ssl.SSLContext configured for TLS 1.3
         """
@@ -551,7 +658,7 @@ class TLSManager:
         ctx.maximum_version = ssl.TLSVersion.TLSv1_3
 
         # Set recommended ciphers
-        ctx.set_ciphers(":".join(TLSManager.TLS13_CIPHERS))
+        ctx.set_ciphers(cls.TLS13_CIPHER_STRING)
 
         return ctx
 
@@ -17,10 +17,12 @@ Performance Targets:
 import os
 import time
 import hashlib
+import hmac
 import secrets
+import struct
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Final
+from typing import Final, Self
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
@@ -42,17 +44,25 @@ from config.constants import (
     AES_KEY_SIZE,
 )
 from config.logging import SecurityEventLogger
+from core._pqc_fast import FAST_DECAPS_AVAILABLE, FastDecapsulator
 
 # Constants
 ML_KEM_768_NAME: Final[str] = "ML-KEM-768"
 ML_KEM_1024_NAME: Final[str] = "ML-KEM-1024"
 SHARED_SECRET_SIZE: Final[int] = 32  # 256 bits
 INFO_LABEL: Final[bytes] = b"PULSAR-SENTINEL-HYBRID-v1"
+_ZERO_SALT: Final[bytes] = bytes(32)
+# Big-endian u32 KEM ciphertext length prefix of serialized HybridCiphertext
+_KEM_LEN: Final = struct.Struct(">I")
+# HKDF-Extract HMAC keyed with the zero salt; copied per call to skip key padding
+_HKDF_EXTRACT_BASE: Final = hmac.new(_ZERO_SALT, digestmod=hashlib.sha256)
+# HKDF-Expand input for a single 32-byte output block: info || 0x01
+_EXPAND_BLOCK_1: Final[bytes] = INFO_LABEL + b"\x01"
 
 logger = SecurityEventLogger("pqc")
 
 
-@dataclass
+@dataclass(slots=True)
 class MLKEMKeyPair:
     """ML-KEM key pair container.
 
@@ -62,25 +72,39 @@ class MLKEMKeyPair:
         algorithm: The ML-KEM variant used
         created_at: Key pair creation timestamp
         key_id: Unique identifier for this key pair
+        public_key_hash: SHA-256 hash of the public key (first 16 hex
+            chars) for identification, computed once
+
+    Compare identifiers from untrusted input with matches() /
+    matches_public_key_hash() rather than ``==``.
     """
     public_key: bytes
     secret_key: bytes
     algorithm: str
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     key_id: str = field(default_factory=lambda: secrets.token_hex(16))
+    public_key_hash: str = field(init=False, default="", repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate key pair after initialization."""
+        """Validate key pair and derive identifiers after initialization."""
         if not self.public_key or not self.secret_key:
             raise ValueError("Both public and secret keys are required")
 
-    @property
-    def public_key_hash(self) -> str:
-        """Get SHA-256 hash of the public key for identification."""
-        return hashlib.sha256(self.public_key).hexdigest()[:16]
+        self.public_key_hash = hashlib.sha256(self.public_key).hexdigest()[:16]
+
+    def matches(self, key_id: str) -> bool:
+        """Check a caller-supplied key_id in constant time.
+
+        Prefer this over ``==`` when the other value may be attacker-controlled.
+        """
+        return hmac.compare_digest(self.key_id.encode(), key_id.encode())
 
+    def matches_public_key_hash(self, public_key_hash: str) -> bool:
+        """Check a caller-supplied public key hash in constant time."""
+        return hmac.compare_digest(self.public_key_hash.encode(), public_key_hash.encode())
 
-@dataclass
+
+@dataclass(slots=True)
 class EncapsulationResult:
     """Result of ML-KEM encapsulation operation.
 
@@ -92,7 +116,7 @@ class EncapsulationResult:
     shared_secret: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class HybridCiphertext:
     """Hybrid encryption ciphertext container.
 
@@ -106,22 +130,31 @@ class HybridCiphertext:
     """
     kem_ciphertext: bytes
     aes_nonce: bytes
-    aes_ciphertext: bytes
+    aes_ciphertext: bytes | memoryview
     algorithm: str
 
     def to_bytes(self) -> bytes:
         """Serialize to bytes format."""
         # Format: [4-byte kem_len][kem_ciphertext][12-byte nonce][aes_ciphertext]
-        kem_len = len(self.kem_ciphertext).to_bytes(4, "big")
-        return kem_len + self.kem_ciphertext + self.aes_nonce + self.aes_ciphertext
+        return b"".join((
+            _KEM_LEN.pack(len(self.kem_ciphertext)),
+            self.kem_ciphertext,
+            self.aes_nonce,
+            self.aes_ciphertext,
+        ))
 
     @classmethod
     def from_bytes(cls, data: bytes, algorithm: str) -> "HybridCiphertext":
-        """Deserialize from bytes format."""
-        kem_len = int.from_bytes(data[:4], "big")
-        kem_ciphertext = data[4:4 + kem_len]
-        aes_nonce = data[4 + kem_len:4 + kem_len + GCM_NONCE_SIZE]
-        aes_ciphertext = data[4 + kem_len + GCM_NONCE_SIZE:]
+        """Deserialize from bytes format.
+
+        The AES ciphertext is a zero-copy memoryview over ``data``.
+        """
+        view = memoryview(data)
+        kem_end = 4 + _KEM_LEN.unpack_from(view)[0]
+        nonce_end = kem_end + GCM_NONCE_SIZE
+        kem_ciphertext = bytes(view[4:kem_end])
+        aes_nonce = bytes(view[kem_end:nonce_end])
+        aes_ciphertext = view[nonce_end:]
         return cls(
             kem_ciphertext=kem_ciphertext,
             aes_nonce=aes_nonce,
@@ -143,6 +176,8 @@ class PQCEngine:
         >>> shared_secret = engine.decapsulate(result.ciphertext, keypair.secret_key)
     """
 
+    __slots__ = ("_algorithm", "_fast_decap", "_kem", "_liboqs_name", "_security_level")
+
     def __init__(self, security_level: int = PQCSecurityLevel.LEVEL_768) -> None:
         """Initialize PQC engine.
 
@@ -164,7 +199,24 @@ class PQCEngine:
 
         self._security_level = security_level
         self._algorithm = ML_KEM_768_NAME if security_level == 768 else ML_KEM_1024_NAME
+        # Map our names to liboqs algorithm names
+        self._liboqs_name = "Kyber768" if security_level == 768 else "Kyber1024"
         self._kem: oqs.KeyEncapsulation | None = None
+        # Shared cffi KEM handle, created on first decapsulation
+        self._fast_decap: FastDecapsulator | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Free the liboqs KEM instances held by this engine."""
+        self._fast_decap = None
+        if self._kem is not None:
+            self._kem.free()
+            self._kem = None
 
     @property
     def algorithm(self) -> str:
@@ -179,9 +231,7 @@ class PQCEngine:
     def _get_kem(self) -> "oqs.KeyEncapsulation":
         """Get or create the KEM instance (lazy initialization)."""
         if self._kem is None:
-            # Map our names to liboqs algorithm names
-            liboqs_name = "Kyber768" if self._security_level == 768 else "Kyber1024"
-            self._kem = oqs.KeyEncapsulation(liboqs_name)
+            self._kem = oqs.KeyEncapsulation(self._liboqs_name)
         return self._kem
 
     def generate_keypair(self) -> MLKEMKeyPair:
@@ -225,12 +275,12 @@ class PQCEngine:
         Returns:
             EncapsulationResult containing ciphertext and shared secret
         """
-        start_time = time.perf_counter()
+        start_time = logger.start_timer()
 
         kem = self._get_kem()
         ciphertext, shared_secret = kem.encap_secret(public_key)
 
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = logger.elapsed_ms(start_time)
 
         logger.log_crypto_operation(
             operation="encapsulate",
@@ -254,13 +304,18 @@ class PQCEngine:
         Returns:
             The decapsulated shared secret
         """
-        start_time = time.perf_counter()
+        start_time = logger.start_timer()
 
-        liboqs_name = "Kyber768" if self._security_level == 768 else "Kyber1024"
-        kem = oqs.KeyEncapsulation(liboqs_name, secret_key)
-        shared_secret = kem.decap_secret(ciphertext)
+        if FAST_DECAPS_AVAILABLE:
+            if self._fast_decap is None:
+                self._fast_decap = FastDecapsulator(self._liboqs_name)
+            shared_secret = self._fast_decap.decapsulate(ciphertext, secret_key)
+        else:
+            # The KEM is bound to this secret key; free it as soon as it is used
+            with oqs.KeyEncapsulation(self._liboqs_name, secret_key) as kem:
+                shared_secret = kem.decap_secret(ciphertext)
 
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = logger.elapsed_ms(start_time)
 
         logger.log_crypto_operation(
             operation="decapsulate",
@@ -291,6 +346,8 @@ class HybridEncryptor:
         >>> plaintext = encryptor.decrypt(ciphertext, keypair.secret_key)
     """
 
+    __slots__ = ("_algorithm", "_pqc_engine")
+
     def __init__(self, security_level: int = PQCSecurityLevel.LEVEL_768) -> None:
         """Initialize hybrid encryptor.
 
@@ -320,7 +377,12 @@ class HybridEncryptor:
             32-byte AES-256 key
         """
         if salt is None:
-            salt = b"\x00" * 32
+            # Default zero salt: one HKDF-Extract and one Expand block, done
+            # directly with HMAC-SHA256 (RFC 5869, L == HashLen)
+            extract = _HKDF_EXTRACT_BASE.copy()
+            extract.update(shared_secret)
+            prk = extract.digest()
+            return hmac.new(prk, _EXPAND_BLOCK_1, hashlib.sha256).digest()
 
         hkdf = HKDF(
             algorithm=hashes.SHA256(),
@@ -350,7 +412,7 @@ class HybridEncryptor:
         Performance:
             Target: < 100ms for typical payloads
         """
-        start_time = time.perf_counter()
+        start_time = logger.start_timer()
 
         # Step 1: ML-KEM encapsulation
         encap_result = self._pqc_engine.encapsulate(public_key)
@@ -363,7 +425,7 @@ class HybridEncryptor:
         aesgcm = AESGCM(aes_key)
         aes_ciphertext = aesgcm.encrypt(nonce, plaintext, associated_data)
 
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = logger.elapsed_ms(start_time)
 
         logger.log_crypto_operation(
             operation="hybrid_encrypt",
@@ -398,7 +460,7 @@ class HybridEncryptor:
         Raises:
             ValueError: If decryption fails (authentication failure)
         """
-        start_time = time.perf_counter()
+        start_time = logger.start_timer()
 
         try:
             # Step 1: ML-KEM decapsulation
@@ -418,7 +480,7 @@ class HybridEncryptor:
                 associated_data,
             )
 
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            duration_ms = logger.elapsed_ms(start_time)
 
             logger.log_crypto_operation(
                 operation="hybrid_decrypt",
@@ -434,7 +496,7 @@ class HybridEncryptor:
                 operation="hybrid_decrypt",
                 algorithm=self._algorithm,
                 success=False,
-                duration_ms=(time.perf_counter() - start_time) * 1000,
+                duration_ms=logger.elapsed_ms(start_time),
             )
             raise ValueError(f"Decryption failed: {e}") from e
 
@@ -472,9 +534,10 @@ class PQCEngineSimulated:
 
     def generate_keypair(self) -> MLKEMKeyPair:
         """Generate a simulated key pair."""
-        # Use random bytes for simulated keys
-        public_key = os.urandom(self._public_key_size)
-        secret_key = os.urandom(self._secret_key_size)
+        # Use random bytes for simulated keys, drawn in one syscall
+        buf = os.urandom(self._public_key_size + self._secret_key_size)
+        public_key = buf[:self._public_key_size]
+        secret_key = buf[self._public_key_size:]
 
         return MLKEMKeyPair(
             public_key=public_key,
@@ -485,8 +548,9 @@ class PQCEngineSimulated:
     def encapsulate(self, public_key: bytes) -> EncapsulationResult:
         """Simulate encapsulation using HKDF."""
         # Derive shared secret from public key hash (simulated)
-        shared_secret = hashlib.sha256(public_key + os.urandom(32)).digest()
-        ciphertext = os.urandom(self._ciphertext_size)
+        buf = os.urandom(32 + self._ciphertext_size)
+        shared_secret = hashlib.sha256(public_key + buf[:32]).digest()
+        ciphertext = buf[32:]
 
         return EncapsulationResult(
             ciphertext=ciphertext,
@@ -1,19 +1,31 @@
 """Threat alert cog for PULSAR SENTINEL Discord bot.
 
-Provides an async queue that the bot polls to send PTS tier change
+Provides an async queue that the bot consumes to send PTS tier change
 notifications to a configured alerts channel.
 """
 
 import asyncio
+import contextlib
+import threading
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
+from config.logging import get_logger
 from discord_bot.embeds import threat_alert_embed
 
+logger = get_logger("discord.alerts")
 
-@dataclass
+# Discord accepts at most 10 embeds in a single message
+MAX_EMBEDS_PER_MESSAGE = 10
+
+# Seconds to wait before retrying when the alerts channel is not visible
+CHANNEL_RETRY_SECONDS = 5.0
+
+
+@dataclass(slots=True)
 class ThreatAlert:
     """A queued threat alert."""
 
@@ -22,65 +34,140 @@ class ThreatAlert:
     details: str = ""
 
 
+# Upper bound on queued alerts; extra alerts are counted in dropped_alerts
+ALERT_QUEUE_MAXSIZE = 1024
+
 # Module-level queue so other parts of the app can push alerts
-alert_queue: asyncio.Queue[ThreatAlert] = asyncio.Queue()
+alert_queue: asyncio.Queue[ThreatAlert] = asyncio.Queue(maxsize=ALERT_QUEUE_MAXSIZE)
+
+# Number of alerts discarded because the queue was full or no loop could
+# take them; updated from both the bot loop and producer threads
+dropped_alerts = 0
+_dropped_lock = threading.Lock()
+
+# Event loop that owns alert_queue, registered by the bot at startup
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def set_loop(loop: asyncio.AbstractEventLoop | None) -> None:
+    """Register the event loop that consumes alert_queue (None to clear it)."""
+    global _loop
+    _loop = loop
+
+
+def _count_dropped() -> None:
+    """Count one discarded alert."""
+    global dropped_alerts
+    with _dropped_lock:
+        dropped_alerts += 1
+
+
+def _enqueue(alert: ThreatAlert) -> None:
+    """Put an alert on the queue, counting it as dropped if the queue is full."""
+    try:
+        alert_queue.put_nowait(alert)
+    except asyncio.QueueFull:
+        _count_dropped()
 
 
 def push_alert(pts_score: float, tier: str, details: str = "") -> None:
-    """Push a threat alert onto the queue (thread-safe with running loop).
+    """Push a threat alert onto the queue (safe from any thread).
 
     Call this from anywhere in the application to queue a Discord alert.
+    From outside the bot's event loop the put is handed to that loop via
+    call_soon_threadsafe, since asyncio.Queue is not thread-safe. Alerting
+    never raises into the caller: if that loop has closed, or no loop is
+    registered and the caller is not on one, the alert is counted in
+    dropped_alerts.
     """
     alert = ThreatAlert(pts_score=pts_score, tier=tier, details=details)
     try:
-        alert_queue.put_nowait(alert)
-    except asyncio.QueueFull:
-        pass  # Drop alert if queue is full (shouldn't happen with unbounded queue)
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if _loop is not None and running is not _loop:
+        try:
+            _loop.call_soon_threadsafe(_enqueue, alert)
+        except RuntimeError:  # Event loop is closed (bot shut down)
+            _count_dropped()
+    elif running is not None:
+        _enqueue(alert)
+    else:
+        _count_dropped()  # No loop to hand the alert to (bot not started)
 
 
 class AlertsCog(commands.Cog):
-    """Polls the alert queue and sends threat notifications."""
+    """Waits on the alert queue and sends threat notifications."""
 
     def __init__(self, bot: commands.Bot, alerts_channel_id: int) -> None:
         self.bot = bot
         self.alerts_channel_id = alerts_channel_id
+        self._task: asyncio.Task[None] | None = None
 
     async def cog_load(self) -> None:
-        """Start the polling loop when the cog loads."""
+        """Start the alert consumer when the cog loads."""
         if self.alerts_channel_id:
-            self.poll_alerts.start()
+            self._task = asyncio.create_task(self._run())
 
     async def cog_unload(self) -> None:
-        """Stop the polling loop when the cog unloads."""
-        self.poll_alerts.cancel()
+        """Stop the alert consumer and wait for it to finish."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        """Block on the queue and send each wake-up's alerts as one batch."""
+        await self.bot.wait_until_ready()
 
-    @tasks.loop(seconds=5.0)
-    async def poll_alerts(self) -> None:
-        """Check the queue for new alerts and send them."""
-        channel = self.bot.get_channel(self.alerts_channel_id)
-        if channel is None:
-            return
+        alerts: list[ThreatAlert] = []
+        while True:
+            if not alerts:
+                alerts.append(await alert_queue.get())
+                while True:
+                    try:
+                        alerts.append(alert_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+            channel = self.bot.get_channel(self.alerts_channel_id)
+            if channel is None:
+                # Channel not visible to the bot yet - keep the batch and retry
+                await asyncio.sleep(CHANNEL_RETRY_SECONDS)
+                continue
 
-        while not alert_queue.empty():
             try:
-                alert = alert_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
-            embed = threat_alert_embed(
+                await self.send_alerts(channel, alerts)
+            except Exception:
+                logger.exception("alert_send_failed", count=len(alerts))
+            alerts = []
+
+    async def send_alerts(
+        self,
+        channel: discord.abc.Messageable,
+        alerts: list[ThreatAlert],
+    ) -> None:
+        """Send alerts packed up to MAX_EMBEDS_PER_MESSAGE embeds per message."""
+        now = datetime.now(timezone.utc)  # One timestamp for the whole batch
+        embeds = [
+            threat_alert_embed(
                 pts_score=alert.pts_score,
                 tier=alert.tier,
                 details=alert.details,
+                now=now,
             )
+            for alert in alerts
+        ]
+        # Sent one after another so messages arrive in queue order
+        for i in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+            chunk = embeds[i:i + MAX_EMBEDS_PER_MESSAGE]
             try:
-                await channel.send(embed=embed)
+                await channel.send(embeds=chunk)
             except discord.HTTPException:
-                pass  # Channel permissions issue - log in production
-
-    @poll_alerts.before_loop
-    async def before_poll(self) -> None:
-        """Wait until the bot is ready before polling."""
-        await self.bot.wait_until_ready()
+                # Usually a channel permissions issue; skip to the next message
+                logger.exception("alert_message_failed", count=len(chunk))
 
 
 async def setup(bot: commands.Bot, alerts_channel_id: int = 0) -> None:
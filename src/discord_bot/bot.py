@@ -1,15 +1,11 @@
 """Main Discord bot for PULSAR SENTINEL."""
 
 import sys
-from pathlib import Path
+import asyncio
 
 import discord
 from discord.ext import commands
 
-# Add project root to path for config imports (do NOT add config/ directly - it shadows stdlib logging)
-_project_root = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(_project_root))
-
 from config.settings import get_settings
 from discord_bot import embeds
 from discord_bot import commands as pulsar_commands
@@ -55,6 +51,7 @@ def create_bot() -> commands.Bot:
 async def setup_bot(bot: commands.Bot) -> None:
     """Load all cogs onto the bot."""
     settings = get_settings()
+    alerts.set_loop(asyncio.get_running_loop())
     await pulsar_commands.setup(bot)
     await alerts.setup(bot, alerts_channel_id=settings.discord_alerts_channel_id)
 
@@ -77,4 +74,8 @@ def run_bot() -> None:
         await setup_bot(bot)
 
     print("[PULSAR SENTINEL] Starting Discord bot...")
-    bot.run(token, log_handler=None)
+    try:
+        bot.run(token, log_handler=None)
+    finally:
+        # bot.run closes its loop; stop push_alert from targeting it
+        alerts.set_loop(None)
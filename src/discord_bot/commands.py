@@ -1,15 +1,11 @@
 """Command cog for PULSAR SENTINEL Discord bot."""
 
-import sys
-from pathlib import Path
+from datetime import datetime, timezone
 
 import discord
+import httpx
 from discord.ext import commands
 
-# Add project root to path for config imports (do NOT add config/ directly - it shadows stdlib logging)
-_project_root = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(_project_root))
-
 from config.constants import TIER_CONFIGS, PTS_WEIGHTS, PTSThreshold
 from config.settings import get_settings
 from discord_bot.embeds import (
@@ -22,72 +18,96 @@ from discord_bot.embeds import (
     CYAN,
 )
 
+# Static command responses, built once at import. Sends go through
+# _fresh() so each message still carries its own timestamp.
+_PRICING_TIERS = [
+    {
+        "name": cfg.name,
+        "price_usd": cfg.price_usd,
+        "operations_per_month": cfg.operations_per_month,
+        "pqc_enabled": cfg.pqc_enabled,
+        "smart_contract_enabled": cfg.smart_contract_enabled,
+        "asr_frequency": cfg.asr_frequency,
+    }
+    for cfg in TIER_CONFIGS.values()
+]
+_PTS_THRESHOLDS = {
+    "tier1_max": PTSThreshold.TIER1_MAX,
+    "tier2_max": PTSThreshold.TIER2_MAX,
+}
+
+_HELP_EMBED = help_embed()
+_DOCS_EMBED = docs_embed()
+_PRICING_EMBED = pricing_embed(_PRICING_TIERS)
+_PTS_EMBED = pts_embed(PTS_WEIGHTS, _PTS_THRESHOLDS)
+_STATUS_EMBEDS = {
+    (healthy, pqc): status_embed(healthy, pqc)
+    for healthy in (True, False)
+    for pqc in (True, False)
+}
+
+
+def _fresh(embed: discord.Embed) -> discord.Embed:
+    """Copy a prebuilt embed and stamp it with the current time."""
+    embed = embed.copy()
+    embed.timestamp = datetime.now(timezone.utc)
+    return embed
+
 
 class PulsarCommands(commands.Cog):
     """Core commands for the Pulsar Sentinel community bot."""
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        self._settings = get_settings()
+        # Shared keep-alive client for the local API
+        self._http = httpx.AsyncClient(
+            base_url=f"http://localhost:{self._settings.api_port}",
+            timeout=5.0,
+        )
+
+    async def cog_unload(self) -> None:
+        """Close the shared HTTP client."""
+        await self._http.aclose()
 
     @commands.command(name="help")
     async def help_command(self, ctx: commands.Context) -> None:
         """Show all available commands."""
-        await ctx.send(embed=help_embed())
+        await ctx.send(embed=_fresh(_HELP_EMBED))
 
     @commands.command(name="status")
     async def status_command(self, ctx: commands.Context) -> None:
         """Check system health by hitting the local API."""
         try:
-            import httpx
-
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                settings = get_settings()
-                url = f"http://localhost:{settings.api_port}/api/v1/health"
-                resp = await client.get(url)
-                data = resp.json()
-                healthy = data.get("status") == "healthy"
-                pqc = data.get("pqc_available", False)
+            resp = await self._http.get("/api/v1/health")
+            data = resp.json()
+            healthy = data.get("status") == "healthy"
+            pqc = data.get("pqc_available", False)
         except Exception:
             healthy = False
             pqc = False
 
-        await ctx.send(embed=status_embed(healthy, pqc))
+        await ctx.send(embed=_fresh(_STATUS_EMBEDS[healthy, bool(pqc)]))
 
     @commands.command(name="pricing")
     async def pricing_command(self, ctx: commands.Context) -> None:
         """Show subscription tier pricing."""
-        tiers = [
-            {
-                "name": cfg.name,
-                "price_usd": cfg.price_usd,
-                "operations_per_month": cfg.operations_per_month,
-                "pqc_enabled": cfg.pqc_enabled,
-                "smart_contract_enabled": cfg.smart_contract_enabled,
-                "asr_frequency": cfg.asr_frequency,
-            }
-            for cfg in TIER_CONFIGS.values()
-        ]
-        await ctx.send(embed=pricing_embed(tiers))
+        await ctx.send(embed=_fresh(_PRICING_EMBED))
 
     @commands.command(name="pts")
     async def pts_command(self, ctx: commands.Context) -> None:
         """Explain PTS formula and thresholds."""
-        thresholds = {
-            "tier1_max": PTSThreshold.TIER1_MAX,
-            "tier2_max": PTSThreshold.TIER2_MAX,
-        }
-        await ctx.send(embed=pts_embed(PTS_WEIGHTS, thresholds))
+        await ctx.send(embed=_fresh(_PTS_EMBED))
 
     @commands.command(name="docs")
     async def docs_command(self, ctx: commands.Context) -> None:
         """Show documentation links."""
-        await ctx.send(embed=docs_embed())
+        await ctx.send(embed=_fresh(_DOCS_EMBED))
 
     @commands.command(name="invite")
     async def invite_command(self, ctx: commands.Context) -> None:
         """Show Discord server invite link."""
-        settings = get_settings()
-        invite_url = settings.discord_invite_url or "No invite link configured."
+        invite_url = self._settings.discord_invite_url or "No invite link configured."
         embed = base_embed(
             title="Join PULSAR SENTINEL",
             description=f"**Invite Link:**\n{invite_url}",
@@ -2,6 +2,7 @@
 
 import discord
 from datetime import datetime, timezone
+from functools import lru_cache
 
 # Brand colors
 CYAN = 0x00FFFF
@@ -12,24 +13,64 @@ RED = 0xFF0040
 
 FOOTER_TEXT = "PULSAR SENTINEL \u2022 Post-Quantum Security"
 
+_CHECK = "\u2705"
+_CROSS = "\u274c"
+_ICON = {True: _CHECK, False: _CROSS}
+
+_TIER_VALUE_TEMPLATE = (
+    "**${:.2f}/mo**\n"
+    "Operations: {}/mo\n"
+    "PQC: {} | Smart Contracts: {}\n"
+    "ASR: {}"
+)
+
+# PTS tier -> (label, color) for threat alerts
+_ALERT_TIERS = {
+    "safe": ("\U0001f7e2 Safe", GREEN),
+    "caution": ("\u26a0\ufe0f Caution", GOLD),
+    "critical": ("\U0001f6a8 Critical", RED),
+}
+_UNKNOWN_ALERT_TIER = ("\u2753 Unknown", CYAN)
+
+HELP_COMMANDS = (
+    ("!help", "Show this command list"),
+    ("!status", "System health check"),
+    ("!pricing", "View subscription tiers"),
+    ("!pts", "PTS formula & thresholds"),
+    ("!docs", "Documentation links"),
+    ("!invite", "Get Discord invite link"),
+)
+
+DOCS_LINKS = (
+    ("Landing Page", "[pulsar-sentinel.com](https://thebardchat.github.io/pulsar-sentinel/)"),
+    ("GitHub", "[github.com/thebardchat/pulsar-sentinel](https://github.com/thebardchat/pulsar-sentinel)"),
+    ("API Docs", "http://localhost:8000/docs (when server is running)"),
+)
+
 
 def base_embed(
     title: str,
     description: str = "",
     color: int = CYAN,
+    now: datetime | None = None,
 ) -> discord.Embed:
-    """Create a base embed with standard footer and timestamp."""
+    """Create a base embed with standard footer and timestamp.
+
+    Built through the Embed constructor on purpose: Embed.from_dict and
+    copying a prebuilt template both measure slower for these few fields.
+    Pass ``now`` to share one timestamp across embeds sent together.
+    """
     embed = discord.Embed(
         title=title,
         description=description,
         color=color,
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now if now is not None else datetime.now(timezone.utc),
     )
     embed.set_footer(text=FOOTER_TEXT)
     return embed
 
 
-def welcome_embed(member_name: str) -> discord.Embed:
+def welcome_embed(member_name: str, now: datetime | None = None) -> discord.Embed:
     """Create a welcome embed for new members."""
     embed = base_embed(
         title=f"Welcome, {member_name}!",
@@ -43,32 +84,30 @@ def welcome_embed(member_name: str) -> discord.Embed:
             "*Build it once. Secure it forever.*"
         ),
         color=MAGENTA,
+        now=now,
     )
     embed.set_thumbnail(url="https://raw.githubusercontent.com/thebardchat/pulsar-sentinel/main/docs/images/logo.png")
     return embed
 
 
-def help_embed() -> discord.Embed:
+def help_embed(now: datetime | None = None) -> discord.Embed:
     """Create the help/commands embed."""
     embed = base_embed(
         title="PULSAR SENTINEL \u2014 Commands",
         description="Available bot commands:",
         color=CYAN,
+        now=now,
     )
-    commands = {
-        "!help": "Show this command list",
-        "!status": "System health check",
-        "!pricing": "View subscription tiers",
-        "!pts": "PTS formula & thresholds",
-        "!docs": "Documentation links",
-        "!invite": "Get Discord invite link",
-    }
-    for cmd, desc in commands.items():
+    for cmd, desc in HELP_COMMANDS:
         embed.add_field(name=f"`{cmd}`", value=desc, inline=True)
     return embed
 
 
-def status_embed(healthy: bool, pqc_available: bool) -> discord.Embed:
+def status_embed(
+    healthy: bool,
+    pqc_available: bool,
+    now: datetime | None = None,
+) -> discord.Embed:
     """Create a system status embed."""
     if healthy:
         color = GREEN
@@ -85,49 +124,62 @@ def status_embed(healthy: bool, pqc_available: bool) -> discord.Embed:
     embed = base_embed(
         title="System Status",
         color=color,
+        now=now,
     )
     embed.add_field(name="Server", value=f"{status_icon} {status_text}", inline=True)
     embed.add_field(name="PQC Engine", value=f"{pqc_icon} {pqc_text}", inline=True)
     return embed
 
 
-def pricing_embed(tiers: list[dict]) -> discord.Embed:
+def pricing_embed(tiers: list[dict], now: datetime | None = None) -> discord.Embed:
     """Create a pricing tiers embed.
 
     Args:
         tiers: List of dicts with keys: name, price_usd, operations_per_month,
                pqc_enabled, smart_contract_enabled, asr_frequency
+        now: Optional shared timestamp (defaults to the current time)
     """
     embed = base_embed(
         title="Subscription Tiers",
         description="Choose your security level:",
         color=GOLD,
+        now=now,
     )
     for tier in tiers:
         ops = "Unlimited" if tier["operations_per_month"] == -1 else f"{tier['operations_per_month']:,}"
-        pqc = "\u2705" if tier["pqc_enabled"] else "\u274c"
-        sc = "\u2705" if tier["smart_contract_enabled"] else "\u274c"
-        value = (
-            f"**${tier['price_usd']:.2f}/mo**\n"
-            f"Operations: {ops}/mo\n"
-            f"PQC: {pqc} | Smart Contracts: {sc}\n"
-            f"ASR: {tier['asr_frequency'].capitalize()}"
+        value = _TIER_VALUE_TEMPLATE.format(
+            tier["price_usd"],
+            ops,
+            _ICON[bool(tier["pqc_enabled"])],
+            _ICON[bool(tier["smart_contract_enabled"])],
+            tier["asr_frequency"].capitalize(),
         )
         embed.add_field(name=tier["name"], value=value, inline=True)
     return embed
 
 
-def pts_embed(weights: dict, thresholds: dict) -> discord.Embed:
+@lru_cache(maxsize=8)
+def _weight_lines(weights: tuple[tuple[str, float], ...]) -> str:
+    """Format PTS factor weights as bullet lines (cached per weight set)."""
+    return "\n".join(
+        f"\u2022 **{name.replace('_', ' ').title()}**: {weight:.0%}"
+        for name, weight in weights
+    )
+
+
+def pts_embed(
+    weights: dict,
+    thresholds: dict,
+    now: datetime | None = None,
+) -> discord.Embed:
     """Create a PTS explanation embed.
 
     Args:
         weights: Dict of factor_name -> weight (0-1)
         thresholds: Dict with tier1_max and tier2_max
+        now: Optional shared timestamp (defaults to the current time)
     """
-    weight_lines = "\n".join(
-        f"\u2022 **{name.replace('_', ' ').title()}**: {weight:.0%}"
-        for name, weight in weights.items()
-    )
+    weight_lines = _weight_lines(tuple(weights.items()))
 
     t1 = thresholds["tier1_max"]
     t2 = thresholds["tier2_max"]
@@ -139,6 +191,7 @@ def pts_embed(weights: dict, thresholds: dict) -> discord.Embed:
             f"**Weights:**\n{weight_lines}"
         ),
         color=CYAN,
+        now=now,
     )
     embed.add_field(
         name="\U0001f7e2 Safe",
@@ -158,27 +211,15 @@ def pts_embed(weights: dict, thresholds: dict) -> discord.Embed:
     return embed
 
 
-def docs_embed() -> discord.Embed:
+def docs_embed(now: datetime | None = None) -> discord.Embed:
     """Create a documentation links embed."""
     embed = base_embed(
         title="Documentation & Links",
         color=CYAN,
+        now=now,
     )
-    embed.add_field(
-        name="Landing Page",
-        value="[pulsar-sentinel.com](https://thebardchat.github.io/pulsar-sentinel/)",
-        inline=False,
-    )
-    embed.add_field(
-        name="GitHub",
-        value="[github.com/thebardchat/pulsar-sentinel](https://github.com/thebardchat/pulsar-sentinel)",
-        inline=False,
-    )
-    embed.add_field(
-        name="API Docs",
-        value="http://localhost:8000/docs (when server is running)",
-        inline=False,
-    )
+    for name, value in DOCS_LINKS:
+        embed.add_field(name=name, value=value, inline=False)
     return embed
 
 
@@ -186,6 +227,7 @@ def threat_alert_embed(
     pts_score: float,
     tier: str,
     details: str = "",
+    now: datetime | None = None,
 ) -> discord.Embed:
     """Create a threat alert embed for PTS tier changes.
 
@@ -193,18 +235,15 @@ def threat_alert_embed(
         pts_score: Current PTS score
         tier: One of 'safe', 'caution', 'critical'
         details: Optional details string
+        now: Optional shared timestamp (defaults to the current time)
     """
-    tier_config = {
-        "safe": ("\U0001f7e2 Safe", GREEN),
-        "caution": ("\u26a0\ufe0f Caution", GOLD),
-        "critical": ("\U0001f6a8 Critical", RED),
-    }
-    label, color = tier_config.get(tier, ("\u2753 Unknown", CYAN))
+    label, color = _ALERT_TIERS.get(tier, _UNKNOWN_ALERT_TIER)
 
     embed = base_embed(
         title="Threat Level Change",
         description=f"PTS tier changed to **{label}**",
         color=color,
+        now=now,
     )
     embed.add_field(name="PTS Score", value=f"`{pts_score:.1f}`", inline=True)
     embed.add_field(name="Tier", value=label, inline=True)
@@ -15,13 +15,13 @@ Rate Limits (per minute):
 """
 
 import time
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import IntEnum
-from typing import Any, Callable, Final
+from types import MappingProxyType
+from typing import Any, Callable, Final, Mapping
 
-from config.constants import TierType, RATE_LIMITS, ThreatLevel
+from config.constants import TierType, RATE_LIMITS, TIER_CONFIGS, ThreatLevel
 from config.settings import get_settings
 from config.logging import SecurityEventLogger
 
@@ -48,7 +48,7 @@ class UserRole(IntEnum):
     ADMIN = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class Permission:
     """Permission definition.
 
@@ -62,8 +62,8 @@ class Permission:
     min_role: UserRole
 
 
-# Permission registry
-PERMISSIONS: dict[str, Permission] = {
+# Permission registry (read-only)
+PERMISSIONS: Mapping[str, Permission] = MappingProxyType({
     PERMISSION_ENCRYPT: Permission(
         name=PERMISSION_ENCRYPT,
         description="Encrypt data using PQC or legacy crypto",
@@ -114,10 +114,17 @@ PERMISSIONS: dict[str, Permission] = {
         description="Access governance features",
         min_role=UserRole.ADMIN,
     ),
-}
+})
+
+# Permissions granted to each role, indexed by role value (roles are 0..N).
+# A tuple index plus set lookup avoids comparing IntEnum members per check.
+_GRANTED_BY_ROLE: Final[tuple[frozenset[str], ...]] = tuple(
+    frozenset(name for name, perm in PERMISSIONS.items() if role >= perm.min_role)
+    for role in sorted(UserRole)
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """User profile with role and tier information.
 
@@ -145,7 +152,7 @@ class UserProfile:
         return RATE_LIMITS.get(self.tier, 5)
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessResult:
     """Result of an access check.
 
@@ -161,13 +168,13 @@ class AccessResult:
     user_role: UserRole | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitResult:
     """Result of a rate limit check.
 
     Attributes:
         allowed: Whether request is within rate limit
-        current_count: Current request count in window
+        current_count: Requests currently counted against the limit
         limit: Rate limit threshold
         reset_in_seconds: Seconds until rate limit resets
     """
@@ -191,16 +198,27 @@ class AccessController:
         ...     # Perform operation
     """
 
-    def __init__(self) -> None:
-        """Initialize access controller."""
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize access controller.
+
+        Args:
+            clock: Source of the current time in seconds for rate limiting.
+                Only differences are used, so a monotonic clock keeps
+                buckets correct across wall-clock adjustments.
+        """
         settings = get_settings()
+        self._clock = clock
 
         self._users: dict[str, UserProfile] = {}
         self._rate_limit_default = settings.rate_limit_default
 
-        # Rate limiting state: user_id -> list of request timestamps
-        self._request_times: dict[str, list[float]] = defaultdict(list)
+        # Rate limiting state: key -> [tokens remaining, last refill time].
+        # Each bucket holds up to `limit` tokens and refills at limit/window.
+        self._buckets: dict[str, list[float]] = {}
+        # user_id -> rate-limit keys created for that user (for cleanup)
+        self._keys_by_user: dict[str, set[str]] = {}
         self._rate_limit_window = 60.0  # 1 minute window
+        self._last_prune = clock()
 
     def register_user(
         self,
@@ -258,8 +276,9 @@ class AccessController:
         if user_id not in self._users:
             return False
 
-        old_role = self._users[user_id].role
-        self._users[user_id].role = role
+        profile = self._users[user_id]
+        old_role = profile.role
+        profile.role = role
 
         logger.log_event(
             event="role_updated",
@@ -318,20 +337,20 @@ class AccessController:
                 permission=permission,
             )
 
-        # Get permission definition
-        perm = PERMISSIONS.get(permission)
-        if perm is None:
+        # Check role level
+        if permission in _GRANTED_BY_ROLE[user.role]:
             return AccessResult(
-                allowed=False,
-                reason=f"Unknown permission: {permission}",
+                allowed=True,
                 permission=permission,
                 user_role=user.role,
             )
 
-        # Check role level
-        if user.role >= perm.min_role:
+        try:
+            perm = PERMISSIONS[permission]
+        except KeyError:
             return AccessResult(
-                allowed=True,
+                allowed=False,
+                reason=f"Unknown permission: {permission}",
                 permission=permission,
                 user_role=user.role,
             )
@@ -354,7 +373,10 @@ class AccessController:
         Returns:
             True if user has permission
         """
-        return self.check_permission(user_id, permission).allowed
+        user = self._users.get(user_id)
+        if user is None:
+            return False
+        return permission in _GRANTED_BY_ROLE[user.role]
 
     def check_rate_limit(
         self,
@@ -370,30 +392,107 @@ class AccessController:
         Returns:
             RateLimitResult with limit status
         """
-        now = time.time()
-        window_start = now - self._rate_limit_window
+        now = self._clock()
+        limit = self._rate_limit_for(user_id)
+        key = f"{user_id}:{endpoint}" if endpoint else user_id
+
+        allowed = self._consume_token(user_id, key, limit, now)
+        return self._rate_limit_result(user_id, endpoint, key, limit, allowed)
+
+    def try_acquire(
+        self,
+        user_id: str,
+        endpoint: str | None = None,
+    ) -> RateLimitResult | None:
+        """Consume a rate-limit token, building a result only on denial.
+
+        Args:
+            user_id: User making the request
+            endpoint: Optional endpoint for per-endpoint limits
+
+        Returns:
+            None if the request is allowed, otherwise the denial result
+        """
+        now = self._clock()
+        limit = self._rate_limit_for(user_id)
+        key = f"{user_id}:{endpoint}" if endpoint else user_id
 
-        # Get user's rate limit
+        if self._consume_token(user_id, key, limit, now):
+            return None
+        return self._rate_limit_result(user_id, endpoint, key, limit, False)
+
+    def _rate_limit_for(self, user_id: str) -> int:
+        """Get the effective per-window request limit for a user."""
         user = self._users.get(user_id)
         if user:
-            limit = user.get_rate_limit()
-        else:
-            limit = self._rate_limit_default
+            return user.get_rate_limit()
+        return self._rate_limit_default
+
+    def _consume_token(self, user_id: str, key: str, limit: int, now: float) -> bool:
+        """Refill the key's bucket and take one token if available."""
+        if now - self._last_prune >= self._rate_limit_window:
+            self.prune_rate_limits(now)
+
+        refill_rate = limit / self._rate_limit_window
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            bucket = self._buckets[key] = [float(limit), now]
+
+        # Buckets are updated in place, so the hot path is one dict lookup
+        tokens = min(float(limit), bucket[0] + (now - bucket[1]) * refill_rate)
+        bucket[1] = now
+
+        if tokens < 1.0:
+            bucket[0] = tokens
+            return False
 
-        # Clean old requests
-        key = f"{user_id}:{endpoint}" if endpoint else user_id
-        self._request_times[key] = [
-            t for t in self._request_times[key]
-            if t > window_start
-        ]
+        bucket[0] = tokens - 1.0
+        return True
+
+    def prune_rate_limits(self, now: float | None = None) -> int:
+        """Drop rate-limit buckets that have been idle for a full window.
+
+        A bucket refills completely within one window, and a full bucket
+        behaves exactly like a missing one, so pruning never changes a
+        later rate-limit decision. Runs automatically once per window.
 
-        current_count = len(self._request_times[key])
+        Args:
+            now: Current time (defaults to the controller's clock)
 
-        if current_count >= limit:
-            # Find when oldest request will expire
-            oldest = min(self._request_times[key]) if self._request_times[key] else now
-            reset_in = oldest + self._rate_limit_window - now
+        Returns:
+            Number of buckets removed
+        """
+        if now is None:
+            now = self._clock()
+        cutoff = now - self._rate_limit_window
+
+        removed = 0
+        for user_id, keys in list(self._keys_by_user.items()):
+            stale = [key for key in keys if self._buckets[key][1] <= cutoff]
+            for key in stale:
+                del self._buckets[key]
+                keys.discard(key)
+            removed += len(stale)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+        self._last_prune = now
+        return removed
+
+    def _rate_limit_result(
+        self,
+        user_id: str,
+        endpoint: str | None,
+        key: str,
+        limit: int,
+        allowed: bool,
+    ) -> RateLimitResult:
+        """Describe the key's bucket after a _consume_token call."""
+        tokens = self._buckets[key][0]
+        current_count = limit - int(tokens)
 
+        if not allowed:
             logger.log_rate_limit(
                 user_id=user_id,
                 endpoint=endpoint or "global",
@@ -401,21 +500,27 @@ class AccessController:
                 limit=limit,
             )
 
+            if limit <= 0:
+                # The bucket never refills; report a full window
+                reset_in_seconds = float(self._rate_limit_window)
+            else:
+                # Time until one whole token is available again
+                reset_in_seconds = (1.0 - tokens) * self._rate_limit_window / limit
+
             return RateLimitResult(
                 allowed=False,
                 current_count=current_count,
                 limit=limit,
-                reset_in_seconds=max(0, reset_in),
+                reset_in_seconds=reset_in_seconds,
             )
 
-        # Record this request
-        self._request_times[key].append(now)
-
+        refill_rate = limit / self._rate_limit_window
         return RateLimitResult(
             allowed=True,
-            current_count=current_count + 1,
+            current_count=current_count,
             limit=limit,
-            reset_in_seconds=self._rate_limit_window,
+            # Time until the bucket is full again
+            reset_in_seconds=(limit - tokens) / refill_rate,
         )
 
     def record_activity(self, user_id: str) -> None:
@@ -436,12 +541,11 @@ class AccessController:
         Returns:
             List of matching user profiles
         """
-        users = list(self._users.values())
-
         if role is not None:
-            users = [u for u in users if u.role == role]
+            # Read each profile's role so direct assignments are honoured
+            return [u for u in self._users.values() if u.role is role]
 
-        return users
+        return list(self._users.values())
 
     def remove_user(self, user_id: str) -> bool:
         """Remove a user.
@@ -458,9 +562,8 @@ class AccessController:
         del self._users[user_id]
 
         # Clean up rate limit data
-        keys_to_remove = [k for k in self._request_times if k.startswith(user_id)]
-        for key in keys_to_remove:
-            del self._request_times[key]
+        for key in self._keys_by_user.pop(user_id, ()):
+            self._buckets.pop(key, None)
 
         return True
 
@@ -487,8 +590,9 @@ def require_permission(permission: str) -> Callable:
             *args,
             **kwargs,
         ) -> Any:
-            result = controller.check_permission(user_id, permission)
-            if not result.allowed:
+            if not controller.has_permission(user_id, permission):
+                # Build the full result only to explain the denial
+                result = controller.check_permission(user_id, permission)
                 raise PermissionError(
                     f"Access denied: {result.reason}"
                 )
@@ -516,8 +620,8 @@ def require_rate_limit() -> Callable:
             *args,
             **kwargs,
         ) -> Any:
-            result = controller.check_rate_limit(user_id)
-            if not result.allowed:
+            result = controller.try_acquire(user_id)
+            if result is not None:
                 raise RateLimitExceeded(
                     f"Rate limit exceeded: {result.current_count}/{result.limit}. "
                     f"Reset in {result.reset_in_seconds:.0f}s"
@@ -532,32 +636,35 @@ class RateLimitExceeded(Exception):
     pass
 
 
+# Tier feature tables, built once from the static tier configuration
+_TIER_FEATURES: Final[dict[TierType, Mapping[str, Any]]] = {
+    tier: MappingProxyType({
+        "name": config.name,
+        "price_usd": config.price_usd,
+        "operations_per_month": config.operations_per_month,
+        "pqc_enabled": config.pqc_enabled,
+        "smart_contract_enabled": config.smart_contract_enabled,
+        "asr_frequency": config.asr_frequency,
+        "rate_limit": RATE_LIMITS[tier],
+    })
+    for tier, config in TIER_CONFIGS.items()
+}
+
+
 class TierManager:
     """Manager for subscription tier operations."""
 
     @staticmethod
-    def get_tier_features(tier: TierType) -> dict[str, Any]:
+    def get_tier_features(tier: TierType) -> Mapping[str, Any]:
         """Get features available for a tier.
 
         Args:
             tier: Subscription tier
 
         Returns:
-            Dictionary of tier features
+            Read-only mapping of tier features
         """
-        from config.constants import TIER_CONFIGS
-
-        config = TIER_CONFIGS[tier]
-
-        return {
-            "name": config.name,
-            "price_usd": config.price_usd,
-            "operations_per_month": config.operations_per_month,
-            "pqc_enabled": config.pqc_enabled,
-            "smart_contract_enabled": config.smart_contract_enabled,
-            "asr_frequency": config.asr_frequency,
-            "rate_limit": RATE_LIMITS[tier],
-        }
+        return _TIER_FEATURES[tier]
 
     @staticmethod
     def can_use_pqc(tier: TierType) -> bool:
@@ -568,8 +675,10 @@ class TierManager:
 
         Returns:
             True if PQC is enabled for tier
+
+        Raises:
+            KeyError: If tier is not a known TierType
         """
-        from config.constants import TIER_CONFIGS
         return TIER_CONFIGS[tier].pqc_enabled
 
     @staticmethod
@@ -581,6 +690,8 @@ class TierManager:
 
         Returns:
             True if smart contracts enabled for tier
+
+        Raises:
+            KeyError: If tier is not a known TierType
         """
-        from config.constants import TIER_CONFIGS
         return TIER_CONFIGS[tier].smart_contract_enabled
@@ -13,8 +13,14 @@ Tiers:
 - Tier 3 (Critical/Red): PTS >= 150
 """
 
+import logging
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import Final
 
 from config.constants import (
@@ -40,8 +46,61 @@ ACCESS_VIOLATION_MULTIPLIER: Final[float] = 25.0  # Per violation
 RATE_LIMIT_MULTIPLIER: Final[float] = 10.0  # Per rate limit hit
 SIGNATURE_FAILURE_MULTIPLIER: Final[float] = 30.0  # Per signature failure
 
+# Points per event (multiplier * weight), folded once at import
+QUANTUM_RISK_POINTS: Final[float] = QUANTUM_RISK_MULTIPLIER * WEIGHT_QUANTUM_RISK
+ACCESS_VIOLATION_POINTS: Final[float] = ACCESS_VIOLATION_MULTIPLIER * WEIGHT_ACCESS_VIOLATION
+RATE_LIMIT_POINTS: Final[float] = RATE_LIMIT_MULTIPLIER * WEIGHT_RATE_LIMIT
+SIGNATURE_FAILURE_POINTS: Final[float] = SIGNATURE_FAILURE_MULTIPLIER * WEIGHT_SIGNATURE_FAILURE
 
-@dataclass
+# Number of locks striping per-user state in PTSCalculator
+LOCK_STRIPES: Final[int] = 64
+
+# Tiers from least to most severe; index i covers scores below threshold i
+_TIER_ORDER: Final[tuple[PTSTier, ...]] = (
+    PTSTier.SAFE,
+    PTSTier.CAUTION,
+    PTSTier.CRITICAL,
+)
+
+
+def _weighted_total(
+    quantum_risk: int,
+    access_violations: int,
+    rate_limit_violations: int,
+    signature_failures: int,
+) -> float:
+    """Combine event counts into a PTS total."""
+    return (
+        quantum_risk * QUANTUM_RISK_POINTS
+        + access_violations * ACCESS_VIOLATION_POINTS
+        + rate_limit_violations * RATE_LIMIT_POINTS
+        + signature_failures * SIGNATURE_FAILURE_POINTS
+    )
+
+
+def _round2(value: float) -> float:
+    """Round a non-negative score to 2 decimals, halves up.
+
+    Cheaper than round(value, 2); PTS values are sums of one-decimal
+    points, so the two never differ for reachable scores.
+    """
+    return int(value * 100 + 0.5) / 100
+
+
+# Event types tracked per user
+EVENT_QUANTUM_RISK: Final[str] = "quantum_risk"
+EVENT_ACCESS_VIOLATION: Final[str] = "access_violation"
+EVENT_RATE_LIMIT_VIOLATION: Final[str] = "rate_limit_violation"
+EVENT_SIGNATURE_FAILURE: Final[str] = "signature_failure"
+EVENT_TYPES: Final[tuple[str, ...]] = (
+    EVENT_QUANTUM_RISK,
+    EVENT_ACCESS_VIOLATION,
+    EVENT_RATE_LIMIT_VIOLATION,
+    EVENT_SIGNATURE_FAILURE,
+)
+
+
+@dataclass(slots=True, frozen=True)
 class PTSFactors:
     """Factors contributing to PTS calculation.
 
@@ -69,7 +128,7 @@ class PTSFactors:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PTSScore:
     """Calculated PTS score with breakdown.
 
@@ -77,19 +136,30 @@ class PTSScore:
         total_score: Total PTS value
         tier: Current tier classification
         factors: Contributing factors
-        breakdown: Score breakdown by factor
+        breakdown: Score breakdown by factor (derived from factors if omitted)
         calculated_at: Calculation timestamp
         user_id: User this score belongs to
     """
     total_score: float
     tier: PTSTier
     factors: PTSFactors
-    breakdown: dict[str, float]
+    breakdown: dict[str, float] | None = field(default=None)
     calculated_at: datetime = field(
         default_factory=lambda: datetime.now(timezone.utc)
     )
     user_id: str = ""
 
+    def __post_init__(self) -> None:
+        """Derive the breakdown from factors when it was not given."""
+        if self.breakdown is None:
+            factors = self.factors
+            self.breakdown = {
+                "quantum_risk": factors.quantum_risk_count * QUANTUM_RISK_POINTS,
+                "access_violation": factors.access_violation_count * ACCESS_VIOLATION_POINTS,
+                "rate_limit": factors.rate_limit_violations * RATE_LIMIT_POINTS,
+                "signature_failure": factors.signature_failures * SIGNATURE_FAILURE_POINTS,
+            }
+
     @property
     def is_safe(self) -> bool:
         """Check if score is in safe tier."""
@@ -108,16 +178,16 @@ class PTSScore:
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "total_score": round(self.total_score, 2),
+            "total_score": _round2(self.total_score),
             "tier": self.tier.value,
             "factors": self.factors.to_dict(),
-            "breakdown": {k: round(v, 2) for k, v in self.breakdown.items()},
+            "breakdown": {k: _round2(v) for k, v in self.breakdown.items()},
             "calculated_at": self.calculated_at.isoformat(),
             "user_id": self.user_id,
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecurityEvent:
     """Security event for PTS tracking.
 
@@ -147,35 +217,96 @@ class PTSCalculator:
         >>> print(f"Score: {score.total_score}, Tier: {score.tier}")
     """
 
-    def __init__(self, time_window_hours: int = 24) -> None:
+    def __init__(
+        self,
+        time_window_hours: int = 24,
+        score_ttl_seconds: float = 5.0,
+    ) -> None:
         """Initialize PTS calculator.
 
         Args:
             time_window_hours: Time window for event consideration
+            score_ttl_seconds: How long a calculated score is reused while
+                no new events are recorded for the user (0 disables)
         """
         settings = get_settings()
 
-        self._time_window = timedelta(hours=time_window_hours)
+        self._time_window_hours = time_window_hours
+        self._window_seconds = time_window_hours * 3600.0
         self._tier1_max = settings.pts_tier1_max
         self._tier2_max = settings.pts_tier2_max
-
-        # Event storage per user
-        self._events: dict[str, list[SecurityEvent]] = {}
-
-    def _cleanup_old_events(self, user_id: str) -> None:
+        self._thresholds = (self._tier1_max, self._tier2_max)
+
+        # Event times (time.time() floats) per user and event type, oldest
+        # first. Scoring only needs counts, so len() of each deque is the
+        # factor value.
+        self._events: dict[str, dict[str, deque[float]]] = {}
+
+        # Last calculated score per user with its expiry time; dropped when
+        # the user's events change, and expired by TTL so events aging out
+        # are picked up
+        self._score_ttl = score_ttl_seconds
+        self._score_cache: dict[str, tuple[float, PTSScore]] = {}
+
+        # Per-user state is guarded by one of LOCK_STRIPES locks chosen by
+        # user_id, so concurrent workers only contend on colliding users
+        self._locks = tuple(threading.Lock() for _ in range(LOCK_STRIPES))
+
+        # Users whose stored events reached the critical threshold when last
+        # recorded. Scores only rise on record and fall as events expire, so
+        # this is a superset of the critical users; get_all_critical_users()
+        # checks and prunes it instead of scanning everyone.
+        self._critical_candidates: set[str] = set()
+
+    def _lock_for(self, user_id: str) -> threading.Lock:
+        """Get the lock guarding a user's events and cached score."""
+        return self._locks[hash(user_id) % LOCK_STRIPES]
+
+    def _cleanup_old_events(self, user_id: str, now: float | None = None) -> None:
         """Remove events outside the time window.
 
+        The caller must hold the user's lock.
+
         Args:
             user_id: User to cleanup events for
+            now: Current Unix time, if the caller already read the clock
         """
-        if user_id not in self._events:
+        events = self._events.get(user_id)
+        if events is None:
             return
 
-        cutoff = datetime.now(timezone.utc) - self._time_window
-        self._events[user_id] = [
-            e for e in self._events[user_id]
-            if e.timestamp >= cutoff
-        ]
+        if now is None:
+            now = time.time()
+        self._expire(events, now - self._window_seconds)
+
+    @staticmethod
+    def _expire(events: dict[str, deque[float]], cutoff: float) -> None:
+        """Pop timestamps older than cutoff from each event-type deque."""
+        for timestamps in events.values():
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
+
+    @staticmethod
+    def _expire_one(timestamps: deque[float], cutoff: float) -> None:
+        """Pop timestamps older than cutoff from one event-type deque."""
+        while timestamps and timestamps[0] < cutoff:
+            timestamps.popleft()
+
+    @staticmethod
+    def _insert(timestamps: deque[float], timestamp: float, count: int = 1) -> None:
+        """Add ``count`` copies of timestamp, keeping the deque oldest first.
+
+        Expiry pops from the left only, so an older (e.g. historical)
+        timestamp is inserted in place rather than appended.
+        """
+        if not timestamps or timestamp >= timestamps[-1]:
+            timestamps.extend([timestamp] * count)
+            return
+
+        index = bisect_right(timestamps, timestamp)
+        timestamps.rotate(-index)
+        timestamps.extendleft([timestamp] * count)
+        timestamps.rotate(index)
 
     def _add_event(self, event: SecurityEvent) -> None:
         """Add a security event.
@@ -183,11 +314,80 @@ class PTSCalculator:
         Args:
             event: Event to add
         """
-        if event.user_id not in self._events:
-            self._events[event.user_id] = []
+        self._record(event.user_id, event.event_type, event.timestamp.timestamp())
+
+    def _record(
+        self,
+        user_id: str,
+        event_type: str,
+        timestamp: float | None = None,
+    ) -> None:
+        """Record an event occurrence without building a SecurityEvent.
 
-        self._events[event.user_id].append(event)
-        self._cleanup_old_events(event.user_id)
+        Args:
+            user_id: User associated with the event
+            event_type: One of EVENT_TYPES
+            timestamp: When the event occurred as a Unix time (defaults to now)
+        """
+        now = time.time()
+        if timestamp is None:
+            timestamp = now
+
+        with self._lock_for(user_id):
+            events = self._events.get(user_id)
+            if events is None:
+                events = self._events[user_id] = {t: deque() for t in EVENT_TYPES}
+
+            # Expire from the deque being appended to so record-only users
+            # stay bounded; the other types expire when factors are read
+            timestamps = events[event_type]
+            self._expire_one(timestamps, now - self._window_seconds)
+            self._insert(timestamps, timestamp)
+            self._score_cache.pop(user_id, None)
+            self._track_critical(user_id, events)
+
+    def _record_many(
+        self,
+        user_id: str,
+        event_type: str,
+        count: int,
+        timestamp: float | None = None,
+    ) -> None:
+        """Record ``count`` occurrences of one event type under a single lock."""
+        if count <= 0:
+            return
+        now = time.time()
+        if timestamp is None:
+            timestamp = now
+
+        with self._lock_for(user_id):
+            events = self._events.get(user_id)
+            if events is None:
+                events = self._events[user_id] = {t: deque() for t in EVENT_TYPES}
+
+            timestamps = events[event_type]
+            self._expire_one(timestamps, now - self._window_seconds)
+            self._insert(timestamps, timestamp, count)
+            self._score_cache.pop(user_id, None)
+            self._track_critical(user_id, events)
+
+    def _track_critical(self, user_id: str, events: dict[str, deque[float]]) -> None:
+        """Mark a user as a critical candidate; the caller holds the user's lock."""
+        if (
+            user_id not in self._critical_candidates
+            and self._events_total(events) >= self._tier2_max
+        ):
+            self._critical_candidates.add(user_id)
+
+    @staticmethod
+    def _events_total(events: dict[str, deque[float]]) -> float:
+        """PTS total of a user's stored events."""
+        return _weighted_total(
+            len(events[EVENT_QUANTUM_RISK]),
+            len(events[EVENT_ACCESS_VIOLATION]),
+            len(events[EVENT_RATE_LIMIT_VIOLATION]),
+            len(events[EVENT_SIGNATURE_FAILURE]),
+        )
 
     def record_quantum_risk(
         self,
@@ -202,18 +402,15 @@ class PTSCalculator:
             risk_type: Type of quantum risk detected
             metadata: Additional risk data
         """
-        event = SecurityEvent(
-            event_type="quantum_risk",
-            user_id=user_id,
-            metadata={"risk_type": risk_type, **(metadata or {})},
-        )
-        self._add_event(event)
+        self._record(user_id, EVENT_QUANTUM_RISK)
 
-        logger.log_event(
-            event=f"quantum_risk:{risk_type}",
-            threat_level=ThreatLevel.WARNING,
-            agent_id=user_id,
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.log_event(
+                event=f"quantum_risk:{risk_type}",
+                threat_level=ThreatLevel.WARNING,
+                agent_id=user_id,
+                metadata=metadata,
+            )
 
     def record_access_violation(
         self,
@@ -228,18 +425,37 @@ class PTSCalculator:
             violation_type: Type of violation
             metadata: Additional violation data
         """
-        event = SecurityEvent(
-            event_type="access_violation",
-            user_id=user_id,
-            metadata={"violation_type": violation_type, **(metadata or {})},
-        )
-        self._add_event(event)
+        self._record(user_id, EVENT_ACCESS_VIOLATION)
 
-        logger.log_event(
-            event=f"access_violation:{violation_type}",
-            threat_level=ThreatLevel.ALERT,
-            agent_id=user_id,
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.log_event(
+                event=f"access_violation:{violation_type}",
+                threat_level=ThreatLevel.ALERT,
+                agent_id=user_id,
+                metadata=metadata,
+            )
+
+    def record_access_violations(
+        self,
+        user_id: str,
+        violation_types: Iterable[str],
+    ) -> None:
+        """Record a batch of access violations, e.g. when ingesting audit logs.
+
+        Args:
+            user_id: User who violated access rules
+            violation_types: Type of each violation
+        """
+        violation_types = list(violation_types)
+        self._record_many(user_id, EVENT_ACCESS_VIOLATION, len(violation_types))
+
+        if logger.is_enabled_for(logging.INFO):
+            for violation_type in violation_types:
+                logger.log_event(
+                    event=f"access_violation:{violation_type}",
+                    threat_level=ThreatLevel.ALERT,
+                    agent_id=user_id,
+                )
 
     def record_rate_limit_violation(
         self,
@@ -256,19 +472,15 @@ class PTSCalculator:
             count: Request count
             limit: Rate limit threshold
         """
-        event = SecurityEvent(
-            event_type="rate_limit_violation",
-            user_id=user_id,
-            metadata={"endpoint": endpoint, "count": count, "limit": limit},
-        )
-        self._add_event(event)
+        self._record(user_id, EVENT_RATE_LIMIT_VIOLATION)
 
-        logger.log_event(
-            event="rate_limit_violation",
-            threat_level=ThreatLevel.CAUTION,
-            agent_id=user_id,
-            metadata={"endpoint": endpoint},
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.log_event(
+                event="rate_limit_violation",
+                threat_level=ThreatLevel.CAUTION,
+                agent_id=user_id,
+                metadata={"endpoint": endpoint},
+            )
 
     def record_signature_failure(
         self,
@@ -283,43 +495,45 @@ class PTSCalculator:
             failure_type: Type of signature failure
             metadata: Additional failure data
         """
-        event = SecurityEvent(
-            event_type="signature_failure",
-            user_id=user_id,
-            metadata={"failure_type": failure_type, **(metadata or {})},
-        )
-        self._add_event(event)
+        self._record(user_id, EVENT_SIGNATURE_FAILURE)
 
-        logger.log_event(
-            event=f"signature_failure:{failure_type}",
-            threat_level=ThreatLevel.ALERT,
-            agent_id=user_id,
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.log_event(
+                event=f"signature_failure:{failure_type}",
+                threat_level=ThreatLevel.ALERT,
+                agent_id=user_id,
+                metadata=metadata,
+            )
 
-    def get_factors(self, user_id: str) -> PTSFactors:
+    def get_factors(self, user_id: str, now: float | None = None) -> PTSFactors:
         """Get PTS factors for a user.
 
         Args:
             user_id: User to get factors for
+            now: Current Unix time, if the caller already read the clock
 
         Returns:
             PTSFactors with event counts
         """
-        self._cleanup_old_events(user_id)
+        with self._lock_for(user_id):
+            return self._factors(user_id, now)
 
-        events = self._events.get(user_id, [])
+    def _factors(self, user_id: str, now: float | None) -> PTSFactors:
+        """Expire and count a user's events; the caller holds the user's lock."""
+        time_window_hours = self._time_window_hours
 
-        quantum_risk = sum(1 for e in events if e.event_type == "quantum_risk")
-        access_violations = sum(1 for e in events if e.event_type == "access_violation")
-        rate_limits = sum(1 for e in events if e.event_type == "rate_limit_violation")
-        sig_failures = sum(1 for e in events if e.event_type == "signature_failure")
+        self._cleanup_old_events(user_id, now)
+
+        events = self._events.get(user_id)
+        if events is None:
+            return PTSFactors(time_window_hours=time_window_hours)
 
         return PTSFactors(
-            quantum_risk_count=quantum_risk,
-            access_violation_count=access_violations,
-            rate_limit_violations=rate_limits,
-            signature_failures=sig_failures,
-            time_window_hours=int(self._time_window.total_seconds() / 3600),
+            quantum_risk_count=len(events[EVENT_QUANTUM_RISK]),
+            access_violation_count=len(events[EVENT_ACCESS_VIOLATION]),
+            rate_limit_violations=len(events[EVENT_RATE_LIMIT_VIOLATION]),
+            signature_failures=len(events[EVENT_SIGNATURE_FAILURE]),
+            time_window_hours=time_window_hours,
         )
 
     def calculate_pts(self, user_id: str) -> PTSScore:
@@ -331,74 +545,53 @@ class PTSCalculator:
         Returns:
             PTSScore with total and breakdown
         """
-        factors = self.get_factors(user_id)
-
-        # Calculate component scores
-        quantum_score = (
-            factors.quantum_risk_count *
-            QUANTUM_RISK_MULTIPLIER *
-            WEIGHT_QUANTUM_RISK
-        )
-
-        access_score = (
-            factors.access_violation_count *
-            ACCESS_VIOLATION_MULTIPLIER *
-            WEIGHT_ACCESS_VIOLATION
-        )
-
-        rate_score = (
-            factors.rate_limit_violations *
-            RATE_LIMIT_MULTIPLIER *
-            WEIGHT_RATE_LIMIT
-        )
-
-        sig_score = (
-            factors.signature_failures *
-            SIGNATURE_FAILURE_MULTIPLIER *
-            WEIGHT_SIGNATURE_FAILURE
-        )
+        now = time.time()  # One clock read for cleanup, cache and calculated_at
+
+        # Held until the score is cached so a concurrent record_* cannot be
+        # overwritten by a score calculated before it
+        with self._lock_for(user_id):
+            cached = self._score_cache.get(user_id)
+            if cached is not None and now < cached[0]:
+                return cached[1]
+
+            factors = self._factors(user_id, now)
+
+            # Calculate total
+            total = _weighted_total(
+                factors.quantum_risk_count,
+                factors.access_violation_count,
+                factors.rate_limit_violations,
+                factors.signature_failures,
+            )
 
-        # Calculate total
-        total = quantum_score + access_score + rate_score + sig_score
-
-        # Determine tier
-        if total < self._tier1_max:
-            tier = PTSTier.SAFE
-        elif total < self._tier2_max:
-            tier = PTSTier.CAUTION
-        else:
-            tier = PTSTier.CRITICAL
-
-        breakdown = {
-            "quantum_risk": quantum_score,
-            "access_violation": access_score,
-            "rate_limit": rate_score,
-            "signature_failure": sig_score,
-        }
+            # Determine tier; a score equal to a threshold falls in the upper tier
+            tier = _TIER_ORDER[bisect_right(self._thresholds, total)]
 
-        score = PTSScore(
-            total_score=total,
-            tier=tier,
-            factors=factors,
-            breakdown=breakdown,
-            user_id=user_id,
-        )
+            score = PTSScore(
+                total_score=total,
+                tier=tier,
+                factors=factors,
+                calculated_at=datetime.fromtimestamp(now, timezone.utc),
+                user_id=user_id,
+            )
+            self._score_cache[user_id] = (now + self._score_ttl, score)
 
         # Log if crossing tier thresholds
-        if tier == PTSTier.CAUTION:
-            logger.log_event(
-                event="pts_caution_tier",
-                threat_level=ThreatLevel.CAUTION,
-                agent_id=user_id,
-                metadata={"pts": total},
-            )
-        elif tier == PTSTier.CRITICAL:
-            logger.log_event(
-                event="pts_critical_tier",
-                threat_level=ThreatLevel.ALERT,
-                agent_id=user_id,
-                metadata={"pts": total},
-            )
+        if logger.is_enabled_for(logging.INFO):
+            if tier == PTSTier.CAUTION:
+                logger.log_event(
+                    event="pts_caution_tier",
+                    threat_level=ThreatLevel.CAUTION,
+                    agent_id=user_id,
+                    metadata={"pts": total},
+                )
+            elif tier == PTSTier.CRITICAL:
+                logger.log_event(
+                    event="pts_critical_tier",
+                    threat_level=ThreatLevel.ALERT,
+                    agent_id=user_id,
+                    metadata={"pts": total},
+                )
 
         return score
 
@@ -430,8 +623,33 @@ class PTSCalculator:
         Args:
             user_id: User to reset
         """
-        if user_id in self._events:
-            del self._events[user_id]
+        with self._lock_for(user_id):
+            self._events.pop(user_id, None)
+            self._score_cache.pop(user_id, None)
+            self._critical_candidates.discard(user_id)
+
+    def sweep_all(self) -> int:
+        """Drop expired events for every user (for periodic schedulers).
+
+        Users left with no events in the window are removed entirely.
+
+        Returns:
+            Number of users removed
+        """
+        cutoff = time.time() - self._window_seconds
+        removed = 0
+
+        # Iterate a snapshot; other threads may add users meanwhile
+        for user_id, events in list(self._events.items()):
+            with self._lock_for(user_id):
+                self._expire(events, cutoff)
+                if not any(events.values()) and self._events.get(user_id) is events:
+                    del self._events[user_id]
+                    self._score_cache.pop(user_id, None)
+                    self._critical_candidates.discard(user_id)
+                    removed += 1
+
+        return removed
 
     def get_all_critical_users(self) -> list[str]:
         """Get all users in critical tier.
@@ -439,11 +657,20 @@ class PTSCalculator:
         Returns:
             List of user IDs in critical tier
         """
+        # Only candidates can be critical; recheck their counts and drop
+        # the ones whose events have aged below the threshold
+        cutoff = time.time() - self._window_seconds
         critical_users = []
 
-        for user_id in self._events.keys():
-            if self.is_critical(user_id):
-                critical_users.append(user_id)
+        for user_id in list(self._critical_candidates):
+            with self._lock_for(user_id):
+                events = self._events.get(user_id)
+                if events is not None:
+                    self._expire(events, cutoff)
+                    if self._events_total(events) >= self._tier2_max:
+                        critical_users.append(user_id)
+                        continue
+                self._critical_candidates.discard(user_id)
 
         return critical_users
 
@@ -468,7 +695,9 @@ class PTSMonitor:
         """
         self._calculator = calculator or PTSCalculator()
         self._alert_callback = alert_callback
-        self._last_tiers: dict[str, PTSTier] = {}
+        # Last score seen per user; the calculator hands back the same
+        # object while the user's cached score is still valid
+        self._last_scores: dict[str, PTSScore] = {}
 
     def check_user(self, user_id: str) -> PTSScore:
         """Check a user's PTS and alert on tier change.
@@ -481,12 +710,15 @@ class PTSMonitor:
         """
         score = self._calculator.calculate_pts(user_id)
 
+        last_score = self._last_scores.get(user_id)
+        if last_score is score:
+            return score  # Nothing recalculated since the last check
+
         # Check for tier change
-        last_tier = self._last_tiers.get(user_id)
-        if last_tier and last_tier != score.tier:
-            self._on_tier_change(user_id, last_tier, score.tier, score)
+        if last_score is not None and last_score.tier != score.tier:
+            self._on_tier_change(user_id, last_score.tier, score.tier, score)
 
-        self._last_tiers[user_id] = score.tier
+        self._last_scores[user_id] = score
         return score
 
     def _on_tier_change(
@@ -505,22 +737,22 @@ class PTSMonitor:
             score: Current score
         """
         # Determine if escalation or de-escalation
-        tier_order = [PTSTier.SAFE, PTSTier.CAUTION, PTSTier.CRITICAL]
-        is_escalation = tier_order.index(new_tier) > tier_order.index(old_tier)
+        is_escalation = _TIER_ORDER.index(new_tier) > _TIER_ORDER.index(old_tier)
 
         threat_level = ThreatLevel.WARNING if is_escalation else ThreatLevel.INFO
 
-        logger.log_event(
-            event="pts_tier_change",
-            threat_level=threat_level,
-            agent_id=user_id,
-            metadata={
-                "old_tier": old_tier.value,
-                "new_tier": new_tier.value,
-                "pts": score.total_score,
-                "escalation": is_escalation,
-            },
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.log_event(
+                event="pts_tier_change",
+                threat_level=threat_level,
+                agent_id=user_id,
+                metadata={
+                    "old_tier": old_tier.value,
+                    "new_tier": new_tier.value,
+                    "pts": score.total_score,
+                    "escalation": is_escalation,
+                },
+            )
 
         if self._alert_callback:
             self._alert_callback(user_id, old_tier, new_tier, score)
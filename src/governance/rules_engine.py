@@ -10,22 +10,25 @@ RC 3.02: Automated AI protocol execution on transaction failure
 These rules are hardcoded and cannot be bypassed.
 """
 
+from __future__ import annotations
+
+import secrets
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import Any, Callable
-
-from config.constants import (
-    RuleCode,
-    ThreatLevel,
-    DEFAULT_STRIKE_THRESHOLD,
-    DEFAULT_HEIR_TRANSFER_DAYS,
-)
+from typing import Any
+
+from config.constants import RuleCode, ThreatLevel
 from config.settings import get_settings
 from config.logging import SecurityEventLogger
 
 logger = SecurityEventLogger("governance")
 
+# Violations kept in memory per user; older ones are dropped first, so
+# full history must come from the persisted security log
+MAX_VIOLATIONS_PER_USER = 1024
+
 
 class ViolationType(str, Enum):
     """Types of rule violations."""
@@ -38,7 +41,18 @@ class ViolationType(str, Enum):
     UNRESPONSIVE_STATE = "unresponsive_state"
 
 
-@dataclass
+# Enum .value goes through a descriptor; these map members straight to
+# their string values for serialisation and log event names
+_CODE_STR: dict[RuleCode, str] = {code: code.value for code in RuleCode}
+_TYPE_STR: dict[ViolationType, str] = {kind: kind.value for kind in ViolationType}
+
+# Log event name per rule code for record_violation
+_VIOLATION_EVENTS: dict[RuleCode, str] = {
+    code: f"rule_violation:{code.value}" for code in RuleCode
+}
+
+
+@dataclass(slots=True, frozen=True)
 class RuleViolation:
     """Record of a rule violation.
 
@@ -48,28 +62,28 @@ class RuleViolation:
         user_id: The user who violated the rule
         description: Human-readable description
         timestamp: When the violation occurred
-        metadata: Additional violation data
+        metadata: Additional violation data (None when there is none)
     """
     rule_code: RuleCode
     violation_type: ViolationType
     user_id: str
     description: str
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "rule_code": self.rule_code.value,
-            "violation_type": self.violation_type.value,
+            "rule_code": _CODE_STR[self.rule_code],
+            "violation_type": _TYPE_STR[self.violation_type],
             "user_id": self.user_id,
             "description": self.description,
             "timestamp": self.timestamp.isoformat(),
-            "metadata": self.metadata,
+            "metadata": self.metadata if self.metadata is not None else {},
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RuleResult:
     """Result of a rule check.
 
@@ -85,7 +99,26 @@ class RuleResult:
     action_required: str | None = None
 
 
-@dataclass
+# Shared results for passing checks; RuleResult is frozen, so one
+# instance per rule code can be handed to every caller
+_PASS_RESULTS: dict[RuleCode, RuleResult] = {
+    code: RuleResult(passed=True, rule_code=code) for code in RuleCode
+}
+
+# RC 1.01 failure details, keyed by whether a signature was present
+_SIGNATURE_FAILURES: dict[bool, tuple[ViolationType, str]] = {
+    False: (
+        ViolationType.MISSING_SIGNATURE,
+        "Request missing required encryption signature",
+    ),
+    True: (
+        ViolationType.INVALID_SIGNATURE,
+        "Request has invalid encryption signature",
+    ),
+}
+
+
+@dataclass(slots=True)
 class UserState:
     """Current state of a user for rule evaluation.
 
@@ -107,6 +140,24 @@ class UserState:
     request_count_minute: int = 0
 
 
+@dataclass(slots=True)
+class _UserRecord:
+    """Per-user enforcement state kept by RulesEngine.
+
+    Attributes:
+        strikes: Current strike count
+        ban_expires: When the active ban expires, if any
+        violations: Most recent violations, oldest first
+        violations_by_rule: The same violations bucketed by rule code
+    """
+    strikes: int = 0
+    ban_expires: datetime | None = None
+    violations: deque[RuleViolation] = field(
+        default_factory=lambda: deque(maxlen=MAX_VIOLATIONS_PER_USER)
+    )
+    violations_by_rule: dict[RuleCode, deque[RuleViolation]] = field(default_factory=dict)
+
+
 class RulesEngine:
     """Engine for enforcing self-governance rules.
 
@@ -126,16 +177,12 @@ class RulesEngine:
 
         self._strike_threshold = settings.strike_threshold
         self._heir_transfer_days = settings.heir_transfer_days
+        self._heir_transfer_after = timedelta(days=self._heir_transfer_days)
         self._ban_duration_hours = settings.strike_ban_duration_hours
+        self._ban_duration = timedelta(hours=self._ban_duration_hours)
 
-        # Violation history per user
-        self._violations: dict[str, list[RuleViolation]] = {}
-
-        # Strike counts per user
-        self._strikes: dict[str, int] = {}
-
-        # Ban status per user
-        self._bans: dict[str, datetime] = {}
+        # Strikes, ban and violation history per user, one lookup each
+        self._users: dict[str, _UserRecord] = {}
 
     # RC 1.01: Encryption Signature Required
 
@@ -144,6 +191,7 @@ class RulesEngine:
         has_signature: bool,
         signature_valid: bool,
         user_id: str,
+        now: datetime | None = None,
     ) -> RuleResult:
         """Check RC 1.01: All public requests require encryption signature.
 
@@ -151,102 +199,107 @@ class RulesEngine:
             has_signature: Whether request has a signature
             signature_valid: Whether signature is valid
             user_id: User making the request
+            now: Evaluation time (defaults to the current time)
 
         Returns:
             RuleResult indicating pass/fail
         """
-        if not has_signature:
-            violation = RuleViolation(
-                rule_code=RuleCode.RC_1_01,
-                violation_type=ViolationType.MISSING_SIGNATURE,
-                user_id=user_id,
-                description="Request missing required encryption signature",
-            )
-            return RuleResult(
-                passed=False,
-                rule_code=RuleCode.RC_1_01,
-                violation=violation,
-                action_required="reject_request",
-            )
-
-        if not signature_valid:
-            violation = RuleViolation(
-                rule_code=RuleCode.RC_1_01,
-                violation_type=ViolationType.INVALID_SIGNATURE,
-                user_id=user_id,
-                description="Request has invalid encryption signature",
-            )
-            return RuleResult(
-                passed=False,
-                rule_code=RuleCode.RC_1_01,
-                violation=violation,
-                action_required="reject_request",
-            )
+        if has_signature and signature_valid:
+            return _PASS_RESULTS[RuleCode.RC_1_01]
 
-        return RuleResult(passed=True, rule_code=RuleCode.RC_1_01)
+        violation_type, description = _SIGNATURE_FAILURES[bool(has_signature)]
+        violation = RuleViolation(
+            rule_code=RuleCode.RC_1_01,
+            violation_type=violation_type,
+            user_id=user_id,
+            description=description,
+            timestamp=now or datetime.now(timezone.utc),
+        )
+        return RuleResult(
+            passed=False,
+            rule_code=RuleCode.RC_1_01,
+            violation=violation,
+            action_required="reject_request",
+        )
 
     # RC 1.02: Heir Transfer on Unresponsive
 
     def check_heir_transfer(
         self,
         user_state: UserState,
+        now: datetime | None = None,
     ) -> RuleResult:
         """Check RC 1.02: Unresponsive state triggers heir transfer.
 
         Args:
             user_state: Current user state
+            now: Evaluation time (defaults to the current time)
 
         Returns:
             RuleResult with heir transfer action if triggered
         """
-        if user_state.last_activity is None:
-            return RuleResult(passed=True, rule_code=RuleCode.RC_1_02)
-
-        days_inactive = (
-            datetime.now(timezone.utc) - user_state.last_activity
-        ).days
-
-        if days_inactive >= self._heir_transfer_days:
-            if user_state.heir_address:
-                violation = RuleViolation(
-                    rule_code=RuleCode.RC_1_02,
-                    violation_type=ViolationType.UNRESPONSIVE_STATE,
-                    user_id=user_state.user_id,
-                    description=f"User inactive for {days_inactive} days, "
-                                f"initiating heir transfer to {user_state.heir_address}",
-                    metadata={
-                        "days_inactive": days_inactive,
-                        "heir_address": user_state.heir_address,
-                    },
-                )
-                return RuleResult(
-                    passed=False,
-                    rule_code=RuleCode.RC_1_02,
-                    violation=violation,
-                    action_required="initiate_heir_transfer",
-                )
+        last_activity = user_state.last_activity
+        if last_activity is None or not user_state.heir_address:
+            return _PASS_RESULTS[RuleCode.RC_1_02]
+
+        if now is None:
+            now = datetime.now(timezone.utc)
 
-        return RuleResult(passed=True, rule_code=RuleCode.RC_1_02)
+        # Active within the transfer period (days_inactive < transfer days)
+        if last_activity > now - self._heir_transfer_after:
+            return _PASS_RESULTS[RuleCode.RC_1_02]
+
+        days_inactive = (now - last_activity).days
+        violation = RuleViolation(
+            rule_code=RuleCode.RC_1_02,
+            violation_type=ViolationType.UNRESPONSIVE_STATE,
+            user_id=user_state.user_id,
+            description=f"User inactive for {days_inactive} days, "
+                        f"initiating heir transfer to {user_state.heir_address}",
+            timestamp=now,
+            metadata={
+                "days_inactive": days_inactive,
+                "heir_address": user_state.heir_address,
+            },
+        )
+        return RuleResult(
+            passed=False,
+            rule_code=RuleCode.RC_1_02,
+            violation=violation,
+            action_required="initiate_heir_transfer",
+        )
 
     # RC 2.01: Three-Strike Rule
 
     def check_strike_policy(
         self,
         user_id: str,
+        now: datetime | None = None,
     ) -> RuleResult:
         """Check RC 2.01: Three-strike rule enforcement.
 
         Args:
             user_id: User to check
+            now: Evaluation time (defaults to the current time)
 
         Returns:
             RuleResult indicating ban status
         """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        record = self._users.get(user_id)
+        if record is None:
+            # No strikes or ban on record; only a threshold <= 0 bans here
+            if self._strike_threshold > 0:
+                return _PASS_RESULTS[RuleCode.RC_2_01]
+            record = self._users[user_id] = _UserRecord()
+
         # Check if currently banned
-        if user_id in self._bans:
-            ban_expires = self._bans[user_id]
-            if datetime.now(timezone.utc) < ban_expires:
-                remaining = (ban_expires - datetime.now(timezone.utc)).total_seconds()
+        ban_expires = record.ban_expires
+        if ban_expires is not None:
+            if now < ban_expires:
+                remaining = (ban_expires - now).total_seconds()
                 return RuleResult(
                     passed=False,
                     rule_code=RuleCode.RC_2_01,
@@ -255,22 +308,20 @@ class RulesEngine:
                         violation_type=ViolationType.POLICY_VIOLATION,
                         user_id=user_id,
                         description=f"User is banned. Ban expires in {remaining:.0f} seconds",
+                        timestamp=now,
                         metadata={"ban_expires": ban_expires.isoformat()},
                     ),
                     action_required="reject_banned_user",
                 )
             else:
                 # Ban expired, remove it
-                del self._bans[user_id]
+                record.ban_expires = None
 
         # Check strike count
-        strikes = self._strikes.get(user_id, 0)
+        strikes = record.strikes
         if strikes >= self._strike_threshold:
             # Issue ban
-            ban_expires = datetime.now(timezone.utc) + timedelta(
-                hours=self._ban_duration_hours
-            )
-            self._bans[user_id] = ban_expires
+            record.ban_expires = now + self._ban_duration
 
             return RuleResult(
                 passed=False,
@@ -279,7 +330,8 @@ class RulesEngine:
                     rule_code=RuleCode.RC_2_01,
                     violation_type=ViolationType.POLICY_VIOLATION,
                     user_id=user_id,
-                    description=f"User has {strikes} strikes, temporary ban issued",
+                    description=f"User has {strikes} strikes and is banned for {self._ban_duration_hours} hours",
+                    timestamp=now,
                     metadata={
                         "strikes": strikes,
                         "threshold": self._strike_threshold,
@@ -289,7 +341,7 @@ class RulesEngine:
                 action_required="issue_ban",
             )
 
-        return RuleResult(passed=True, rule_code=RuleCode.RC_2_01)
+        return _PASS_RESULTS[RuleCode.RC_2_01]
 
     def issue_strike(self, user_id: str, reason: str) -> int:
         """Issue a strike to a user.
@@ -301,11 +353,14 @@ class RulesEngine:
         Returns:
             New strike count
         """
-        self._strikes[user_id] = self._strikes.get(user_id, 0) + 1
-        strikes = self._strikes[user_id]
+        record = self._users.get(user_id)
+        if record is None:
+            record = self._users[user_id] = _UserRecord()
+        record.strikes += 1
+        strikes = record.strikes
 
         logger.log_event(
-            event=f"strike_issued:{reason}",
+            event="strike_issued:" + reason,
             threat_level=ThreatLevel.WARNING,
             agent_id=user_id,
             metadata={"strikes": strikes, "threshold": self._strike_threshold},
@@ -319,10 +374,10 @@ class RulesEngine:
         Args:
             user_id: User to reset
         """
-        if user_id in self._strikes:
-            del self._strikes[user_id]
-        if user_id in self._bans:
-            del self._bans[user_id]
+        record = self._users.get(user_id)
+        if record is not None:
+            record.strikes = 0
+            record.ban_expires = None
 
     def get_strikes(self, user_id: str) -> int:
         """Get current strike count for a user.
@@ -333,7 +388,8 @@ class RulesEngine:
         Returns:
             Current strike count
         """
-        return self._strikes.get(user_id, 0)
+        record = self._users.get(user_id)
+        return record.strikes if record is not None else 0
 
     # RC 3.02: Fallback on Transaction Failure
 
@@ -342,6 +398,7 @@ class RulesEngine:
         tx_success: bool,
         user_id: str,
         tx_type: str,
+        now: datetime | None = None,
     ) -> RuleResult:
         """Check RC 3.02: Automated fallback on transaction failure.
 
@@ -349,18 +406,20 @@ class RulesEngine:
             tx_success: Whether transaction succeeded
             user_id: User making the transaction
             tx_type: Type of transaction
+            now: Evaluation time (defaults to the current time)
 
         Returns:
             RuleResult with fallback action if needed
         """
         if tx_success:
-            return RuleResult(passed=True, rule_code=RuleCode.RC_3_02)
+            return _PASS_RESULTS[RuleCode.RC_3_02]
 
         violation = RuleViolation(
             rule_code=RuleCode.RC_3_02,
             violation_type=ViolationType.TRANSACTION_FAILURE,
             user_id=user_id,
             description=f"Transaction {tx_type} failed, initiating Gryphon fallback",
+            timestamp=now or datetime.now(timezone.utc),
             metadata={"tx_type": tx_type},
         )
 
@@ -381,10 +440,21 @@ class RulesEngine:
         """
         user_id = violation.user_id
 
-        if user_id not in self._violations:
-            self._violations[user_id] = []
+        record = self._users.get(user_id)
+        if record is None:
+            record = self._users[user_id] = _UserRecord()
 
-        self._violations[user_id].append(violation)
+        violations = record.violations
+        if len(violations) == violations.maxlen:
+            # The oldest violation is about to be dropped; it is also the
+            # oldest in its rule bucket
+            record.violations_by_rule[violations[0].rule_code].popleft()
+        violations.append(violation)
+
+        bucket = record.violations_by_rule.get(violation.rule_code)
+        if bucket is None:
+            bucket = record.violations_by_rule[violation.rule_code] = deque()
+        bucket.append(violation)
 
         # Determine threat level based on violation type
         threat_level = ThreatLevel.WARNING
@@ -395,7 +465,7 @@ class RulesEngine:
             threat_level = ThreatLevel.ALERT
 
         logger.log_event(
-            event=f"rule_violation:{violation.rule_code.value}",
+            event=_VIOLATION_EVENTS[violation.rule_code],
             threat_level=threat_level,
             agent_id=user_id,
             metadata=violation.to_dict(),
@@ -413,14 +483,16 @@ class RulesEngine:
             rule_code: Optional filter by rule code
 
         Returns:
-            List of violations
+            List of violations (at most MAX_VIOLATIONS_PER_USER, newest kept)
         """
-        violations = self._violations.get(user_id, [])
+        record = self._users.get(user_id)
+        if record is None:
+            return []
 
         if rule_code:
-            violations = [v for v in violations if v.rule_code == rule_code]
+            return list(record.violations_by_rule.get(rule_code, ()))
 
-        return violations
+        return list(record.violations)
 
     def evaluate_all_rules(
         self,
@@ -440,25 +512,35 @@ class RulesEngine:
             tx_type: Type of transaction
 
         Returns:
-            List of all rule results
+            List of all rule results, or only the RC 2.01 result if the
+            user is banned
         """
-        results = []
-
-        # RC 1.01: Signature required
-        results.append(self.check_signature_required(
-            has_signature, signature_valid, user_state.user_id
-        ))
-
-        # RC 1.02: Heir transfer check
-        results.append(self.check_heir_transfer(user_state))
-
-        # RC 2.01: Strike policy
-        results.append(self.check_strike_policy(user_state.user_id))
+        now = datetime.now(timezone.utc)  # One evaluation time for every rule
+        user_id = user_state.user_id
+
+        # RC 2.01 first: a banned user's request is rejected whatever the
+        # other rules say, so skip them
+        strike_result = self.check_strike_policy(user_id, now)
+        if not strike_result.passed:
+            if strike_result.violation:
+                self.record_violation(strike_result.violation)
+            return [strike_result]
+
+        results = [
+            # RC 1.01: Signature required
+            self.check_signature_required(
+                has_signature, signature_valid, user_id, now
+            ),
+            # RC 1.02: Heir transfer check
+            self.check_heir_transfer(user_state, now),
+            # RC 2.01: Strike policy
+            strike_result,
+        ]
 
         # RC 3.02: Transaction fallback
         if tx_type:
             results.append(self.check_transaction_fallback(
-                tx_success, user_state.user_id, tx_type
+                tx_success, user_id, tx_type, now
             ))
 
         # Record any violations
@@ -469,6 +551,42 @@ class RulesEngine:
         return results
 
 
+@dataclass(slots=True)
+class _FallbackRequest:
+    """A queued Gryphon fallback request.
+
+    Attributes:
+        request_id: Fallback request ID
+        user_id: User requesting fallback
+        operation: Operation type
+        data: Operation data
+        timestamp: ISO time the request was queued
+        status: 'queued' or 'processed'
+        processed_at: ISO time the request was processed
+    """
+    request_id: str
+    user_id: str
+    operation: str
+    data: dict[str, Any]
+    timestamp: str
+    status: str = "queued"
+    processed_at: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        result = {
+            "request_id": self.request_id,
+            "user_id": self.user_id,
+            "operation": self.operation,
+            "data": self.data,
+            "timestamp": self.timestamp,
+            "status": self.status,
+        }
+        if self.processed_at is not None:
+            result["processed_at"] = self.processed_at
+        return result
+
+
 class GryphonFallback:
     """Fallback handler for Gryphon network (RC 3.02).
 
@@ -478,13 +596,15 @@ class GryphonFallback:
 
     def __init__(self) -> None:
         """Initialize Gryphon fallback handler."""
-        self._fallback_queue: list[dict[str, Any]] = []
+        # Requests keyed by request_id; dicts keep insertion (queue) order
+        self._fallback_queue: dict[str, _FallbackRequest] = {}
 
     def queue_fallback(
         self,
         user_id: str,
         operation: str,
         data: dict[str, Any],
+        now: datetime | None = None,
     ) -> str:
         """Queue an operation for Gryphon fallback.
 
@@ -492,22 +612,20 @@ class GryphonFallback:
             user_id: User requesting fallback
             operation: Operation type
             data: Operation data
+            now: Queue time, if the caller already read the clock
 
         Returns:
             Fallback request ID
         """
-        import secrets
-
-        request_id = f"gryphon_{secrets.token_hex(16)}"
+        request_id = "gryphon_" + secrets.token_bytes(16).hex()
 
-        self._fallback_queue.append({
-            "request_id": request_id,
-            "user_id": user_id,
-            "operation": operation,
-            "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "status": "queued",
-        })
+        self._fallback_queue[request_id] = _FallbackRequest(
+            request_id=request_id,
+            user_id=user_id,
+            operation=operation,
+            data=data,
+            timestamp=(now or datetime.now(timezone.utc)).isoformat(),
+        )
 
         logger.log_event(
             event="gryphon_fallback_queued",
@@ -527,22 +645,22 @@ class GryphonFallback:
         Returns:
             True if processed successfully
         """
-        for request in self._fallback_queue:
-            if request["request_id"] == request_id:
-                # Simulate Gryphon network processing
-                request["status"] = "processed"
-                request["processed_at"] = datetime.now(timezone.utc).isoformat()
-
-                logger.log_event(
-                    event="gryphon_fallback_processed",
-                    threat_level=ThreatLevel.INFO,
-                    agent_id=request["user_id"],
-                    metadata={"request_id": request_id},
-                )
+        request = self._fallback_queue.get(request_id)
+        if request is None:
+            return False
+
+        # Simulate Gryphon network processing
+        request.status = "processed"
+        request.processed_at = datetime.now(timezone.utc).isoformat()
 
-                return True
+        logger.log_event(
+            event="gryphon_fallback_processed",
+            threat_level=ThreatLevel.INFO,
+            agent_id=request.user_id,
+            metadata={"request_id": request_id},
+        )
 
-        return False
+        return True
 
     def get_queue_status(self) -> list[dict[str, Any]]:
         """Get current fallback queue status.
@@ -550,4 +668,4 @@ class GryphonFallback:
         Returns:
             List of queued requests
         """
-        return self._fallback_queue.copy()
+        return [request.to_dict() for request in self._fallback_queue.values()]
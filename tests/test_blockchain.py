@@ -9,15 +9,9 @@ Tests cover:
 """
 
 import os
-import sys
 import pytest
-from pathlib import Path
 from datetime import datetime, timezone
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).parent.parent / "config"))
-
 
 class TestTransactionResult:
     """Tests for TransactionResult dataclass."""
@@ -230,49 +224,62 @@ class TestBlockchainEventLogger:
         from blockchain.event_logger import BlockchainEventLogger
 
         # Create with blockchain disabled
-        logger = BlockchainEventLogger()
-
-        assert logger.pending_count == 0
+        with BlockchainEventLogger() as logger:
+            assert logger.pending_count == 0
 
     def test_event_logger_batch_accumulation(self, tmp_path):
         """Test ASR accumulation in batches."""
         from blockchain.event_logger import BlockchainEventLogger
         from core.asr_engine import ASREngine, ThreatLevel
 
-        # Create logger without blockchain
-        logger = BlockchainEventLogger()
+        # Create logger without blockchain, sharing the test's ASR engine
+        with ASREngine(storage_path=tmp_path) as asr_engine:
+            logger = BlockchainEventLogger(asr_engine=asr_engine)
+
+            # Create ASRs
+            for i in range(5):
+                asr = asr_engine.create_asr(
+                    agent_id=f"user_{i}",
+                    action=f"action_{i}",
+                    threat_level=ThreatLevel.INFO,
+                )
+                logger.log_asr(asr)
+
+            assert logger.pending_count == 5
+
+    def test_event_logger_disabled(self, tmp_path):
+        """Test event logger when disabled."""
+        from blockchain.event_logger import BlockchainEventLogger
+        from core.asr_engine import ASREngine, ThreatLevel
 
-        # Create ASRs
-        asr_engine = ASREngine(storage_path=tmp_path)
+        with ASREngine(storage_path=tmp_path) as asr_engine:
+            logger = BlockchainEventLogger(asr_engine=asr_engine)
+            # Disable by setting enabled to False
+            logger._enabled = False
 
-        for i in range(5):
             asr = asr_engine.create_asr(
-                agent_id=f"user_{i}",
-                action=f"action_{i}",
+                agent_id="test",
+                action="test",
                 threat_level=ThreatLevel.INFO,
             )
-            logger.log_asr(asr)
 
-        assert logger.pending_count == 5
+            result = logger.log_asr(asr)
+            assert result is None
 
-    def test_event_logger_disabled(self, tmp_path):
-        """Test event logger when disabled."""
+    def test_event_logger_close_leaves_shared_engine_open(self, tmp_path):
+        """Test close() only closes an ASR engine the logger created."""
         from blockchain.event_logger import BlockchainEventLogger
         from core.asr_engine import ASREngine, ThreatLevel
 
-        logger = BlockchainEventLogger()
-        # Disable by setting enabled to False
-        logger._enabled = False
-
-        asr_engine = ASREngine(storage_path=tmp_path)
-        asr = asr_engine.create_asr(
-            agent_id="test",
-            action="test",
-            threat_level=ThreatLevel.INFO,
-        )
+        with ASREngine(storage_path=tmp_path) as asr_engine:
+            BlockchainEventLogger(asr_engine=asr_engine).close()
 
-        result = logger.log_asr(asr)
-        assert result is None
+            asr = asr_engine.create_asr(
+                agent_id="shared",
+                action="still_open",
+                threat_level=ThreatLevel.INFO,
+            )
+            assert asr_engine.store_asr(asr) == asr.asr_id
 
 
 class TestPolygonClientOffline:
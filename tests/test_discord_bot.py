@@ -5,169 +5,354 @@ Tests cover:
 - Alert queue operations
 """
 
-import sys
 import asyncio
-from pathlib import Path
+import threading
+from types import MappingProxyType
 
 import pytest
 
-# Add src and config to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).parent.parent / "config"))
+from discord_bot import alerts
+from discord_bot.alerts import AlertsCog, ThreatAlert, push_alert
+from discord_bot.commands import _PRICING_EMBED, _fresh
+from discord_bot.embeds import (
+    CYAN,
+    FOOTER_TEXT,
+    GREEN,
+    MAGENTA,
+    RED,
+    base_embed,
+    docs_embed,
+    help_embed,
+    pricing_embed,
+    pts_embed,
+    status_embed,
+    threat_alert_embed,
+    welcome_embed,
+)
+
+# Read-only tier inputs shared by pricing tests
+_PRICING_TIERS = (
+    MappingProxyType({
+        "name": "Sentinel Core",
+        "price_usd": 16.99,
+        "operations_per_month": 10_000_000,
+        "pqc_enabled": True,
+        "smart_contract_enabled": False,
+        "asr_frequency": "daily",
+    }),
+    MappingProxyType({
+        "name": "Legacy Builder",
+        "price_usd": 10.99,
+        "operations_per_month": 5_000_000,
+        "pqc_enabled": False,
+        "smart_contract_enabled": False,
+        "asr_frequency": "weekly",
+    }),
+    MappingProxyType({
+        "name": "Autonomous Guild",
+        "price_usd": 29.99,
+        "operations_per_month": -1,
+        "pqc_enabled": True,
+        "smart_contract_enabled": True,
+        "asr_frequency": "realtime",
+    }),
+)
+
+# Field names help_embed must list, one per bot command
+_EXPECTED_HELP_FIELDS = frozenset(
+    f"`{cmd}`" for cmd in ("!help", "!status", "!pricing", "!pts", "!docs", "!invite")
+)
+
+
+def _field_values(embed):
+    """All field values of an embed as one string, for substring checks."""
+    return "\n".join(f.value for f in embed.fields)
+
+
+@pytest.fixture(scope="session")
+def pricing_tiers():
+    """Pricing tier dicts for embed tests (immutable, shared)."""
+    return _PRICING_TIERS
+
+
+@pytest.fixture
+def fresh_alert_queue(monkeypatch):
+    """Replace the module-level alert queue with an empty one."""
+    queue = asyncio.Queue()
+    monkeypatch.setattr(alerts, "alert_queue", queue)
+    return queue
 
 
 class TestEmbeds:
     """Tests for embed builder functions."""
 
     def test_base_embed_has_footer(self):
-        from discord_bot.embeds import base_embed, FOOTER_TEXT
-
         embed = base_embed("Test Title", "Test description")
         assert embed.title == "Test Title"
         assert embed.description == "Test description"
         assert embed.footer.text == FOOTER_TEXT
         assert embed.timestamp is not None
 
-    def test_base_embed_default_color(self):
-        from discord_bot.embeds import base_embed, CYAN
-
-        embed = base_embed("Test")
-        assert embed.color.value == CYAN
-
-    def test_base_embed_custom_color(self):
-        from discord_bot.embeds import base_embed, RED
-
-        embed = base_embed("Test", color=RED)
-        assert embed.color.value == RED
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [({}, CYAN), ({"color": RED}, RED)],
+        ids=["default", "custom"],
+    )
+    def test_base_embed_color(self, kwargs, expected):
+        embed = base_embed("Test", **kwargs)
+        assert embed.color.value == expected
 
     def test_welcome_embed_contains_member_name(self):
-        from discord_bot.embeds import welcome_embed, MAGENTA
-
         embed = welcome_embed("Shane")
         assert "Shane" in embed.title
         assert embed.color.value == MAGENTA
         assert "!help" in embed.description
 
     def test_help_embed_has_all_commands(self):
-        from discord_bot.embeds import help_embed
-
-        embed = help_embed()
-        field_names = [f.name for f in embed.fields]
-        expected = ["!help", "!status", "!pricing", "!pts", "!docs", "!invite"]
-        for cmd in expected:
-            assert f"`{cmd}`" in field_names, f"Missing command: {cmd}"
-
-    def test_status_embed_healthy(self):
-        from discord_bot.embeds import status_embed, GREEN
-
-        embed = status_embed(healthy=True, pqc_available=True)
-        assert embed.color.value == GREEN
-        assert any("Online" in f.value for f in embed.fields)
-
-    def test_status_embed_unhealthy(self):
-        from discord_bot.embeds import status_embed, RED
-
-        embed = status_embed(healthy=False, pqc_available=False)
-        assert embed.color.value == RED
-        assert any("Offline" in f.value for f in embed.fields)
-
-    def test_pricing_embed_shows_all_tiers(self):
-        from discord_bot.embeds import pricing_embed
-
-        tiers = [
-            {
-                "name": "Sentinel Core",
-                "price_usd": 16.99,
-                "operations_per_month": 10_000_000,
-                "pqc_enabled": True,
-                "smart_contract_enabled": False,
-                "asr_frequency": "daily",
-            },
-            {
-                "name": "Legacy Builder",
-                "price_usd": 10.99,
-                "operations_per_month": 5_000_000,
-                "pqc_enabled": False,
-                "smart_contract_enabled": False,
-                "asr_frequency": "weekly",
-            },
-            {
-                "name": "Autonomous Guild",
-                "price_usd": 29.99,
-                "operations_per_month": -1,
-                "pqc_enabled": True,
-                "smart_contract_enabled": True,
-                "asr_frequency": "realtime",
-            },
-        ]
-        embed = pricing_embed(tiers)
-        assert len(embed.fields) == 3
-        assert embed.fields[0].name == "Sentinel Core"
-        assert "$16.99" in embed.fields[0].value
-        assert "Unlimited" in embed.fields[2].value
+        field_names = {f.name for f in help_embed().fields}
+        missing = _EXPECTED_HELP_FIELDS - field_names
+        assert not missing, f"Missing commands: {sorted(missing)}"
+
+    @pytest.mark.parametrize(
+        "healthy,color,text",
+        [(True, GREEN, "Online"), (False, RED, "Offline")],
+        ids=["healthy", "unhealthy"],
+    )
+    def test_status_embed(self, healthy, color, text):
+        embed = status_embed(healthy=healthy, pqc_available=healthy)
+        assert embed.color.value == color
+        assert text in _field_values(embed)
+
+    def test_pricing_embed_shows_all_tiers(self, pricing_tiers):
+        embed = pricing_embed(list(pricing_tiers))
+        fields = embed.fields
+        assert len(fields) == 3
+        assert fields[0].name == "Sentinel Core"
+        assert "$16.99" in fields[0].value
+        assert "Unlimited" in fields[2].value
 
     def test_pts_embed_shows_weights_and_thresholds(self):
-        from discord_bot.embeds import pts_embed
-
         weights = {"quantum_risk_factor": 0.4, "access_violation_count": 0.3}
         thresholds = {"tier1_max": 50, "tier2_max": 150}
         embed = pts_embed(weights, thresholds)
         assert "40%" in embed.description
         assert "30%" in embed.description
-        assert any("50" in f.value for f in embed.fields)
-        assert any("150" in f.value for f in embed.fields)
+        values = _field_values(embed)
+        assert "50" in values
+        assert "150" in values
 
     def test_docs_embed_has_links(self):
-        from discord_bot.embeds import docs_embed
-
         embed = docs_embed()
+        fields = embed.fields
+        assert len(fields) == 3
+        assert "GitHub" in fields[1].name
+
+    @pytest.mark.parametrize(
+        "pts_score,tier,details,color,field_count",
+        [
+            (25.0, "safe", "", GREEN, 2),
+            (200.0, "critical", "Breach detected", RED, 3),
+        ],
+        ids=["safe", "critical"],
+    )
+    def test_threat_alert_embed(self, pts_score, tier, details, color, field_count):
+        embed = threat_alert_embed(pts_score=pts_score, tier=tier, details=details)
+        assert embed.color.value == color
+        fields = embed.fields
+        assert f"{pts_score:.1f}" in fields[0].value
+        assert len(fields) == field_count
+        if details:
+            assert details in fields[2].value
+
+    def test_prebuilt_command_embed_gets_fresh_timestamp(self):
+        built_at = _PRICING_EMBED.timestamp
+        embed = _fresh(_PRICING_EMBED)
+
+        assert embed is not _PRICING_EMBED
+        assert embed.timestamp >= built_at
+        assert _PRICING_EMBED.timestamp == built_at
         assert len(embed.fields) == 3
-        assert "GitHub" in embed.fields[1].name
-
-    def test_threat_alert_embed_safe(self):
-        from discord_bot.embeds import threat_alert_embed, GREEN
-
-        embed = threat_alert_embed(pts_score=25.0, tier="safe")
-        assert embed.color.value == GREEN
-        assert "25.0" in embed.fields[0].value
-
-    def test_threat_alert_embed_critical(self):
-        from discord_bot.embeds import threat_alert_embed, RED
-
-        embed = threat_alert_embed(pts_score=200.0, tier="critical", details="Breach detected")
-        assert embed.color.value == RED
-        assert len(embed.fields) == 3
-        assert "Breach detected" in embed.fields[2].value
 
 
 class TestAlertQueue:
     """Tests for the alert queue system."""
 
-    def test_push_alert_adds_to_queue(self):
-        from discord_bot.alerts import alert_queue, push_alert, ThreatAlert
-
-        # Clear queue
-        while not alert_queue.empty():
-            alert_queue.get_nowait()
-
+    async def test_push_alert_adds_to_queue(self, fresh_alert_queue):
         push_alert(pts_score=75.0, tier="caution", details="Test alert")
-        assert not alert_queue.empty()
+        assert not fresh_alert_queue.empty()
 
-        alert = alert_queue.get_nowait()
+        alert = fresh_alert_queue.get_nowait()
         assert isinstance(alert, ThreatAlert)
         assert alert.pts_score == 75.0
         assert alert.tier == "caution"
         assert alert.details == "Test alert"
 
-    def test_push_multiple_alerts(self):
-        from discord_bot.alerts import alert_queue, push_alert
-
-        # Clear queue
-        while not alert_queue.empty():
-            alert_queue.get_nowait()
-
+    async def test_push_multiple_alerts(self, fresh_alert_queue):
         push_alert(25.0, "safe")
         push_alert(100.0, "caution")
         push_alert(200.0, "critical")
 
-        assert alert_queue.qsize() == 3
+        assert fresh_alert_queue.qsize() == 3
+
+    async def test_send_alerts_batches_embeds(self):
+        class FakeChannel:
+            def __init__(self):
+                self.sent = []
+
+            async def send(self, embeds):
+                self.sent.append(embeds)
+
+        channel = FakeChannel()
+        cog = AlertsCog(bot=None, alerts_channel_id=1)
+        alerts = [ThreatAlert(pts_score=float(i), tier="caution") for i in range(23)]
+
+        await cog.send_alerts(channel, alerts)
+
+        assert [len(batch) for batch in channel.sent] == [10, 10, 3]
+        assert len({e.timestamp for batch in channel.sent for e in batch}) == 1
+
+    async def test_alert_consumer_sends_without_polling(self, fresh_alert_queue):
+        class FakeChannel:
+            def __init__(self):
+                self.sent = []
+
+            async def send(self, embeds):
+                self.sent.append(embeds)
+
+        class FakeBot:
+            def __init__(self, channel):
+                self.channel = channel
+
+            async def wait_until_ready(self):
+                pass
+
+            def get_channel(self, channel_id):
+                return self.channel
+
+        channel = FakeChannel()
+        cog = alerts.AlertsCog(bot=FakeBot(channel), alerts_channel_id=1)
+        await cog.cog_load()
+
+        alerts.push_alert(75.0, "caution")
+        alerts.push_alert(200.0, "critical")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        task = cog._task
+        await cog.cog_unload()
+        assert task.cancelled()  # Unload waits for the consumer to stop
+        assert [len(batch) for batch in channel.sent] == [2]
+
+    async def test_alert_consumer_keeps_alerts_until_channel_visible(
+        self, monkeypatch, fresh_alert_queue
+    ):
+        class FakeChannel:
+            def __init__(self):
+                self.sent = []
+
+            async def send(self, embeds):
+                self.sent.append(embeds)
+
+        class FakeBot:
+            def __init__(self):
+                self.channel = None
+
+            async def wait_until_ready(self):
+                pass
+
+            def get_channel(self, channel_id):
+                return self.channel
+
+        monkeypatch.setattr(alerts, "CHANNEL_RETRY_SECONDS", 0)
+        bot = FakeBot()
+        cog = alerts.AlertsCog(bot=bot, alerts_channel_id=1)
+        await cog.cog_load()
+
+        alerts.push_alert(75.0, "caution")
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert fresh_alert_queue.empty()
+
+        bot.channel = FakeChannel()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        await cog.cog_unload()
+        assert [len(batch) for batch in bot.channel.sent] == [1]
+
+    async def test_alert_consumer_survives_send_errors(self, fresh_alert_queue):
+        class FlakyChannel:
+            def __init__(self):
+                self.sent = []
+
+            async def send(self, embeds):
+                if not self.sent:
+                    self.sent.append(None)
+                    raise RuntimeError("gateway hiccup")
+                self.sent.append(embeds)
+
+        class FakeBot:
+            def __init__(self, channel):
+                self.channel = channel
+
+            async def wait_until_ready(self):
+                pass
+
+            def get_channel(self, channel_id):
+                return self.channel
+
+        channel = FlakyChannel()
+        cog = alerts.AlertsCog(bot=FakeBot(channel), alerts_channel_id=1)
+        await cog.cog_load()
+
+        alerts.push_alert(75.0, "caution")
+        for _ in range(5):
+            await asyncio.sleep(0)
+        alerts.push_alert(200.0, "critical")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert not cog._task.done()
+        await cog.cog_unload()
+        assert len(channel.sent) == 2
+        assert "`200.0`" in _field_values(channel.sent[1][0])
+
+    async def test_push_alert_from_worker_thread(self, monkeypatch, fresh_alert_queue):
+        monkeypatch.setattr(alerts, "_loop", asyncio.get_running_loop())
+
+        worker = threading.Thread(target=alerts.push_alert, args=(200.0, "critical"))
+        worker.start()
+        worker.join()
+
+        alert = await asyncio.wait_for(fresh_alert_queue.get(), timeout=1.0)
+        assert alert.tier == "critical"
+
+    def test_push_alert_after_loop_closed(self, monkeypatch, fresh_alert_queue):
+        closed_loop = asyncio.new_event_loop()
+        closed_loop.close()
+        monkeypatch.setattr(alerts, "_loop", closed_loop)
+        monkeypatch.setattr(alerts, "dropped_alerts", 0)
+
+        alerts.push_alert(200.0, "critical")  # Must not raise
+
+        assert alerts.dropped_alerts == 1
+        assert fresh_alert_queue.empty()
+
+    def test_push_alert_without_loop_is_dropped(self, monkeypatch, fresh_alert_queue):
+        monkeypatch.setattr(alerts, "_loop", None)
+        monkeypatch.setattr(alerts, "dropped_alerts", 0)
+
+        alerts.push_alert(200.0, "critical")  # Not on any loop; must not touch the queue
+
+        assert alerts.dropped_alerts == 1
+        assert fresh_alert_queue.empty()
+
+    async def test_push_alert_counts_drops_when_full(self, monkeypatch):
+        monkeypatch.setattr(alerts, "alert_queue", asyncio.Queue(maxsize=1))
+        monkeypatch.setattr(alerts, "dropped_alerts", 0)
+
+        alerts.push_alert(25.0, "safe")
+        alerts.push_alert(100.0, "caution")
+
+        assert alerts.alert_queue.qsize() == 1
+        assert alerts.dropped_alerts == 1
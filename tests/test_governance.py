@@ -7,15 +7,56 @@ Tests cover:
 - User role management
 """
 
-import sys
+import logging
+import threading
 import time
 import pytest
-from pathlib import Path
 from datetime import datetime, timezone, timedelta
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).parent.parent / "config"))
+from config.constants import TierType
+from governance import pts_calculator, rules_engine
+from governance.access_control import (
+    PERMISSION_DECRYPT,
+    PERMISSION_ENCRYPT,
+    PERMISSION_USER_MANAGE,
+    AccessController,
+    RateLimitExceeded,
+    TierManager,
+    UserRole,
+    require_permission,
+    require_rate_limit,
+)
+from governance.pts_calculator import (
+    PTSCalculator,
+    PTSFactors,
+    PTSTier,
+    SecurityEvent,
+)
+from governance.rules_engine import (
+    GryphonFallback,
+    RuleCode,
+    RulesEngine,
+    UserState,
+)
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.time()."""
+
+    def __init__(self, start: float = 1000.0) -> None:
+        self.t = start
+
+    def __call__(self) -> float:
+        return self.t
+
+    def advance(self, seconds: float) -> None:
+        self.t += seconds
+
+
+@pytest.fixture
+def clock():
+    """A fake clock to pass to AccessController."""
+    return FakeClock()
 
 
 class TestRulesEngine:
@@ -23,8 +64,6 @@ class TestRulesEngine:
 
     def test_rc_1_01_signature_required(self):
         """Test RC 1.01: Signature required rule."""
-        from governance.rules_engine import RulesEngine, RuleCode
-
         engine = RulesEngine()
 
         # Test with valid signature
@@ -56,26 +95,25 @@ class TestRulesEngine:
 
     def test_rc_1_02_heir_transfer(self):
         """Test RC 1.02: Heir transfer on unresponsive."""
-        from governance.rules_engine import RulesEngine, UserState, RuleCode
-
         engine = RulesEngine()
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
 
         # Active user should pass
         active_user = UserState(
             user_id="active_user",
-            last_activity=datetime.now(timezone.utc),
+            last_activity=now,
             heir_address="0xheir",
         )
-        result = engine.check_heir_transfer(active_user)
+        result = engine.check_heir_transfer(active_user, now=now)
         assert result.passed is True
 
         # Inactive user should trigger heir transfer
         inactive_user = UserState(
             user_id="inactive_user",
-            last_activity=datetime.now(timezone.utc) - timedelta(days=100),
+            last_activity=now - timedelta(days=100),
             heir_address="0xheir",
         )
-        result = engine.check_heir_transfer(inactive_user)
+        result = engine.check_heir_transfer(inactive_user, now=now)
         assert result.passed is False
         assert result.rule_code == RuleCode.RC_1_02
         assert result.action_required == "initiate_heir_transfer"
@@ -83,16 +121,14 @@ class TestRulesEngine:
         # Inactive user without heir should pass (no transfer possible)
         no_heir_user = UserState(
             user_id="no_heir_user",
-            last_activity=datetime.now(timezone.utc) - timedelta(days=100),
+            last_activity=now - timedelta(days=100),
             heir_address=None,
         )
-        result = engine.check_heir_transfer(no_heir_user)
+        result = engine.check_heir_transfer(no_heir_user, now=now)
         assert result.passed is True  # No heir to transfer to
 
     def test_rc_2_01_strike_policy(self):
         """Test RC 2.01: Three-strike rule."""
-        from governance.rules_engine import RulesEngine, RuleCode
-
         engine = RulesEngine()
         user_id = "strike_test_user"
 
@@ -115,8 +151,6 @@ class TestRulesEngine:
 
     def test_strike_reset(self):
         """Test strike reset functionality."""
-        from governance.rules_engine import RulesEngine
-
         engine = RulesEngine()
         user_id = "reset_test_user"
 
@@ -136,8 +170,6 @@ class TestRulesEngine:
 
     def test_rc_3_02_transaction_fallback(self):
         """Test RC 3.02: Transaction fallback rule."""
-        from governance.rules_engine import RulesEngine, RuleCode
-
         engine = RulesEngine()
 
         # Successful transaction should pass
@@ -160,29 +192,91 @@ class TestRulesEngine:
 
     def test_violation_recording(self):
         """Test violation recording."""
-        from governance.rules_engine import RulesEngine
-
         engine = RulesEngine()
 
-        # Trigger a violation
-        engine.check_signature_required(
+        # Trigger a violation; checks report it and the caller records it
+        result = engine.check_signature_required(
             has_signature=False,
             signature_valid=False,
             user_id="violation_user",
         )
+        engine.record_violation(result.violation)
 
         violations = engine.get_violations("violation_user")
         assert len(violations) == 1
         assert violations[0].rule_code.value == "RC_1.01"
 
+    def test_evaluate_all_rules_stops_at_ban(self):
+        """Test a banned user's request is rejected without other checks."""
+        engine = RulesEngine()
+        user = UserState(user_id="banned_eval_user")
+
+        results = engine.evaluate_all_rules(user, tx_type="transfer")
+        assert [r.rule_code for r in results] == [
+            RuleCode.RC_1_01,
+            RuleCode.RC_1_02,
+            RuleCode.RC_2_01,
+            RuleCode.RC_3_02,
+        ]
+        assert all(r.passed for r in results)
+
+        for _ in range(3):
+            engine.issue_strike(user.user_id, "test")
+
+        results = engine.evaluate_all_rules(user, has_signature=False)
+        assert len(results) == 1
+        assert results[0].action_required == "issue_ban"
+
+        results = engine.evaluate_all_rules(user, has_signature=False)
+        assert [r.action_required for r in results] == ["reject_banned_user"]
+        assert len(engine.get_violations(user.user_id, RuleCode.RC_1_01)) == 0
+
+    def test_get_violations_by_rule_code(self):
+        """Test filtering recorded violations by rule code."""
+        engine = RulesEngine()
+        user_id = "filter_user"
+
+        for result in (
+            engine.check_signature_required(False, False, user_id),
+            engine.check_transaction_fallback(False, user_id, "transfer"),
+            engine.check_signature_required(True, False, user_id),
+        ):
+            engine.record_violation(result.violation)
+
+        assert len(engine.get_violations(user_id)) == 3
+        sig = engine.get_violations(user_id, rule_code=RuleCode.RC_1_01)
+        assert [v.violation_type.value for v in sig] == [
+            "missing_signature",
+            "invalid_signature",
+        ]
+        assert len(engine.get_violations(user_id, rule_code=RuleCode.RC_3_02)) == 1
+        assert engine.get_violations(user_id, rule_code=RuleCode.RC_2_01) == []
+        assert engine.get_violations("unknown_user") == []
+
+    def test_violation_history_is_bounded(self, monkeypatch):
+        """Test only the most recent violations are kept per user."""
+        monkeypatch.setattr(rules_engine, "MAX_VIOLATIONS_PER_USER", 3)
+        engine = RulesEngine()
+        user_id = "noisy_user"
+
+        engine.record_violation(
+            engine.check_transaction_fallback(False, user_id, "first").violation
+        )
+        for _ in range(3):
+            engine.record_violation(
+                engine.check_signature_required(False, False, user_id).violation
+            )
+
+        assert len(engine.get_violations(user_id)) == 3
+        assert engine.get_violations(user_id, RuleCode.RC_3_02) == []
+        assert len(engine.get_violations(user_id, RuleCode.RC_1_01)) == 3
+
 
 class TestPTSCalculator:
     """Tests for Points Toward Threat Score calculator."""
 
     def test_pts_factors_creation(self):
         """Test PTSFactors creation."""
-        from governance.pts_calculator import PTSFactors
-
         factors = PTSFactors(
             quantum_risk_count=2,
             access_violation_count=3,
@@ -195,8 +289,6 @@ class TestPTSCalculator:
 
     def test_pts_calculation_safe(self):
         """Test PTS calculation for safe tier."""
-        from governance.pts_calculator import PTSCalculator, PTSTier
-
         calc = PTSCalculator()
         user_id = "safe_user"
 
@@ -208,15 +300,14 @@ class TestPTSCalculator:
 
     def test_pts_calculation_caution(self):
         """Test PTS calculation for caution tier."""
-        from governance.pts_calculator import PTSCalculator, PTSTier
-
         calc = PTSCalculator()
         user_id = "caution_user"
 
         # Add some violations to reach caution tier
-        calc.record_quantum_risk(user_id, "weak_cipher")
-        calc.record_access_violation(user_id, "unauthorized")
-        calc.record_rate_limit_violation(user_id, "/api/test", 10, 5)
+        for _ in range(2):
+            calc.record_quantum_risk(user_id, "weak_cipher")
+            calc.record_access_violation(user_id, "unauthorized")
+            calc.record_rate_limit_violation(user_id, "/api/test", 10, 5)
 
         score = calc.calculate_pts(user_id)
         assert score.tier == PTSTier.CAUTION
@@ -225,8 +316,6 @@ class TestPTSCalculator:
 
     def test_pts_calculation_critical(self):
         """Test PTS calculation for critical tier."""
-        from governance.pts_calculator import PTSCalculator, PTSTier
-
         calc = PTSCalculator()
         user_id = "critical_user"
 
@@ -240,10 +329,54 @@ class TestPTSCalculator:
         assert score.is_critical is True
         assert score.total_score >= 150
 
+    def test_record_access_violations_matches_single_records(self):
+        """Bulk recording counts the same as one call per violation."""
+        calc = PTSCalculator()
+
+        calc.record_access_violations("bulk", [f"v_{i}" for i in range(4)])
+        calc.record_access_violations("bulk", [])
+        for i in range(4):
+            calc.record_access_violation("single", f"v_{i}")
+
+        assert calc.get_factors("bulk") == calc.get_factors("single")
+        assert calc.get_factors("bulk").access_violation_count == 4
+
+    def test_pts_event_metadata_is_logged(self, monkeypatch):
+        """Test metadata passed to record_* reaches the security log."""
+        logged = []
+        monkeypatch.setattr(pts_calculator.logger, "is_enabled_for", lambda level: True)
+        monkeypatch.setattr(
+            pts_calculator.logger, "log_event", lambda **kwargs: logged.append(kwargs)
+        )
+        calc = PTSCalculator()
+
+        calc.record_quantum_risk("meta_user", "rsa", metadata={"key_bits": 2048})
+        calc.record_access_violation("meta_user", "admin", metadata={"path": "/x"})
+        calc.record_signature_failure("meta_user", "ecdsa", metadata={"asr": "a1"})
+
+        assert [entry["metadata"] for entry in logged] == [
+            {"key_bits": 2048},
+            {"path": "/x"},
+            {"asr": "a1"},
+        ]
+
+    def test_security_logger_follows_live_level(self):
+        """Test level checks read the current logging level, not a snapshot."""
+        std_logger = logging.getLogger("security.pts")
+        original = std_logger.level
+        try:
+            std_logger.setLevel(logging.WARNING)
+            assert not pts_calculator.logger.is_enabled_for(logging.INFO)
+            assert pts_calculator.logger.start_timer() is None
+
+            std_logger.setLevel(logging.INFO)
+            assert pts_calculator.logger.is_enabled_for(logging.INFO)
+            assert pts_calculator.logger.start_timer() is not None
+        finally:
+            std_logger.setLevel(original)
+
     def test_pts_breakdown(self):
         """Test PTS score breakdown."""
-        from governance.pts_calculator import PTSCalculator
-
         calc = PTSCalculator()
         user_id = "breakdown_user"
 
@@ -257,16 +390,107 @@ class TestPTSCalculator:
         assert score.breakdown["quantum_risk"] > 0
         assert score.breakdown["signature_failure"] > 0
 
+    def test_pts_score_cached_until_new_event(self):
+        """Test calculated scores are reused until the user's events change."""
+        calc = PTSCalculator()
+        user_id = "cached_user"
+
+        calc.record_quantum_risk(user_id, "weak_cipher")
+        first = calc.calculate_pts(user_id)
+        assert calc.calculate_pts(user_id) is first
+
+        calc.record_quantum_risk(user_id, "weak_cipher")
+        second = calc.calculate_pts(user_id)
+        assert second is not first
+        assert second.factors.quantum_risk_count == 2
+
+        calc.reset_user(user_id)
+        assert calc.calculate_pts(user_id).total_score == 0
+
+        uncached = PTSCalculator(score_ttl_seconds=0)
+        assert uncached.calculate_pts(user_id) is not uncached.calculate_pts(user_id)
+
+    def test_pts_sweep_all_drops_expired_users(self):
+        """Test sweep_all removes users whose events left the window."""
+        calc = PTSCalculator(time_window_hours=1)
+        old = datetime.now(timezone.utc) - timedelta(hours=2)
+        calc._add_event(SecurityEvent("quantum_risk", "stale_user", timestamp=old))
+        calc.record_quantum_risk("active_user", "weak_cipher")
+
+        assert calc.sweep_all() == 1
+        assert calc.get_factors("stale_user").quantum_risk_count == 0
+        assert calc.get_factors("active_user").quantum_risk_count == 1
+        assert calc.get_all_critical_users() == []
+
+    def test_pts_record_only_user_stays_bounded(self):
+        """Test recording expires old events even if no score is ever read."""
+        calc = PTSCalculator(time_window_hours=1)
+        old = datetime.now(timezone.utc) - timedelta(hours=2)
+        for _ in range(100):
+            calc._add_event(SecurityEvent("signature_failure", "wallet", timestamp=old))
+        calc._record_many("wallet", "signature_failure", 100, timestamp=old.timestamp())
+
+        calc.record_signature_failure("wallet", "decrypt_failed")
+
+        assert len(calc._events["wallet"]["signature_failure"]) == 1
+
+    def test_pts_historical_event_after_live_one_expires(self):
+        """Test an older event recorded out of order still ages out."""
+        calc = PTSCalculator(time_window_hours=1)
+        now = datetime.now(timezone.utc)
+        calc.record_access_violation("late_user", "unauthorized")
+        calc._add_event(SecurityEvent(
+            "access_violation", "late_user", timestamp=now - timedelta(days=400),
+        ))
+        calc._add_event(SecurityEvent(
+            "access_violation", "late_user", timestamp=now - timedelta(minutes=5),
+        ))
+
+        timestamps = calc._events["late_user"]["access_violation"]
+        assert list(timestamps) == sorted(timestamps)
+        assert calc.get_factors("late_user").access_violation_count == 2
+
+        calc.record_access_violation("late_user", "unauthorized")
+        assert calc.get_factors("late_user").access_violation_count == 3
+
+    def test_pts_critical_users_drop_expired_and_reset(self):
+        """Test users leave the critical list once their events expire or reset."""
+        calc = PTSCalculator(time_window_hours=1)
+        old = datetime.now(timezone.utc) - timedelta(hours=2)
+        calc._record_many("stale_user", "quantum_risk", 50, timestamp=old.timestamp())
+        calc.record_access_violations("reset_me", [f"v_{i}" for i in range(50)])
+        calc.record_access_violations("live_user", [f"v_{i}" for i in range(50)])
+
+        calc.reset_user("reset_me")
+
+        assert calc.get_all_critical_users() == ["live_user"]
+        assert calc._critical_candidates == {"live_user"}
+
+    def test_pts_concurrent_recording(self):
+        """Test events recorded from several threads are all counted."""
+        calc = PTSCalculator()
+
+        def record(n: int) -> None:
+            for i in range(200):
+                calc.record_rate_limit_violation(f"user_{i % 8}", "/api", 101, 100)
+                calc.calculate_pts(f"user_{n}")
+
+        workers = [threading.Thread(target=record, args=(n,)) for n in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        counts = [calc.get_factors(f"user_{n}").rate_limit_violations for n in range(8)]
+        assert counts == [200] * 8
+
     def test_pts_user_reset(self):
         """Test resetting a user's PTS events."""
-        from governance.pts_calculator import PTSCalculator, PTSTier
-
         calc = PTSCalculator()
         user_id = "reset_user"
 
-        # Add violations
-        for i in range(5):
-            calc.record_access_violation(user_id, f"v_{i}")
+        # Add enough violations to leave the safe tier
+        calc.record_access_violations(user_id, [f"v_{i}" for i in range(7)])
 
         assert calc.calculate_pts(user_id).tier != PTSTier.SAFE
 
@@ -278,15 +502,11 @@ class TestPTSCalculator:
 
     def test_pts_get_critical_users(self):
         """Test getting all critical users."""
-        from governance.pts_calculator import PTSCalculator
-
         calc = PTSCalculator()
 
         # Make some users critical
         for i in range(3):
-            user_id = f"critical_{i}"
-            for j in range(15):
-                calc.record_access_violation(user_id, f"v_{j}")
+            calc.record_access_violations(f"critical_{i}", [f"v_{j}" for j in range(20)])
 
         # Make one safe user
         calc.record_quantum_risk("safe_user", "minor")
@@ -300,8 +520,6 @@ class TestAccessController:
 
     def test_user_registration(self):
         """Test user registration."""
-        from governance.access_control import AccessController, UserRole, TierType
-
         controller = AccessController()
 
         profile = controller.register_user(
@@ -316,13 +534,6 @@ class TestAccessController:
 
     def test_permission_check(self):
         """Test permission checking."""
-        from governance.access_control import (
-            AccessController,
-            UserRole,
-            PERMISSION_ENCRYPT,
-            PERMISSION_USER_MANAGE,
-        )
-
         controller = AccessController()
         controller.register_user("user1", role=UserRole.USER)
         controller.register_user("admin1", role=UserRole.ADMIN)
@@ -341,23 +552,15 @@ class TestAccessController:
 
     def test_has_permission_helper(self):
         """Test has_permission helper method."""
-        from governance.access_control import (
-            AccessController,
-            UserRole,
-            PERMISSION_DECRYPT,
-        )
-
         controller = AccessController()
         controller.register_user("test_user", role=UserRole.USER)
 
         assert controller.has_permission("test_user", PERMISSION_DECRYPT) is True
         assert controller.has_permission("nonexistent", PERMISSION_DECRYPT) is False
 
-    def test_rate_limiting(self):
+    def test_rate_limiting(self, clock):
         """Test rate limiting."""
-        from governance.access_control import AccessController, UserRole, TierType
-
-        controller = AccessController()
+        controller = AccessController(clock=clock)
         controller.register_user(
             "rate_test_user",
             role=UserRole.USER,
@@ -374,11 +577,56 @@ class TestAccessController:
         assert result.allowed is False
         assert result.reset_in_seconds > 0
 
-    def test_rate_limit_by_endpoint(self):
-        """Test per-endpoint rate limiting."""
-        from governance.access_control import AccessController, UserRole
+        # A full window later the limit is available again
+        clock.advance(60.0)
+        for i in range(5):
+            assert controller.check_rate_limit("rate_test_user").allowed is True
 
-        controller = AccessController()
+    def test_rate_limit_token_refill(self, clock):
+        """Test the rate limit bucket refills at limit per 60s."""
+        controller = AccessController(clock=clock)
+        controller.register_user("bucket_user", role=UserRole.USER)  # 5 req/min
+
+        for i in range(5):
+            assert controller.check_rate_limit("bucket_user").allowed is True
+
+        # Empty bucket: one token takes 60s / 5 = 12s to refill
+        result = controller.check_rate_limit("bucket_user")
+        assert result.allowed is False
+        assert result.current_count == 5
+        assert result.reset_in_seconds == pytest.approx(12.0)
+
+        clock.advance(12.0)
+        assert controller.check_rate_limit("bucket_user").allowed is True
+        assert controller.check_rate_limit("bucket_user").allowed is False
+
+    def test_rate_limit_of_zero_denies(self, clock):
+        """Test a zero limit denies every request without dividing by zero."""
+        controller = AccessController(clock=clock)
+        controller._rate_limit_default = 0
+
+        result = controller.check_rate_limit("anon")
+        assert result.allowed is False
+        assert result.limit == 0
+        assert result.reset_in_seconds == 60.0
+        assert controller.try_acquire("anon") is not None
+
+    def test_rate_limit_prunes_idle_buckets(self, clock):
+        """Test idle rate-limit buckets are swept once per window."""
+        controller = AccessController(clock=clock)
+        for i in range(3):
+            controller.check_rate_limit("ephemeral_user", f"/api/item/{i}")
+        assert len(controller._buckets) == 3
+
+        clock.advance(60.0)
+        controller.check_rate_limit("other_user")
+
+        assert list(controller._buckets) == ["other_user"]
+        assert "ephemeral_user" not in controller._keys_by_user
+
+    def test_rate_limit_by_endpoint(self, clock):
+        """Test per-endpoint rate limiting."""
+        controller = AccessController(clock=clock)
         controller.register_user("endpoint_user", role=UserRole.USER)
 
         # Different endpoints have separate limits
@@ -400,8 +648,6 @@ class TestAccessController:
 
     def test_role_update(self):
         """Test role update."""
-        from governance.access_control import AccessController, UserRole
-
         controller = AccessController()
         controller.register_user("upgrade_user", role=UserRole.USER)
 
@@ -411,10 +657,23 @@ class TestAccessController:
         user = controller.get_user("upgrade_user")
         assert user.role == UserRole.SENTINEL
 
+    def test_rate_limit_follows_tier_change(self):
+        """Test a user's effective rate limit tracks tier and custom limit."""
+        controller = AccessController()
+        profile = controller.register_user("limit_user", tier=TierType.LEGACY_BUILDER)
+        assert profile.get_rate_limit() == 5
+
+        controller.update_tier("limit_user", TierType.AUTONOMOUS_GUILD)
+        assert profile.get_rate_limit() == 100
+
+        profile.tier = TierType.SENTINEL_CORE
+        assert profile.get_rate_limit() == 10
+
+        profile.rate_limit = 42
+        assert profile.get_rate_limit() == 42
+
     def test_tier_update(self):
         """Test tier update."""
-        from governance.access_control import AccessController, TierType
-
         controller = AccessController()
         controller.register_user("tier_user")
 
@@ -426,8 +685,6 @@ class TestAccessController:
 
     def test_user_removal(self):
         """Test user removal."""
-        from governance.access_control import AccessController
-
         controller = AccessController()
         controller.register_user("remove_user")
 
@@ -437,10 +694,45 @@ class TestAccessController:
         assert success is True
         assert controller.get_user("remove_user") is None
 
+    def test_remove_user_clears_only_own_rate_limits(self):
+        """Test removing a user keeps rate limits of users sharing its prefix."""
+        controller = AccessController()
+        controller.register_user("alice", role=UserRole.USER)
+        controller.register_user("aliceb", role=UserRole.USER)
+
+        for i in range(5):
+            controller.check_rate_limit("alice", "/api/encrypt")
+            controller.check_rate_limit("aliceb", "/api/encrypt")
+
+        controller.remove_user("alice")
+
+        assert controller.check_rate_limit("aliceb", "/api/encrypt").allowed is False
+
+    def test_require_decorators(self):
+        """Test permission and rate limit decorators allow then deny."""
+        @require_permission("user_manage")
+        def manage(controller, user_id):
+            return "ok"
+
+        @require_rate_limit()
+        def endpoint(controller, user_id):
+            return "ok"
+
+        controller = AccessController()
+        controller.register_user("admin", role=UserRole.ADMIN)
+        controller.register_user("user", role=UserRole.USER)
+
+        assert manage(controller, "admin") == "ok"
+        with pytest.raises(PermissionError, match="requires ADMIN"):
+            manage(controller, "user")
+
+        for i in range(5):
+            assert endpoint(controller, "user") == "ok"
+        with pytest.raises(RateLimitExceeded, match="5/5"):
+            endpoint(controller, "user")
+
     def test_get_all_users(self):
         """Test getting all users."""
-        from governance.access_control import AccessController, UserRole
-
         controller = AccessController()
         controller.register_user("user1", role=UserRole.USER)
         controller.register_user("user2", role=UserRole.USER)
@@ -452,44 +744,74 @@ class TestAccessController:
         admins = controller.get_all_users(role=UserRole.ADMIN)
         assert len(admins) == 1
 
+    def test_get_all_users_tracks_role_changes(self):
+        """Test role filter follows role updates and removals."""
+        controller = AccessController()
+        controller.register_user("user1", role=UserRole.USER)
+        controller.register_user("user2", role=UserRole.USER)
 
-class TestTierManager:
-    """Tests for tier management."""
+        controller.update_role("user1", UserRole.SENTINEL)
+        assert [u.user_id for u in controller.get_all_users(role=UserRole.USER)] == ["user2"]
+        assert [u.user_id for u in controller.get_all_users(role=UserRole.SENTINEL)] == ["user1"]
 
-    def test_tier_features(self):
-        """Test getting tier features."""
-        from governance.access_control import TierManager
-        from config.constants import TierType
+        controller.register_user("user2", role=UserRole.ADMIN)
+        assert controller.get_all_users(role=UserRole.USER) == []
 
-        sentinel_features = TierManager.get_tier_features(TierType.SENTINEL_CORE)
-        assert sentinel_features["pqc_enabled"] is True
-        assert sentinel_features["price_usd"] == 16.99
+        controller.remove_user("user1")
+        assert controller.get_all_users(role=UserRole.SENTINEL) == []
+        assert len(controller.get_all_users()) == 1
 
-        legacy_features = TierManager.get_tier_features(TierType.LEGACY_BUILDER)
-        assert legacy_features["pqc_enabled"] is False
-        assert legacy_features["price_usd"] == 10.99
+    def test_update_role_after_direct_role_assignment(self):
+        """Test role filters follow a profile whose role was set directly."""
+        controller = AccessController()
+        profile = controller.register_user("user1", role=UserRole.USER)
+        profile.role = UserRole.ADMIN  # Bypasses update_role
 
-        guild_features = TierManager.get_tier_features(TierType.AUTONOMOUS_GUILD)
-        assert guild_features["smart_contract_enabled"] is True
-        assert guild_features["operations_per_month"] == -1  # Unlimited
+        assert controller.get_all_users(role=UserRole.USER) == []
+        assert [u.user_id for u in controller.get_all_users(role=UserRole.ADMIN)] == ["user1"]
 
-    def test_can_use_pqc(self):
-        """Test PQC availability check."""
-        from governance.access_control import TierManager
-        from config.constants import TierType
+        assert controller.update_role("user1", UserRole.SENTINEL)
+        assert controller.get_all_users(role=UserRole.USER) == []
+        assert [u.user_id for u in controller.get_all_users(role=UserRole.SENTINEL)] == ["user1"]
 
-        assert TierManager.can_use_pqc(TierType.SENTINEL_CORE) is True
-        assert TierManager.can_use_pqc(TierType.LEGACY_BUILDER) is False
-        assert TierManager.can_use_pqc(TierType.AUTONOMOUS_GUILD) is True
 
-    def test_can_use_smart_contracts(self):
-        """Test smart contract availability check."""
-        from governance.access_control import TierManager
-        from config.constants import TierType
+class TestTierManager:
+    """Tests for tier management."""
 
-        assert TierManager.can_use_smart_contracts(TierType.SENTINEL_CORE) is False
-        assert TierManager.can_use_smart_contracts(TierType.LEGACY_BUILDER) is False
-        assert TierManager.can_use_smart_contracts(TierType.AUTONOMOUS_GUILD) is True
+    @pytest.mark.parametrize(
+        "tier,feature,expected",
+        [
+            (TierType.SENTINEL_CORE, "pqc_enabled", True),
+            (TierType.SENTINEL_CORE, "price_usd", 16.99),
+            (TierType.LEGACY_BUILDER, "pqc_enabled", False),
+            (TierType.LEGACY_BUILDER, "price_usd", 10.99),
+            (TierType.AUTONOMOUS_GUILD, "smart_contract_enabled", True),
+            (TierType.AUTONOMOUS_GUILD, "operations_per_month", -1),  # Unlimited
+        ],
+    )
+    def test_tier_features(self, tier, feature, expected):
+        """Test getting tier features."""
+        assert TierManager.get_tier_features(tier)[feature] == expected
+
+    @pytest.mark.parametrize(
+        "tier,pqc,smart_contracts",
+        [
+            (TierType.SENTINEL_CORE, True, False),
+            (TierType.LEGACY_BUILDER, False, False),
+            (TierType.AUTONOMOUS_GUILD, True, True),
+        ],
+    )
+    def test_tier_capabilities(self, tier, pqc, smart_contracts):
+        """Test PQC and smart contract availability checks."""
+        assert TierManager.can_use_pqc(tier) is pqc
+        assert TierManager.can_use_smart_contracts(tier) is smart_contracts
+
+    def test_tier_capabilities_reject_unknown_tier(self):
+        """Test capability checks raise for a tier outside TierType."""
+        with pytest.raises(KeyError):
+            TierManager.can_use_pqc("platinum")
+        with pytest.raises(KeyError):
+            TierManager.can_use_smart_contracts("platinum")
 
 
 class TestGryphonFallback:
@@ -497,8 +819,6 @@ class TestGryphonFallback:
 
     def test_fallback_queue(self):
         """Test fallback request queuing."""
-        from governance.rules_engine import GryphonFallback
-
         fallback = GryphonFallback()
 
         request_id = fallback.queue_fallback(
@@ -514,8 +834,6 @@ class TestGryphonFallback:
 
     def test_fallback_processing(self):
         """Test fallback request processing."""
-        from governance.rules_engine import GryphonFallback
-
         fallback = GryphonFallback()
 
         request_id = fallback.queue_fallback(
@@ -532,8 +850,6 @@ class TestGryphonFallback:
 
     def test_fallback_not_found(self):
         """Test processing nonexistent fallback."""
-        from governance.rules_engine import GryphonFallback
-
         fallback = GryphonFallback()
 
         success = fallback.process_fallback("nonexistent_id")
@@ -8,15 +8,9 @@ End-to-end tests covering:
 """
 
 import os
-import sys
 import pytest
-from pathlib import Path
 from datetime import datetime, timezone
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).parent.parent / "config"))
-
 
 class TestCryptoWorkflow:
     """Integration tests for cryptographic workflows."""
@@ -28,43 +22,42 @@ class TestCryptoWorkflow:
 
         # Initialize components
         crypto = LegacyCrypto()
-        asr_engine = ASREngine(storage_path=tmp_path)
-
-        # User data
-        user_id = "integration_user"
-        password = b"secure_password_123"
-        plaintext = b"Sensitive data to encrypt for testing purposes."
-
-        # Encrypt
-        key, salt = crypto.derive_key(password)
-        ciphertext = crypto.encrypt(plaintext, key, salt)
-
-        # Create ASR for encryption
-        encrypt_asr = asr_engine.create_asr(
-            agent_id=user_id,
-            action="encrypt_aes",
-            threat_level=ThreatLevel.INFO,
-            pqc_status=PQCStatus.WARNING,  # AES is not quantum-safe
-            metadata={"algorithm": "AES-256-CBC"},
-        )
-        asr_engine.store_asr(encrypt_asr)
+        with ASREngine(storage_path=tmp_path) as asr_engine:
+            # User data
+            user_id = "integration_user"
+            password = b"secure_password_123"
+            plaintext = b"Sensitive data to encrypt for testing purposes."
+
+            # Encrypt
+            key, salt = crypto.derive_key(password)
+            ciphertext = crypto.encrypt(plaintext, key, salt)
+
+            # Create ASR for encryption
+            encrypt_asr = asr_engine.create_asr(
+                agent_id=user_id,
+                action="encrypt_aes",
+                threat_level=ThreatLevel.INFO,
+                pqc_status=PQCStatus.WARNING,  # AES is not quantum-safe
+                metadata={"algorithm": "AES-256-CBC"},
+            )
+            asr_engine.store_asr(encrypt_asr)
 
-        # Decrypt
-        decrypted = crypto.decrypt(ciphertext, key)
-        assert decrypted == plaintext
+            # Decrypt
+            decrypted = crypto.decrypt(ciphertext, key)
+            assert decrypted == plaintext
 
-        # Create ASR for decryption
-        decrypt_asr = asr_engine.create_asr(
-            agent_id=user_id,
-            action="decrypt_aes",
-            threat_level=ThreatLevel.INFO,
-            pqc_status=PQCStatus.WARNING,
-        )
-        asr_engine.store_asr(decrypt_asr)
+            # Create ASR for decryption
+            decrypt_asr = asr_engine.create_asr(
+                agent_id=user_id,
+                action="decrypt_aes",
+                threat_level=ThreatLevel.INFO,
+                pqc_status=PQCStatus.WARNING,
+            )
+            asr_engine.store_asr(decrypt_asr)
 
-        # Verify ASR records
-        records = asr_engine.list_asr_by_agent(user_id)
-        assert len(records) == 2
+            # Verify ASR records
+            records = asr_engine.list_asr_by_agent(user_id)
+            assert len(records) == 2
 
     def test_aes_ciphertext_roundtrip(self):
         """Test AES ciphertext serialization roundtrip."""
@@ -96,67 +89,75 @@ class TestASRWorkflow:
         """Test complete ASR batching workflow."""
         from core.asr_engine import ASREngine, ThreatLevel, PQCStatus
 
-        engine = ASREngine(storage_path=tmp_path)
-        engine._max_batch_size = 5  # Small batch for testing
-
-        # Create ASRs
-        created_asrs = []
-        for i in range(5):
-            asr = engine.create_asr(
-                agent_id=f"batch_user_{i % 2}",
-                action=f"action_{i}",
-                threat_level=ThreatLevel.INFO,
-                pqc_status=PQCStatus.SAFE,
-            )
-            created_asrs.append(asr)
-            engine.add_to_batch(asr)
-
-        # Flush should create batch
-        batch = engine.flush_batch()
-        assert batch is not None
-        assert len(batch.records) == 5
-
-        # Verify Merkle root
-        assert batch.merkle_root != ""
-        assert len(batch.merkle_root) == 64  # SHA-256 hex
-
-        # Verify proof for each ASR
-        for asr in created_asrs:
-            proof = engine.get_merkle_proof(asr, batch)
-            assert len(proof) > 0
-
-            # Verify proof
-            is_valid = ASREngine.verify_merkle_proof(
-                asr.signature,
-                proof,
+        with ASREngine(storage_path=tmp_path) as engine:
+            engine._max_batch_size = 5  # Small batch for testing
+
+            # Create ASRs
+            created_asrs = []
+            batch = None
+            for i in range(5):
+                asr = engine.create_asr(
+                    agent_id=f"batch_user_{i % 2}",
+                    action=f"action_{i}",
+                    threat_level=ThreatLevel.INFO,
+                    pqc_status=PQCStatus.SAFE,
+                )
+                created_asrs.append(asr)
+                batch = engine.add_to_batch(asr)
+
+            # Filling the batch flushes it, leaving nothing for flush_batch
+            assert batch is not None
+            assert engine.flush_batch() is None
+            assert len(batch.records) == 5
+
+            # Verify Merkle root
+            assert batch.merkle_root != ""
+            assert len(batch.merkle_root) == 64  # SHA-256 hex
+
+            # Verify proof for each ASR
+            for asr in created_asrs:
+                proof = engine.get_merkle_proof(asr, batch)
+                assert len(proof) > 0
+
+                # Verify proof
+                is_valid = ASREngine.verify_merkle_proof(
+                    asr.signature,
+                    proof,
+                    batch.merkle_root,
+                )
+                assert is_valid
+
+            # Verify every ASR with one multi-proof
+            multi_proof = engine.get_merkle_multi_proof(created_asrs, batch)
+            assert ASREngine.verify_merkle_multi_proof(
+                [asr.signature for asr in created_asrs],
+                multi_proof,
                 batch.merkle_root,
             )
-            assert is_valid
 
     def test_asr_threat_level_filtering(self, tmp_path):
         """Test ASR filtering by threat level."""
         from core.asr_engine import ASREngine, ThreatLevel
 
-        engine = ASREngine(storage_path=tmp_path)
-
-        # Create ASRs with different threat levels
-        for level in ThreatLevel:
-            asr = engine.create_asr(
-                agent_id="filter_user",
-                action=f"action_level_{level.value}",
-                threat_level=level,
-            )
-            engine.store_asr(asr)
+        with ASREngine(storage_path=tmp_path) as engine:
+            # Create ASRs with different threat levels
+            for level in ThreatLevel:
+                asr = engine.create_asr(
+                    agent_id="filter_user",
+                    action=f"action_level_{level.value}",
+                    threat_level=level,
+                )
+                engine.store_asr(asr)
 
-        # Filter by minimum threat level
-        all_records = engine.list_asr_by_agent("filter_user", threat_level_min=1)
-        assert len(all_records) == 5
+            # Filter by minimum threat level
+            all_records = engine.list_asr_by_agent("filter_user", threat_level_min=1)
+            assert len(all_records) == 5
 
-        warning_plus = engine.list_asr_by_agent("filter_user", threat_level_min=3)
-        assert len(warning_plus) == 3  # WARNING, ALERT, CRITICAL
+            warning_plus = engine.list_asr_by_agent("filter_user", threat_level_min=3)
+            assert len(warning_plus) == 3  # WARNING, ALERT, CRITICAL
 
-        critical_only = engine.list_asr_by_agent("filter_user", threat_level_min=5)
-        assert len(critical_only) == 1
+            critical_only = engine.list_asr_by_agent("filter_user", threat_level_min=5)
+            assert len(critical_only) == 1
 
 
 class TestGovernanceWorkflow:
@@ -248,8 +249,8 @@ class TestGovernanceWorkflow:
         score = monitor.check_user(user_id)
         assert score.tier == PTSTier.SAFE
 
-        # Add violations
-        for i in range(5):
+        # Add enough violations to reach the caution tier
+        for i in range(7):
             calc.record_access_violation(user_id, f"v_{i}")
 
         # Check again - should trigger tier change
@@ -276,40 +277,40 @@ class TestMultiComponentIntegration:
 
         # Initialize all components
         crypto = LegacyCrypto()
-        asr_engine = ASREngine(storage_path=tmp_path)
-        access_ctrl = AccessController()
-        pts_calc = PTSCalculator()
+        with ASREngine(storage_path=tmp_path) as asr_engine:
+            access_ctrl = AccessController()
+            pts_calc = PTSCalculator()
 
-        user_id = "multi_component_user"
+            user_id = "multi_component_user"
 
-        # Register user
-        access_ctrl.register_user(user_id, role=UserRole.USER)
+            # Register user
+            access_ctrl.register_user(user_id, role=UserRole.USER)
 
-        # Check permission
-        has_perm = access_ctrl.has_permission(user_id, PERMISSION_ENCRYPT)
-        assert has_perm
+            # Check permission
+            has_perm = access_ctrl.has_permission(user_id, PERMISSION_ENCRYPT)
+            assert has_perm
 
-        # Check rate limit
-        rate_result = access_ctrl.check_rate_limit(user_id)
-        assert rate_result.allowed
+            # Check rate limit
+            rate_result = access_ctrl.check_rate_limit(user_id)
+            assert rate_result.allowed
 
-        # Perform encryption
-        password = b"test_password"
-        key, salt = crypto.derive_key(password)
-        plaintext = b"Secret data"
-        ciphertext = crypto.encrypt(plaintext, key, salt)
+            # Perform encryption
+            password = b"test_password"
+            key, salt = crypto.derive_key(password)
+            plaintext = b"Secret data"
+            ciphertext = crypto.encrypt(plaintext, key, salt)
 
-        # Log ASR
-        asr = asr_engine.create_asr(
-            agent_id=user_id,
-            action="encrypt",
-            threat_level=ThreatLevel.INFO,
-        )
-        asr_engine.store_asr(asr)
+            # Log ASR
+            asr = asr_engine.create_asr(
+                agent_id=user_id,
+                action="encrypt",
+                threat_level=ThreatLevel.INFO,
+            )
+            asr_engine.store_asr(asr)
 
-        # Verify PTS is still safe
-        pts = pts_calc.calculate_pts(user_id)
-        assert pts.is_safe
+            # Verify PTS is still safe
+            pts = pts_calc.calculate_pts(user_id)
+            assert pts.is_safe
 
     def test_failed_operation_pts_impact(self, tmp_path):
         """Test that failed operations impact PTS."""
@@ -317,35 +318,35 @@ class TestMultiComponentIntegration:
         from governance.pts_calculator import PTSCalculator
         from governance.rules_engine import RulesEngine
 
-        asr_engine = ASREngine(storage_path=tmp_path)
-        pts_calc = PTSCalculator()
-        rules_engine = RulesEngine()
+        with ASREngine(storage_path=tmp_path) as asr_engine:
+            pts_calc = PTSCalculator()
+            rules_engine = RulesEngine()
 
-        user_id = "failure_impact_user"
+            user_id = "failure_impact_user"
 
-        # Simulate multiple signature failures
-        for i in range(3):
-            pts_calc.record_signature_failure(user_id, "decrypt_failure")
+            # Simulate multiple signature failures
+            for i in range(3):
+                pts_calc.record_signature_failure(user_id, "decrypt_failure")
 
-            # Log ASR for failure
-            asr = asr_engine.create_asr(
-                agent_id=user_id,
-                action="decrypt_failed",
-                threat_level=ThreatLevel.CAUTION,
-                pqc_status=PQCStatus.WARNING,
-            )
-            asr_engine.store_asr(asr)
+                # Log ASR for failure
+                asr = asr_engine.create_asr(
+                    agent_id=user_id,
+                    action="decrypt_failed",
+                    threat_level=ThreatLevel.CAUTION,
+                    pqc_status=PQCStatus.WARNING,
+                )
+                asr_engine.store_asr(asr)
 
-            # Issue strike
-            rules_engine.issue_strike(user_id, "signature_failure")
+                # Issue strike
+                rules_engine.issue_strike(user_id, "signature_failure")
 
-        # Verify PTS has increased
-        pts = pts_calc.calculate_pts(user_id)
-        assert pts.total_score > 0
-        assert pts.factors.signature_failures == 3
+            # Verify PTS has increased
+            pts = pts_calc.calculate_pts(user_id)
+            assert pts.total_score > 0
+            assert pts.factors.signature_failures == 3
 
-        # Verify strikes
-        assert rules_engine.get_strikes(user_id) == 3
+            # Verify strikes
+            assert rules_engine.get_strikes(user_id) == 3
 
 
 class TestEdgeCases:
@@ -355,27 +356,26 @@ class TestEdgeCases:
         """Test flushing empty batch."""
         from core.asr_engine import ASREngine
 
-        engine = ASREngine(storage_path=tmp_path)
-        batch = engine.flush_batch()
-        assert batch is None
+        with ASREngine(storage_path=tmp_path) as engine:
+            batch = engine.flush_batch()
+            assert batch is None
 
     def test_single_asr_merkle(self, tmp_path):
         """Test Merkle tree with single ASR."""
         from core.asr_engine import ASREngine, ThreatLevel
 
-        engine = ASREngine(storage_path=tmp_path)
-
-        asr = engine.create_asr(
-            agent_id="single_user",
-            action="single_action",
-            threat_level=ThreatLevel.INFO,
-        )
-        engine.add_to_batch(asr)
-        batch = engine.flush_batch()
+        with ASREngine(storage_path=tmp_path) as engine:
+            asr = engine.create_asr(
+                agent_id="single_user",
+                action="single_action",
+                threat_level=ThreatLevel.INFO,
+            )
+            engine.add_to_batch(asr)
+            batch = engine.flush_batch()
 
-        assert batch is not None
-        assert len(batch.records) == 1
-        assert batch.merkle_root == asr.signature
+            assert batch is not None
+            assert len(batch.records) == 1
+            assert batch.merkle_root == asr.signature
 
     def test_rate_limit_boundary(self):
         """Test exact rate limit boundary."""
@@ -413,22 +413,21 @@ class TestEdgeCases:
         """Test creating multiple ASRs rapidly."""
         from core.asr_engine import ASREngine, ThreatLevel
 
-        engine = ASREngine(storage_path=tmp_path)
-
-        # Create many ASRs quickly
-        asrs = []
-        for i in range(100):
-            asr = engine.create_asr(
-                agent_id=f"concurrent_user_{i % 10}",
-                action=f"action_{i}",
-                threat_level=ThreatLevel.INFO,
-            )
-            asrs.append(asr)
-
-        # Verify all have unique IDs
-        asr_ids = [a.asr_id for a in asrs]
-        assert len(set(asr_ids)) == 100
-
-        # Verify all signatures are valid
-        for asr in asrs:
-            assert asr.verify_signature()
+        with ASREngine(storage_path=tmp_path) as engine:
+            # Create many ASRs quickly
+            asrs = []
+            for i in range(100):
+                asr = engine.create_asr(
+                    agent_id=f"concurrent_user_{i % 10}",
+                    action=f"action_{i}",
+                    threat_level=ThreatLevel.INFO,
+                )
+                asrs.append(asr)
+
+            # Verify all have unique IDs
+            asr_ids = [a.asr_id for a in asrs]
+            assert len(set(asr_ids)) == 100
+
+            # Verify all signatures are valid
+            for asr in asrs:
+                assert asr.verify_signature()
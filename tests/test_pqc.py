@@ -9,13 +9,7 @@ Tests cover:
 """
 
 import os
-import sys
 import pytest
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).parent.parent / "config"))
 
 
 class TestPQCEngineSimulated:
@@ -34,6 +28,35 @@ class TestPQCEngineSimulated:
         assert keypair.algorithm == "SIMULATED-KEM-768"
         assert keypair.key_id is not None
 
+    def test_keypair_identifiers(self):
+        """Test key_id is random per key pair and public_key_hash is SHA-256 based."""
+        import hashlib
+        from core.pqc import MLKEMKeyPair
+
+        public_key = os.urandom(1184)
+        kp1 = MLKEMKeyPair(public_key=public_key, secret_key=b"sk1", algorithm="TEST")
+        kp2 = MLKEMKeyPair(public_key=public_key, secret_key=b"sk2", algorithm="TEST")
+
+        assert kp1.key_id != kp2.key_id
+        assert len(kp1.key_id) == 32
+        assert kp1.public_key_hash == kp2.public_key_hash
+        assert kp1.public_key_hash == hashlib.sha256(public_key).hexdigest()[:16]
+
+        explicit = MLKEMKeyPair(public_key, b"sk", "TEST", key_id="custom")
+        assert explicit.key_id == "custom"
+
+    def test_keypair_constant_time_matches(self):
+        """Test constant-time identifier comparison helpers."""
+        from core.pqc import MLKEMKeyPair
+
+        kp = MLKEMKeyPair(public_key=os.urandom(1184), secret_key=b"sk", algorithm="TEST")
+
+        assert kp.matches(kp.key_id)
+        assert not kp.matches("0" * 32)
+        assert not kp.matches("\u00e9")
+        assert kp.matches_public_key_hash(kp.public_key_hash)
+        assert not kp.matches_public_key_hash(kp.key_id)
+
     def test_simulated_keypair_1024(self):
         """Test key pair generation with ML-KEM-1024."""
         from core.pqc import PQCEngineSimulated
@@ -70,6 +93,64 @@ class TestPQCEngineSimulated:
 
         assert len(decap_secret) == 32
 
+    def test_decap_kem_freed_after_use(self, monkeypatch):
+        """Test the secret-key-bound KEM is freed after each decapsulation."""
+        from core import pqc
+
+        class FakeKEM:
+            def __init__(self, name, secret_key=None):
+                self.secret_key = secret_key
+                self.freed = False
+                created.append(self)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                self.free()
+
+            def decap_secret(self, ciphertext):
+                return self.secret_key + ciphertext
+
+            def free(self):
+                self.freed = True
+
+        created = []
+        monkeypatch.setattr(pqc, "LIBOQS_AVAILABLE", True)
+        monkeypatch.setattr(pqc, "FAST_DECAPS_AVAILABLE", False)
+        monkeypatch.setattr(pqc, "oqs", type("FakeOQS", (), {"KeyEncapsulation": FakeKEM}))
+
+        with pqc.PQCEngine() as engine:
+            assert engine.decapsulate(b"ct", b"sk1") == b"sk1ct"
+            engine.decapsulate(b"ct", b"sk1")
+
+            assert len(created) == 2
+            assert all(kem.freed for kem in created)
+
+
+class TestFastDecapsulator:
+    """Tests for the cffi liboqs decapsulation path."""
+
+    def test_matches_liboqs_decapsulation(self):
+        """Test the fast path derives the same secret as liboqs-python."""
+        from core._pqc_fast import FAST_DECAPS_AVAILABLE, FastDecapsulator
+
+        if not FAST_DECAPS_AVAILABLE:
+            pytest.skip("cffi liboqs binding not available")
+        import oqs
+
+        with oqs.KeyEncapsulation("Kyber768") as kem:
+            public_key = kem.generate_keypair()
+            secret_key = kem.export_secret_key()
+            ciphertext, shared_secret = kem.encap_secret(public_key)
+            expected = kem.decap_secret(ciphertext)
+
+        fast = FastDecapsulator("Kyber768")
+        assert fast.decapsulate(ciphertext, secret_key) == expected == shared_secret
+
+        with pytest.raises(ValueError):
+            fast.decapsulate(ciphertext[:-1], secret_key)
+
 
 class TestHybridCiphertext:
     """Tests for hybrid ciphertext serialization."""
@@ -147,6 +228,41 @@ class TestLegacyCrypto:
         assert salt1 != salt2
         assert key1 != key2
 
+    def test_key_derivation_cache(self, monkeypatch):
+        """Test cached keys skip PBKDF2 and the oldest entry is evicted."""
+        from core import legacy
+        from core.legacy import LegacyCrypto
+
+        derivations = []
+        real_kdf = legacy.PBKDF2HMAC
+
+        def counting_kdf(**kwargs):
+            derivations.append(kwargs["salt"])
+            return real_kdf(**kwargs)
+
+        monkeypatch.setattr(legacy, "PBKDF2HMAC", counting_kdf)
+        crypto = LegacyCrypto(kdf_cache_size=1)
+
+        key1, salt1 = crypto.derive_key(b"password", iterations=1_000)
+        assert crypto.derive_key(b"password", salt1, iterations=1_000) == (key1, salt1)
+        assert len(derivations) == 1
+
+        crypto.derive_key(b"password", iterations=1_000)  # Evicts salt1
+        assert crypto.derive_key(b"password", salt1, iterations=1_000) == (key1, salt1)
+        assert len(derivations) == 3
+
+        # Hits refresh an entry, so a hot key outlives colder ones
+        crypto = LegacyCrypto(kdf_cache_size=2)
+        derivations.clear()
+        _, hot = crypto.derive_key(b"password", iterations=1_000)
+        _, cold = crypto.derive_key(b"password", iterations=1_000)
+        crypto.derive_key(b"password", hot, iterations=1_000)
+        crypto.derive_key(b"password", iterations=1_000)  # Evicts cold
+        crypto.derive_key(b"password", hot, iterations=1_000)
+        assert len(derivations) == 3
+        crypto.derive_key(b"password", cold, iterations=1_000)
+        assert len(derivations) == 4
+
     def test_aes_encrypt_decrypt(self):
         """Test AES encryption and decryption roundtrip."""
         from core.legacy import LegacyCrypto
@@ -184,6 +300,18 @@ class TestLegacyCrypto:
         assert crypto.decrypt(ct1, key) == msg1
         assert crypto.decrypt(ct2, key) == msg2
 
+    def test_aes_encrypt_many(self):
+        """Test parallel encryption returns ciphertexts in input order."""
+        from core.legacy import LegacyCrypto
+
+        crypto = LegacyCrypto()
+        key, salt = crypto.derive_key(b"password")
+        messages = [f"message {i}".encode() for i in range(5)]
+
+        ciphertexts = crypto.encrypt_many(messages, key, salt)
+
+        assert [crypto.decrypt(ct, key) for ct in ciphertexts] == messages
+
     def test_aes_hmac_verification_failure(self):
         """Test that tampered ciphertext fails HMAC verification."""
         from core.legacy import LegacyCrypto, AESCiphertext
@@ -287,6 +415,26 @@ class TestECDSA:
         )
         assert not is_valid
 
+    def test_ecdsa_verify_batch(self):
+        """Test batch verification preserves per-item results and order."""
+        from core.legacy import ECDSASigner, ECDSASignature
+        import hashlib
+
+        signer = ECDSASigner.generate()
+        hashes = [hashlib.sha256(f"msg_{i}".encode()).digest() for i in range(4)]
+        items = [(h, signer.sign(h), signer.public_key_bytes) for h in hashes]
+
+        # Corrupt the third signature
+        bad = items[2][1]
+        items[2] = (
+            hashes[2],
+            ECDSASignature(r=os.urandom(32), s=bad.s, v=bad.v),
+            signer.public_key_bytes,
+        )
+
+        assert ECDSASigner.verify_batch(items) == [True, True, False, True]
+        assert ECDSASigner.verify_batch([]) == []
+
     def test_ecdsa_from_private_key(self):
         """Test creating signer from private key bytes."""
         from core.legacy import ECDSASigner
@@ -306,139 +454,244 @@ class TestASREngine:
         """Test ASR creation."""
         from core.asr_engine import ASREngine, ThreatLevel, PQCStatus
 
-        engine = ASREngine(storage_path=tmp_path)
+        with ASREngine(storage_path=tmp_path) as engine:
+            asr = engine.create_asr(
+                agent_id="test_user_123",
+                action="test_action",
+                threat_level=ThreatLevel.INFO,
+                pqc_status=PQCStatus.SAFE,
+                metadata={"test_key": "test_value"},
+            )
 
-        asr = engine.create_asr(
-            agent_id="test_user_123",
-            action="test_action",
-            threat_level=ThreatLevel.INFO,
-            pqc_status=PQCStatus.SAFE,
-            metadata={"test_key": "test_value"},
-        )
+            assert asr.asr_id.startswith("asr_")
+            assert asr.agent_id == "test_user_123"
+            assert asr.action == "test_action"
+            assert asr.threat_level == 1
+            assert asr.pqc_status == "safe"
+            assert asr.metadata["test_key"] == "test_value"
+            assert asr.signature != ""
+
+    def test_asr_engine_closes_database_on_exit(self, tmp_path):
+        """Test the context manager closes the SQLite connection."""
+        import sqlite3
+        from core.asr_engine import ASREngine, ThreatLevel
 
-        assert asr.asr_id.startswith("asr_")
-        assert asr.agent_id == "test_user_123"
-        assert asr.action == "test_action"
-        assert asr.threat_level == 1
-        assert asr.pqc_status == "safe"
-        assert asr.metadata["test_key"] == "test_value"
-        assert asr.signature != ""
+        with ASREngine(storage_path=tmp_path) as engine:
+            asr = engine.create_asr(
+                agent_id="closing_user",
+                action="close",
+                threat_level=ThreatLevel.INFO,
+            )
+            engine.store_asr(asr)
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            engine.load_asr(asr.asr_id)
+
+        with ASREngine(storage_path=tmp_path) as reopened:
+            assert reopened.load_asr(asr.asr_id) is not None
 
     def test_asr_signature_verification(self, tmp_path):
         """Test ASR signature verification."""
         from core.asr_engine import ASREngine, ThreatLevel
 
-        engine = ASREngine(storage_path=tmp_path)
-
-        asr = engine.create_asr(
-            agent_id="user",
-            action="action",
-            threat_level=ThreatLevel.WARNING,
-        )
+        with ASREngine(storage_path=tmp_path) as engine:
+            asr = engine.create_asr(
+                agent_id="user",
+                action="action",
+                threat_level=ThreatLevel.WARNING,
+            )
 
-        assert asr.verify_signature()
+            assert asr.verify_signature()
 
-        # Tamper with ASR
-        asr.action = "tampered_action"
-        assert not asr.verify_signature()
+            # Tamper with ASR
+            asr.action = "tampered_action"
+            assert not asr.verify_signature()
 
     def test_asr_storage_and_retrieval(self, tmp_path):
         """Test ASR storage and retrieval."""
         from core.asr_engine import ASREngine, ThreatLevel
 
-        engine = ASREngine(storage_path=tmp_path)
-
-        asr = engine.create_asr(
-            agent_id="storage_test_user",
-            action="storage_test",
-            threat_level=ThreatLevel.CAUTION,
-        )
+        with ASREngine(storage_path=tmp_path) as engine:
+            asr = engine.create_asr(
+                agent_id="storage_test_user",
+                action="storage_test",
+                threat_level=ThreatLevel.CAUTION,
+            )
 
-        # Store ASR
-        file_path = engine.store_asr(asr)
-        assert file_path.exists()
+            # Store ASR
+            asr_id = engine.store_asr(asr)
+            assert asr_id == asr.asr_id
 
-        # Retrieve ASR
-        retrieved = engine.load_asr(asr.asr_id)
-        assert retrieved is not None
-        assert retrieved.asr_id == asr.asr_id
-        assert retrieved.agent_id == asr.agent_id
-        assert retrieved.action == asr.action
+            # Retrieve ASR
+            retrieved = engine.load_asr(asr_id)
+            assert retrieved is not None
+            assert retrieved.asr_id == asr.asr_id
+            assert retrieved.agent_id == asr.agent_id
+            assert retrieved.action == asr.action
 
     def test_asr_list_by_agent(self, tmp_path):
         """Test listing ASRs by agent."""
         from core.asr_engine import ASREngine, ThreatLevel
 
-        engine = ASREngine(storage_path=tmp_path)
-
-        # Create multiple ASRs for same agent
-        for i in range(3):
-            asr = engine.create_asr(
-                agent_id="list_test_agent",
-                action=f"action_{i}",
+        with ASREngine(storage_path=tmp_path) as engine:
+            # Create multiple ASRs for same agent
+            for i in range(3):
+                asr = engine.create_asr(
+                    agent_id="list_test_agent",
+                    action=f"action_{i}",
+                    threat_level=ThreatLevel.INFO,
+                )
+                engine.store_asr(asr)
+
+            # Create ASR for different agent
+            other_asr = engine.create_asr(
+                agent_id="other_agent",
+                action="other_action",
                 threat_level=ThreatLevel.INFO,
             )
-            engine.store_asr(asr)
+            engine.store_asr(other_asr)
 
-        # Create ASR for different agent
-        other_asr = engine.create_asr(
-            agent_id="other_agent",
-            action="other_action",
-            threat_level=ThreatLevel.INFO,
-        )
-        engine.store_asr(other_asr)
+            # List ASRs
+            records = engine.list_asr_by_agent("list_test_agent")
+            assert len(records) == 3
+
+    def test_asr_store_many_in_one_call(self, tmp_path):
+        """Test bulk storage and that a bad signature stores nothing."""
+        from core.asr_engine import ASREngine, ThreatLevel
+
+        with ASREngine(storage_path=tmp_path) as engine:
+            asrs = [
+                engine.create_asr(
+                    agent_id="bulk_agent",
+                    action=f"action_{i}",
+                    threat_level=ThreatLevel.INFO,
+                )
+                for i in range(4)
+            ]
+
+            assert engine.store_asrs(asrs[:3]) == 3
+
+            asrs[3].signature = "0" * 64
+            with pytest.raises(ValueError):
+                engine.store_asrs([asrs[3]])
+
+            records = engine.list_asr_by_agent("bulk_agent")
+            assert [r.asr_id for r in records] == [a.asr_id for a in asrs[:3]]
+
+    def test_asr_imports_legacy_json_files(self, tmp_path):
+        """Test records stored as per-date JSON files are imported once."""
+        from core.asr_engine import ASREngine, ThreatLevel
 
-        # List ASRs
-        records = engine.list_asr_by_agent("list_test_agent")
-        assert len(records) == 3
+        with ASREngine(storage_path=tmp_path / "scratch") as scratch:
+            asr = scratch.create_asr(
+                agent_id="legacy_agent",
+                action="legacy",
+                threat_level=ThreatLevel.INFO,
+            )
+        date_dir = tmp_path / "asr" / asr.timestamp[:10]
+        date_dir.mkdir(parents=True)
+        (date_dir / f"{asr.asr_id}.json").write_text(asr.to_json())
+        (date_dir / "not_an_asr.json").write_text('{"foo": 1}')
+
+        with ASREngine(storage_path=tmp_path / "asr") as engine:
+            loaded = engine.load_asr(asr.asr_id, date=asr.timestamp[:10])
+            assert loaded is not None
+            assert loaded.signature == asr.signature
+            assert len(engine.list_asr_by_agent("legacy_agent")) == 1
 
     def test_asr_serialization(self, tmp_path):
         """Test ASR JSON serialization."""
         from core.asr_engine import ASREngine, AgentStateRecord, ThreatLevel
 
-        engine = ASREngine(storage_path=tmp_path)
-
-        asr = engine.create_asr(
-            agent_id="serial_test",
-            action="test",
-            threat_level=ThreatLevel.ALERT,
-            metadata={"key": "value"},
-        )
+        with ASREngine(storage_path=tmp_path) as engine:
+            asr = engine.create_asr(
+                agent_id="serial_test",
+                action="test",
+                threat_level=ThreatLevel.ALERT,
+                metadata={"key": "value"},
+            )
 
-        json_str = asr.to_json()
-        restored = AgentStateRecord.from_json(json_str)
+            json_str = asr.to_json()
+            restored = AgentStateRecord.from_json(json_str)
 
-        assert restored.asr_id == asr.asr_id
-        assert restored.agent_id == asr.agent_id
-        assert restored.threat_level == asr.threat_level
-        assert restored.metadata == asr.metadata
+            assert restored.asr_id == asr.asr_id
+            assert restored.agent_id == asr.agent_id
+            assert restored.threat_level == asr.threat_level
+            assert restored.metadata == asr.metadata
 
     def test_asr_batch_and_merkle_root(self, tmp_path):
         """Test ASR batching and Merkle root calculation."""
         from core.asr_engine import ASREngine, ThreatLevel
 
-        engine = ASREngine(storage_path=tmp_path)
+        with ASREngine(storage_path=tmp_path) as engine:
+            # Create and add ASRs to batch
+            asrs = []
+            for i in range(5):
+                asr = engine.create_asr(
+                    agent_id=f"batch_user_{i}",
+                    action=f"batch_action_{i}",
+                    threat_level=ThreatLevel.INFO,
+                )
+                asrs.append(asr)
+                engine.add_to_batch(asr)
+
+            # Flush batch
+            batch = engine.flush_batch()
+            assert batch is not None
+            assert len(batch.records) == 5
+            assert batch.merkle_root != ""
+
+            # Verify Merkle root is consistent
+            merkle_root = engine._compute_merkle_root(asrs)
+            assert merkle_root == batch.merkle_root
+
+            # A malformed signature is rejected, not silently misaligned
+            asrs[1].signature = asrs[1].signature[:-2]
+            asrs[2].signature += "00"
+            with pytest.raises(ValueError):
+                engine._compute_merkle_root(asrs)
+
+    def test_asr_merkle_multi_proof(self, tmp_path):
+        """Test a multi-proof verifies a subset and shares sibling hashes."""
+        from core.asr_engine import ASREngine, ThreatLevel
 
-        # Create and add ASRs to batch
-        asrs = []
-        for i in range(5):
-            asr = engine.create_asr(
-                agent_id=f"batch_user_{i}",
-                action=f"batch_action_{i}",
-                threat_level=ThreatLevel.INFO,
-            )
-            asrs.append(asr)
-            engine.add_to_batch(asr)
-
-        # Flush batch
-        batch = engine.flush_batch()
-        assert batch is not None
-        assert len(batch.records) == 5
-        assert batch.merkle_root != ""
-
-        # Verify Merkle root is consistent
-        merkle_root = engine._compute_merkle_root(asrs)
-        assert merkle_root == batch.merkle_root
+        with ASREngine(storage_path=tmp_path) as engine:
+            engine._max_batch_size = 1000
+            for i in range(7):
+                engine.add_to_batch(engine.create_asr(
+                    agent_id="multi_proof_user",
+                    action=f"action_{i}",
+                    threat_level=ThreatLevel.INFO,
+                ))
+            batch = engine.flush_batch()
+
+            subset = [batch.records[4], batch.records[0], batch.records[1]]
+            signatures = [asr.signature for asr in subset]
+            proof = engine.get_merkle_multi_proof(subset, batch)
+
+            assert proof.leaf_indices == [4, 0, 1]
+            single_proof_hashes = sum(len(engine.get_merkle_proof(a, batch)) for a in subset)
+            assert len(proof.hashes) < single_proof_hashes
+            assert ASREngine.verify_merkle_multi_proof(signatures, proof, batch.merkle_root)
+
+            # Tampered leaf or a missing sibling must not verify
+            tampered = ["0" * 64] + signatures[1:]
+            assert not ASREngine.verify_merkle_multi_proof(tampered, proof, batch.merkle_root)
+            proof.hashes.pop()
+            assert not ASREngine.verify_merkle_multi_proof(signatures, proof, batch.merkle_root)
+
+            # Malformed leaves and siblings are rejected rather than raised
+            proof = engine.get_merkle_multi_proof(subset, batch)
+            malformed = ["zz"] + signatures[1:]
+            assert not ASREngine.verify_merkle_multi_proof(malformed, proof, batch.merkle_root)
+            short_leaf = [signatures[0][:-2]] + signatures[1:]
+            assert not ASREngine.verify_merkle_multi_proof(short_leaf, proof, batch.merkle_root)
+            proof.hashes[0] += "00"
+            assert not ASREngine.verify_merkle_multi_proof(signatures, proof, batch.merkle_root)
+
+            # A repeated asr_id resolves to its first index, as in get_merkle_proof
+            batch.records[5].asr_id = batch.records[2].asr_id
+            assert engine.get_merkle_multi_proof([batch.records[5]], batch).leaf_indices == [2]
 
 
 class TestPQCStatusDetermination: